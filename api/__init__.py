@@ -0,0 +1,5 @@
+# api package init
+from .app import ApiApp
+from .server import HTTPError, HTTPServer, Router
+
+__all__ = ["ApiApp", "HTTPError", "HTTPServer", "Router"]
@@ -0,0 +1,213 @@
+import datetime
+import secrets
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from database.async_db import AsyncDatabase
+from database.db import SORT_EXPRESSIONS, RELEVANCE_SORT, COUNT_DIMENSIONS, TIP_TEXT_LIMITS
+from database.login_guard import LoginThrottled
+
+from .server import HTTPError, Request, Router
+
+# JSON API over Database for scripts and other services (no Tk needed).
+# Routes, with who may call them:
+#   POST   /api/login                   anyone: {"username", "password"} -> bearer token
+#   GET    /api/health                  anyone
+#   GET    /api/tips                    admin/viewer: page of tips (filters, sort, search, cursor)
+#   POST   /api/tips                    any signed-in user: create a tip
+#   GET    /api/tips/counts             admin/viewer: grouped counts
+#   GET    /api/tips/{id}               admin/viewer
+#   PATCH  /api/tips/{id}               admin
+#   DELETE /api/tips/{id}               admin
+# Database calls go through AsyncDatabase, which runs them on a bounded thread
+# pool sized to the connection pool; the event loop only parses and answers.
+
+URGENCIES = ("Low", "Medium", "High")
+EDITABLE_COLUMNS = ("tip_name", "incident_type", "location", "description", "urgency", "status")
+LIST_FILTERS = ("urgency", "status", "incident_type", "location", "created_by")
+READ_ROLES = ("admin", "viewer")
+
+
+class ApiApp:
+    """Request handlers for the tips API, bound to one AsyncDatabase."""
+
+    def __init__(self, db: AsyncDatabase, incident_factory, token_ttl: float = 3600.0):
+        self.db = db
+        self.incident_factory = incident_factory
+        self.token_ttl = token_ttl
+        # token -> (user row, expires_at); touched only on the event loop thread
+        self._sessions: Dict[str, Tuple[Dict[str, Any], float]] = {}
+        self.router = Router()
+        routes = [
+            ("POST", "/api/login", self.login),
+            ("GET", "/api/health", self.health),
+            ("GET", "/api/tips", self.list_tips),
+            ("POST", "/api/tips", self.create_tip),
+            ("GET", "/api/tips/counts", self.count_tips),
+            ("GET", "/api/tips/{tip_id}", self.get_tip),
+            ("PATCH", "/api/tips/{tip_id}", self.update_tip),
+            ("DELETE", "/api/tips/{tip_id}", self.delete_tip),
+        ]
+        for method, pattern, handler in routes:
+            self.router.add(method, pattern, handler)
+
+    # ---------- Auth ----------
+    def _authenticate(self, request: Request, roles: Optional[Tuple[str, ...]] = None) -> Dict[str, Any]:
+        scheme, _, token = request.headers.get("authorization", "").partition(" ")
+        session = self._sessions.get(token) if scheme.lower() == "bearer" else None
+        if session is None or session[1] < time.monotonic():
+            self._sessions.pop(token, None)
+            raise HTTPError(401, "Sign in at /api/login and send 'Authorization: Bearer <token>'.",
+                            {"WWW-Authenticate": "Bearer"})
+        user = session[0]
+        if roles and (user.get("role") or "").lower() not in roles:
+            raise HTTPError(403, "Your role may not do this.")
+        request.user = user
+        return user
+
+    async def login(self, request: Request):
+        body = request.json()
+        username, password = body.get("username"), body.get("password")
+        if not isinstance(username, str) or not isinstance(password, str) or not username or not password:
+            raise HTTPError(400, "username and password are required.")
+        try:
+            user = await self.db.get_user_by_credentials(username, password, source=request.client)
+        except LoginThrottled as e:
+            raise HTTPError(429, str(e), {"Retry-After": str(e.retry_after)}) from None
+        if user is None:
+            raise HTTPError(401, "Invalid username/password.")
+        now = time.monotonic()
+        # Drop expired sessions while we're here; logins are rare next to requests
+        for token in [t for t, (_, expires) in self._sessions.items() if expires < now]:
+            del self._sessions[token]
+        token = secrets.token_urlsafe(32)
+        self._sessions[token] = (user, now + self.token_ttl)
+        return 200, {"token": token, "expires_in": int(self.token_ttl), "user": user}
+
+    async def health(self, request: Request):
+        return 200, {"status": "ok", "backend": self.db.backend.name, "pool": self.db.pool_stats()}
+
+    # ---------- Tips ----------
+    @staticmethod
+    def _tip_id(tip_id: str) -> int:
+        try:
+            return int(tip_id)
+        except ValueError:
+            raise HTTPError(404, f"No tip {tip_id}.") from None
+
+    def _check_fields(self, fields: Dict[str, Any], partial: bool):
+        """The submit screens' checks, for a new tip or (``partial``) an update."""
+        if not isinstance(fields, dict):
+            raise HTTPError(400, "Send the tip fields as a JSON object.")
+        for col, value in fields.items():
+            if value is not None and not isinstance(value, str):
+                raise HTTPError(400, f"{col} must be text.")
+            if value is not None and len(value) > TIP_TEXT_LIMITS.get(col, 255):
+                raise HTTPError(400, f"{col} is longer than {TIP_TEXT_LIMITS.get(col, 255)} characters.")
+        for col in ("tip_name", "incident_type", "location", "description"):
+            if (not partial or col in fields) and not (fields.get(col) or "").strip():
+                raise HTTPError(400, f"{col} is required.")
+        if (not partial or "urgency" in fields) and fields.get("urgency") not in URGENCIES:
+            raise HTTPError(400, f"urgency must be one of {', '.join(URGENCIES)}.")
+
+    async def _check_incident(self, tip: Dict[str, Any]):
+        incident = self.incident_factory.create_incident(
+            tip.get("id"), tip.get("tip_name"), tip.get("incident_type"), tip.get("location"),
+            tip.get("description") or "", tip.get("urgency"), tip.get("created_by"))
+        errors = incident.validation_errors(await self.db.get_incident_rules())
+        if errors:
+            raise HTTPError(400, " ".join(errors))
+
+    async def create_tip(self, request: Request):
+        user = self._authenticate(request)
+        body = request.json()
+        if not isinstance(body, dict):
+            raise HTTPError(400, "Send the tip fields as a JSON object.")
+        fields = {k: body.get(k) for k in EDITABLE_COLUMNS if k != "status"}
+        self._check_fields(fields, partial=False)
+        fields = {k: v.strip() for k, v in fields.items()}
+        await self._check_incident(fields)
+        fields["created_by"] = user["id"]
+        result = await self.db.create_tips([fields], batch_size=1)
+        if result["failed"]:
+            raise HTTPError(400, result["failed"][0]["error"])
+        tip = await self.db.read_tip(result["ids"][0])
+        return 201, tip
+
+    async def get_tip(self, request: Request, tip_id: str):
+        self._authenticate(request, READ_ROLES)
+        tip = await self.db.read_tip(self._tip_id(tip_id))
+        if tip is None:
+            raise HTTPError(404, f"No tip {tip_id}.")
+        return 200, tip
+
+    async def update_tip(self, request: Request, tip_id: str):
+        self._authenticate(request, ("admin",))
+        body = request.json()
+        if not isinstance(body, dict):
+            raise HTTPError(400, "Send the fields to change as a JSON object.")
+        unknown = sorted(set(body) - set(EDITABLE_COLUMNS))
+        if unknown:
+            raise HTTPError(400, f"Cannot change {', '.join(unknown)}.")
+        self._check_fields(body, partial=True)
+        tid = self._tip_id(tip_id)
+        current = await self.db.read_tip(tid)
+        if current is None:
+            raise HTTPError(404, f"No tip {tip_id}.")
+        # The rules may tie fields together (e.g. per incident type), so check the tip as it would be saved
+        await self._check_incident(dict(current, **body))
+        if body and not await self.db.update_tip(tid, body):
+            raise HTTPError(404, f"No tip {tip_id}.")
+        tip = await self.db.read_tip(tid)
+        if tip is None:
+            raise HTTPError(404, f"No tip {tip_id}.")
+        return 200, tip
+
+    async def delete_tip(self, request: Request, tip_id: str):
+        self._authenticate(request, ("admin",))
+        if not await self.db.delete_tip(self._tip_id(tip_id)):
+            raise HTTPError(404, f"No tip {tip_id}.")
+        return 204, None
+
+    async def list_tips(self, request: Request):
+        """?urgency=&status=&incident_type=&location=&created_by=&sort=&order=asc|desc&limit=&cursor=&q="""
+        self._authenticate(request, READ_ROLES)
+        q = request.query
+        filters = {k: q[k] for k in LIST_FILTERS if q.get(k)}
+        search = q.get("q") or None
+        sort = q.get("sort") or (RELEVANCE_SORT if search else "created_at")
+        if sort not in SORT_EXPRESSIONS and not (sort == RELEVANCE_SORT and search):
+            raise HTTPError(400, f"sort must be one of {', '.join(SORT_EXPRESSIONS)}"
+                                 f"{' or ' + RELEVANCE_SORT if search else ''}.")
+        order = (q.get("order") or "desc").lower()
+        if order not in ("asc", "desc"):
+            raise HTTPError(400, "order must be asc or desc.")
+        try:
+            limit = min(max(int(q.get("limit") or 50), 1), 500)
+        except ValueError:
+            raise HTTPError(400, "limit must be a number.") from None
+        try:
+            page = await self.db.read_tips_page(filters, sort=sort, descending=order == "desc",
+                                                limit=limit, cursor=q.get("cursor") or None, search=search)
+        except ValueError as e:
+            raise HTTPError(400, str(e)) from None
+        return 200, page
+
+    async def count_tips(self, request: Request):
+        """?group_by=urgency,status&since=ISO&until=ISO plus the list filters."""
+        self._authenticate(request, READ_ROLES)
+        q = request.query
+        group_by = tuple(d for d in (q.get("group_by") or "urgency").split(",") if d)
+        unknown = [d for d in group_by if d not in COUNT_DIMENSIONS]
+        if unknown:
+            raise HTTPError(400, f"group_by must use {', '.join(COUNT_DIMENSIONS)}.")
+        bounds = {}
+        for name in ("since", "until"):
+            if q.get(name):
+                try:
+                    bounds[name] = datetime.datetime.fromisoformat(q[name])
+                except ValueError:
+                    raise HTTPError(400, f"{name} must be an ISO date/time.") from None
+        filters = {k: q[k] for k in LIST_FILTERS if q.get(k)}
+        counts = await self.db.count_tips(group_by, filters=filters, **bounds)
+        return 200, {"counts": counts}
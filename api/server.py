@@ -0,0 +1,207 @@
+import asyncio
+import datetime
+import json
+import re
+from collections.abc import Mapping
+from http import HTTPStatus
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Pattern, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+# Minimal HTTP/1.1 server on asyncio streams: one coroutine per connection,
+# keep-alive, Content-Length bodies (no chunked uploads), JSON in and out.
+# Enough for the API in api.app without a web framework dependency.
+
+MAX_BODY_BYTES = 1024 * 1024
+MAX_HEADER_LINES = 100
+
+
+class HTTPError(Exception):
+    """Raised by handlers (or the parser) to answer with ``status`` and a JSON error body."""
+
+    def __init__(self, status: int, message: str, headers: Optional[Dict[str, str]] = None):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.headers = headers or {}
+
+
+class Request:
+    __slots__ = ("method", "path", "query", "headers", "body", "client", "user")
+
+    def __init__(self, method: str, target: str, headers: Dict[str, str], body: bytes, client: Optional[str]):
+        parts = urlsplit(target)
+        self.method = method
+        self.path = unquote(parts.path)
+        # Repeated parameters keep the last value
+        self.query = {k: v[-1] for k, v in parse_qs(parts.query, keep_blank_values=True).items()}
+        self.headers = headers
+        self.body = body
+        self.client = client
+        self.user: Optional[Dict[str, Any]] = None
+
+    def json(self) -> Any:
+        if not self.body:
+            raise HTTPError(400, "Request body must be JSON.")
+        try:
+            return json.loads(self.body)
+        except ValueError as e:
+            raise HTTPError(400, f"Invalid JSON: {e}") from None
+
+
+def _json_default(value):
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    if isinstance(value, bytes):
+        return value.decode("utf-8", "replace")
+    if isinstance(value, Mapping):  # TipRecord rows
+        return dict(value)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def encode_json(payload: Any) -> bytes:
+    return json.dumps(payload, default=_json_default, separators=(",", ":")).encode("utf-8")
+
+
+Handler = Callable[..., Awaitable[Tuple[int, Any]]]
+
+
+class Router:
+    """Method + path-pattern dispatch; ``{name}`` segments become keyword arguments."""
+
+    def __init__(self):
+        self._routes: List[Tuple[str, Pattern, Handler]] = []
+
+    def add(self, method: str, pattern: str, handler: Handler):
+        regex = re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", pattern)
+        self._routes.append((method, re.compile(f"^{regex}$"), handler))
+
+    def resolve(self, method: str, path: str) -> Tuple[Handler, Dict[str, str]]:
+        allowed = []
+        for route_method, regex, handler in self._routes:
+            match = regex.match(path)
+            if match:
+                if route_method == method:
+                    return handler, match.groupdict()
+                allowed.append(route_method)
+        if allowed:
+            raise HTTPError(405, f"{method} not allowed here.", {"Allow": ", ".join(allowed)})
+        raise HTTPError(404, f"No route for {path}.")
+
+
+class HTTPServer:
+    """Serve a Router over asyncio; handlers return (status, JSON-able payload)."""
+
+    def __init__(self, router: Router, host: str = "127.0.0.1", port: int = 8080,
+                 keep_alive_timeout: float = 15.0, log: bool = False):
+        self.router = router
+        self.host = host
+        self.port = port
+        self.keep_alive_timeout = keep_alive_timeout
+        self.log = log
+        self._server: Optional[asyncio.base_events.Server] = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._serve_connection, self.host, self.port,
+                                                  limit=64 * 1024)
+        sock = self._server.sockets[0].getsockname()
+        self.port = sock[1]
+        print(f"[API] Listening on http://{self.host}:{self.port}")
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    # ---------- Connection loop ----------
+    async def _serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        peer = writer.get_extra_info("peername")
+        client = peer[0] if isinstance(peer, tuple) else None
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(self._read_request(reader, client), self.keep_alive_timeout)
+                except HTTPError as e:
+                    await self._write(writer, e.status, {"error": e.message}, e.headers, keep_alive=False)
+                    return
+                if request is None:
+                    return
+                keep_alive = request.headers.get("connection", "").lower() != "close"
+                status, payload, headers = await self._dispatch(request)
+                await self._write(writer, status, payload, headers, keep_alive)
+                if not keep_alive:
+                    return
+        except (asyncio.TimeoutError, ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+    async def _read_request(self, reader: asyncio.StreamReader, client: Optional[str]) -> Optional[Request]:
+        line = await reader.readline()
+        if not line:
+            return None
+        try:
+            method, target, version = line.decode("latin-1").split()
+        except ValueError:
+            raise HTTPError(400, "Malformed request line.") from None
+        if not version.startswith("HTTP/1."):
+            raise HTTPError(505, "Only HTTP/1.x is supported.")
+        headers: Dict[str, str] = {}
+        for _ in range(MAX_HEADER_LINES):
+            raw = await reader.readline()
+            if raw in (b"\r\n", b"\n", b""):
+                break
+            name, sep, value = raw.decode("latin-1").partition(":")
+            if not sep:
+                raise HTTPError(400, "Malformed header line.")
+            headers[name.strip().lower()] = value.strip()
+        else:
+            raise HTTPError(431, "Too many header lines.")
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            raise HTTPError(411, "Send a Content-Length body.")
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            raise HTTPError(400, "Bad Content-Length.") from None
+        if length < 0 or length > MAX_BODY_BYTES:
+            raise HTTPError(413, f"Body must be at most {MAX_BODY_BYTES} bytes.")
+        body = await reader.readexactly(length) if length else b""
+        if version == "HTTP/1.0" and headers.get("connection", "").lower() != "keep-alive":
+            headers["connection"] = "close"
+        return Request(method.upper(), target, headers, body, client)
+
+    async def _dispatch(self, request: Request) -> Tuple[int, Any, Dict[str, str]]:
+        try:
+            handler, params = self.router.resolve(request.method, request.path)
+            status, payload = await handler(request, **params)
+            headers = {}
+        except HTTPError as e:
+            status, payload, headers = e.status, {"error": e.message}, e.headers
+        except Exception as e:
+            print(f"[API] {request.method} {request.path} failed: {e!r}")
+            status, payload, headers = 500, {"error": "Internal server error."}, {}
+        if self.log:
+            print(f"[API] {request.client} {request.method} {request.path} -> {status}")
+        return status, payload, headers
+
+    async def _write(self, writer: asyncio.StreamWriter, status: int, payload: Any,
+                     headers: Dict[str, str], keep_alive: bool):
+        body = b"" if payload is None else encode_json(payload)
+        reason = HTTPStatus(status).phrase if status in HTTPStatus._value2member_map_ else ""
+        lines = [f"HTTP/1.1 {status} {reason}",
+                 f"Content-Length: {len(body)}",
+                 "Connection: " + ("keep-alive" if keep_alive else "close")]
+        if body:
+            lines.append("Content-Type: application/json; charset=utf-8")
+        lines.extend(f"{k}: {v}" for k, v in headers.items())
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
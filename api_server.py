@@ -0,0 +1,55 @@
+"""Run the headless HTTP/JSON API over the tips database.
+
+Uses the same config as the desktop app (config.DB, e.g. DB_BACKEND=sqlite),
+with connection pooling switched on and sized to the API's worker count.
+Sign in with POST /api/login and send the returned token as
+"Authorization: Bearer <token>"; see api/app.py for the routes.
+
+    python api_server.py
+    python api_server.py --host 0.0.0.0 --port 9000 --workers 16
+"""
+import argparse
+import asyncio
+import os
+import sys
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from api import ApiApp, HTTPServer
+from config import API as API_CONFIG, DB as DB_CONFIG
+from database.async_db import AsyncDatabase
+from database.db import Database
+from models.incident_factory import IncidentFactory
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default=API_CONFIG["host"])
+    parser.add_argument("--port", type=int, default=API_CONFIG["port"])
+    parser.add_argument("--workers", type=int, default=API_CONFIG["workers"], help="concurrent database calls")
+    parser.add_argument("--log-requests", action="store_true")
+    args = parser.parse_args()
+
+    pool = dict(DB_CONFIG.get("pool") or {}, enabled=True, size=args.workers)
+    db = AsyncDatabase(Database(dict(DB_CONFIG, pool=pool)), max_concurrency=args.workers)
+    app = ApiApp(db, IncidentFactory(), token_ttl=API_CONFIG["token_ttl"])
+    server = HTTPServer(app.router, args.host, args.port, log=args.log_requests)
+    print(f"[API] Database: {db.backend.describe()} ({args.workers} workers)")
+
+    async def serve():
+        try:
+            await server.serve_forever()
+        finally:
+            await db.close()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        print("\n[API] Stopped.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
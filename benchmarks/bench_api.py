@@ -0,0 +1,191 @@
+"""Load test for the HTTP API: latency percentiles and requests/s vs concurrency.
+
+Seeds a throwaway SQLite file with ``--rows`` tips and an admin, starts
+api_server.py on it in a subprocess, then for each concurrency level keeps that
+many keep-alive connections busy for ``--seconds`` with a read-heavy mix
+(list pages, next pages, search, counts, single tips, a few creates).
+
+    python benchmarks/bench_api.py
+    python benchmarks/bench_api.py --rows 50000 --concurrency 1,8,32,128 --workers 16
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from typing import List, Optional, Tuple
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from config import DB as DB_CONFIG
+from database.db import Database
+
+ADMIN = ("bench-admin", "bench-password")
+WORDS = ["burglary", "fraud", "lobby", "garage", "smoke", "badge", "parking", "laptop"]
+
+
+def _seed(path: str, rows: int):
+    cfg = dict(DB_CONFIG, backend="sqlite", pool={"enabled": False}, migrations={"online_in_background": False},
+               sqlite=dict(DB_CONFIG.get("sqlite") or {}, path=path))
+    db = Database(cfg)
+    rng = random.Random(18)
+    db.create_tips(({
+        "tip_name": f"{rng.choice(WORDS)} {rng.choice(WORDS)} {i}",
+        "incident_type": rng.choice(["Theft", "Fraud", "Vandalism", "Harassment", "Other"]),
+        "location": rng.choice(["Lobby", "Annex", "Garage", "Roof", "Cafeteria"]),
+        "description": f"synthetic tip for the API load test about {rng.choice(WORDS)}",
+        "urgency": rng.choice(["Low", "Medium", "High"]),
+        "status": rng.choice(["Pending", "Investigating", "Resolved"]),
+    } for i in range(rows)), batch_size=5000, collect_ids=False)
+    db.seed_admin(*ADMIN)
+    db.refresh_statistics()
+    db.close()
+
+
+class _Connection:
+    """One keep-alive HTTP/1.1 connection (just enough client for the load test)."""
+
+    def __init__(self, host: str, port: int, token: str):
+        self.host, self.port, self.token = host, port, token
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+
+    async def request(self, method: str, path: str, body=None) -> Tuple[int, bytes]:
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        data = json.dumps(body).encode() if body is not None else b""
+        head = (f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\nAuthorization: Bearer {self.token}\r\n"
+                f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n\r\n")
+        self.writer.write(head.encode("latin-1") + data)
+        status_line = await self.reader.readline()
+        length = 0
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.lower() == "content-length":
+                length = int(value)
+        payload = await self.reader.readexactly(length) if length else b""
+        return int(status_line.split()[1]), payload
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+async def _client(host, port, token, deadline, latencies: List[float], errors: List[int], rng: random.Random):
+    conn = _Connection(host, port, token)
+    cursor = None
+    try:
+        while time.perf_counter() < deadline:
+            roll = rng.random()
+            if roll < 0.35:
+                path = f"/api/tips?limit=50&urgency={rng.choice(['Low', 'Medium', 'High'])}"
+            elif roll < 0.5 and cursor:
+                path = f"/api/tips?limit=50&cursor={cursor}"
+            elif roll < 0.7:
+                path = f"/api/tips?limit=20&q={rng.choice(WORDS)[:4]}"
+            elif roll < 0.8:
+                path = "/api/tips/counts?group_by=urgency,status"
+            elif roll < 0.97:
+                path = f"/api/tips/{rng.randint(1, 1000)}"
+            else:
+                path = None
+            start = time.perf_counter()
+            if path is None:
+                status, payload = await conn.request("POST", "/api/tips", {
+                    "tip_name": "load test tip", "incident_type": "Other", "location": "Lab",
+                    "description": "created by the API load test script", "urgency": "Low"})
+            else:
+                status, payload = await conn.request("GET", path)
+            latencies.append(time.perf_counter() - start)
+            if status >= 400 and status != 404:
+                errors.append(status)
+            elif path and path.startswith("/api/tips?limit=50&urgency"):
+                cursor = json.loads(payload).get("next_cursor")
+    finally:
+        await conn.close()
+
+
+async def _run_level(host, port, token, concurrency: int, seconds: float):
+    latencies: List[float] = []
+    errors: List[int] = []
+    deadline = time.perf_counter() + seconds
+    start = time.perf_counter()
+    await asyncio.gather(*(_client(host, port, token, deadline, latencies, errors, random.Random(i))
+                           for i in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return latencies, errors, elapsed
+
+
+def _login(host: str, port: int) -> str:
+    request = urllib.request.Request(f"http://{host}:{port}/api/login", method="POST",
+                                     data=json.dumps({"username": ADMIN[0], "password": ADMIN[1]}).encode(),
+                                     headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(request) as response:
+        return json.loads(response.read())["token"]
+
+
+def _wait_for(host: str, port: int, proc: subprocess.Popen):
+    for _ in range(100):
+        if proc.poll() is not None:
+            raise SystemExit("api_server.py exited early")
+        try:
+            urllib.request.urlopen(f"http://{host}:{port}/api/health").read()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise SystemExit("api_server.py did not start")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--concurrency", default="1,4,16,64")
+    parser.add_argument("--seconds", type=float, default=5.0, help="duration of each concurrency level")
+    parser.add_argument("--workers", type=int, default=8, help="API worker threads / pooled connections")
+    parser.add_argument("--no-cache", action="store_true", help="turn the server's read cache off")
+    parser.add_argument("--port", type=int, default=18080)
+    args = parser.parse_args()
+
+    host = "127.0.0.1"
+    tmpdir = tempfile.mkdtemp(prefix="tattle-bench-")
+    path = os.path.join(tmpdir, "bench.db")
+    proc = None
+    try:
+        _seed(path, args.rows)
+        env = dict(os.environ, DB_BACKEND="sqlite", DB_SQLITE_PATH=path,
+                   DB_CACHE="false" if args.no_cache else "true")
+        proc = subprocess.Popen([sys.executable, os.path.join(REPO_ROOT, "api_server.py"), "--host", host,
+                                 "--port", str(args.port), "--workers", str(args.workers)],
+                                env=env, stdout=subprocess.DEVNULL)
+        _wait_for(host, args.port, proc)
+        token = _login(host, args.port)
+
+        print(f"rows: {args.rows}  server workers: {args.workers}  cache: {'off' if args.no_cache else 'on'}")
+        print(f"{'clients':>8} {'requests':>9} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}")
+        for concurrency in (int(c) for c in args.concurrency.split(",")):
+            latencies, errors, elapsed = asyncio.run(_run_level(host, args.port, token, concurrency, args.seconds))
+            ms = sorted(x * 1000 for x in latencies)
+            p99 = ms[min(len(ms) - 1, int(len(ms) * 0.99))] if ms else 0.0
+            print(f"{concurrency:>8} {len(ms):>9} {len(ms) / elapsed:>9.0f} "
+                  f"{statistics.median(ms) if ms else 0:>8.2f} {p99:>8.2f} {len(errors):>7}")
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait(timeout=10)
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
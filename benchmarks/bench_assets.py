@@ -0,0 +1,103 @@
+"""Time and resident memory to load the UI's images, before and after ui/assets.py.
+
+Each mode runs in a fresh subprocess so the numbers are a cold process's:
+
+  per-frame   what the frames used to do: every frame opens and decodes its own
+              copy (six logos, two 1920x1080 backgrounds, five icons) and keeps
+              it, as CTkImage holds on to the full-resolution image
+  shared      AssetManager with an empty disk cache: each file decoded once,
+              scaled copies kept, full-resolution copies dropped
+  disk-cache  AssetManager again, reading the scaled copies written by the
+              previous run instead of decoding the PNGs
+
+"+RSS" is the process growth (freed pixels may stay with the allocator);
+"held" is the pixel data still referenced afterwards. Only the PIL side is
+measured (no Tk window is opened), so the Tk PhotoImages, which are the same in
+every mode, are left out.
+
+    python benchmarks/bench_assets.py
+    python benchmarks/bench_assets.py --repeat 5
+"""
+import argparse
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+# (asset, size) for every image each frame created before the shared cache
+PER_FRAME = [
+    ("bg_login.png", (1920, 1080)), ("user_icon.png", (25, 25)), ("password_icon.png", (25, 25)),      # login
+    ("bg_login.png", (1920, 1080)), ("user_icon.png", (30, 30)), ("email_icon.png", (30, 30)),
+    ("password_icon.png", (30, 30)),                                                                    # register
+    ("main_logo.png", (60, 60)), ("main_logo.png", (60, 60)), ("main_logo.png", (60, 60)),
+    ("main_logo.png", (60, 60)), ("main_logo.png", (35, 35)), ("main_logo.png", (35, 35)),             # sidebars
+]
+
+
+def _rss_kb() -> int:
+    """Current resident set size (Linux), else the peak from getrusage."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _child(mode: str, cache_dir: str):
+    from PIL import Image
+    from ui.assets import AssetManager, UI_ASSETS  # the app imports customtkinter anyway; not timed
+    before = _rss_kb()
+    start = time.perf_counter()
+    if mode == "per-frame":
+        kept = []
+        for name, _ in PER_FRAME:
+            img = Image.open(os.path.join(REPO_ROOT, "assets", name))
+            img.load()
+            kept.append(img)
+        held = sum(img.width * img.height * len(img.getbands()) for img in kept)
+    else:
+        manager = AssetManager(os.path.join(REPO_ROOT, "assets"), cache_dir=cache_dir)
+        manager.preload(UI_ASSETS)
+        held = manager.stats()["bytes"]
+    elapsed = time.perf_counter() - start
+    print(json.dumps({"ms": elapsed * 1000, "rss_kb": _rss_kb() - before, "held_kb": held // 1024}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=3, help="runs per mode (median reported)")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--cache-dir", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        return _child(args.child, args.cache_dir)
+
+    print(f"{'mode':<12} {'load ms':>9} {'+RSS MB':>9} {'held MB':>9}")
+    for mode in ("per-frame", "shared", "disk-cache"):
+        runs = []
+        for _ in range(args.repeat):
+            cache_dir = tempfile.mkdtemp(prefix="tattle-assets-")
+            try:
+                cmd = [sys.executable, os.path.abspath(__file__), "--cache-dir", cache_dir]
+                if mode == "disk-cache":
+                    subprocess.run(cmd + ["--child", "shared"], check=True, capture_output=True)
+                out = subprocess.run(cmd + ["--child", mode], check=True, capture_output=True, text=True)
+                runs.append(json.loads(out.stdout.strip().splitlines()[-1]))
+            finally:
+                shutil.rmtree(cache_dir, ignore_errors=True)
+        runs.sort(key=lambda r: r["ms"])
+        mid = runs[len(runs) // 2]
+        print(f"{mode:<12} {mid['ms']:>9.1f} {mid['rss_kb'] / 1024:>9.1f} {mid['held_kb'] / 1024:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
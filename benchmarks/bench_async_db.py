@@ -0,0 +1,140 @@
+"""Sync vs async database access: ops/s and latency for the same read mix.
+
+Seeds a throwaway SQLite file (read cache off, pooled connections) and runs
+``--ops`` read_tip/read_tips_page calls three ways: one caller in a loop, the
+same spread over ``--pool-size`` threads, and AsyncDatabase with ``--in-flight``
+coroutines awaiting at once on one event loop. With the cache off every call
+reaches the database, so this compares only the access layers.
+
+    python benchmarks/bench_async_db.py
+    python benchmarks/bench_async_db.py --rows 50000 --ops 5000 --in-flight 10,100,500
+"""
+import argparse
+import asyncio
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from typing import Callable, List
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from config import DB as DB_CONFIG
+from database.async_db import AsyncDatabase
+from database.db import Database
+
+
+def _ops(rows: int, count: int) -> List[tuple]:
+    """The same (method, args, kwargs) sequence for every mode: 70% single tips, 30% pages."""
+    rng = random.Random(19)
+    ops = []
+    for _ in range(count):
+        if rng.random() < 0.7:
+            ops.append(("read_tip", (rng.randint(1, rows),), {}))
+        else:
+            ops.append(("read_tips_page", ({"urgency": rng.choice(["Low", "Medium", "High"])},),
+                        {"limit": 50}))
+    return ops
+
+
+def _report(label: str, latencies: List[float], elapsed: float):
+    ms = sorted(x * 1000 for x in latencies)
+    p99 = ms[min(len(ms) - 1, int(len(ms) * 0.99))]
+    print(f"{label:<22} {len(ms) / elapsed:>9.0f} {statistics.median(ms):>8.2f} {p99:>8.2f}")
+
+
+def _timed(fn: Callable, *args, **kwargs) -> float:
+    start = time.perf_counter()
+    fn(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def _sync_threads(db: Database, ops: List[tuple], threads: int):
+    latencies: List[float] = []
+    work = iter(ops)
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            with lock:
+                op = next(work, None)
+            if op is None:
+                return
+            name, args, kwargs = op
+            latencies.append(_timed(getattr(db, name), *args, **kwargs))
+
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    start = time.perf_counter()
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    return latencies, time.perf_counter() - start
+
+
+async def _async_run(adb: AsyncDatabase, ops: List[tuple], in_flight: int):
+    latencies: List[float] = []
+    work = iter(ops)
+
+    async def task():
+        for name, args, kwargs in work:
+            start = time.perf_counter()
+            await getattr(adb, name)(*args, **kwargs)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(task() for _ in range(in_flight)))
+    return latencies, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--ops", type=int, default=3000, help="calls per mode")
+    parser.add_argument("--pool-size", type=int, default=8, help="pooled connections / worker threads")
+    parser.add_argument("--in-flight", default="8,64,256", help="concurrent coroutines for the async runs")
+    args = parser.parse_args()
+
+    tmpdir = tempfile.mkdtemp(prefix="tattle-bench-")
+    cfg = dict(DB_CONFIG, backend="sqlite", cache={"enabled": False},
+               pool=dict(DB_CONFIG.get("pool") or {}, enabled=True, size=args.pool_size),
+               migrations={"online_in_background": False},
+               sqlite=dict(DB_CONFIG.get("sqlite") or {}, path=os.path.join(tmpdir, "bench.db")))
+    try:
+        db = Database(cfg)
+        rng = random.Random(19)
+        db.create_tips(({
+            "tip_name": f"async bench tip {i}",
+            "incident_type": rng.choice(["Theft", "Fraud", "Vandalism", "Other"]),
+            "location": rng.choice(["Lobby", "Annex", "Garage", "Roof"]),
+            "description": "synthetic row created by bench_async_db.py",
+            "urgency": rng.choice(["Low", "Medium", "High"]),
+        } for i in range(args.rows)), batch_size=5000, collect_ids=False)
+        db.refresh_statistics()
+        ops = _ops(args.rows, args.ops)
+
+        print(f"rows: {args.rows}  ops per mode: {args.ops}  pool: {args.pool_size}  cache: off")
+        print(f"{'mode':<22} {'ops/s':>9} {'p50 ms':>8} {'p99 ms':>8}")
+        latencies = []
+        start = time.perf_counter()
+        for name, op_args, kwargs in ops:
+            latencies.append(_timed(getattr(db, name), *op_args, **kwargs))
+        _report("sync, 1 caller", latencies, time.perf_counter() - start)
+        _report(f"sync, {args.pool_size} threads", *_sync_threads(db, ops, args.pool_size))
+
+        adb = AsyncDatabase(db, max_concurrency=args.pool_size)
+        for in_flight in (int(n) for n in args.in_flight.split(",")):
+            _report(f"async, {in_flight} in flight", *asyncio.run(_async_run(adb, ops, in_flight)))
+        asyncio.run(adb.close())
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Insert throughput: create_tip per row vs create_tips in batches.
+
+Inserts the same synthetic tips one at a time (one INSERT and one commit each)
+and through Database.create_tips with several batch sizes. Runs on a throwaway
+SQLite file by default; ``--backend mysql`` uses config.DB and removes its
+tagged rows afterwards.
+
+    python benchmarks/bench_bulk_insert.py --rows 20000
+    python benchmarks/bench_bulk_insert.py --backend mysql --batch-sizes 100,1000
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from config import DB as DB_CONFIG
+from database.db import Database
+
+BENCH_TAG = "bench-bulk"
+
+
+def _tips(count: int):
+    for i in range(count):
+        yield {
+            "tip_name": f"{BENCH_TAG} {i}",
+            "incident_type": "benchmark",
+            "location": "lab",
+            "description": "synthetic row created by bench_bulk_insert.py",
+            "urgency": ("High", "Medium", "Low")[i % 3],
+        }
+
+
+def _cleanup(db: Database):
+    with db._session() as (conn, cur):
+        cur.execute("DELETE FROM tips WHERE tip_name LIKE %s", (BENCH_TAG + "%",))
+        db._commit(conn)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--single-rows", type=int, default=2000, help="rows for the one-at-a-time baseline")
+    parser.add_argument("--batch-sizes", default="100,1000,5000")
+    parser.add_argument("--backend", default="sqlite", choices=("mysql", "sqlite"))
+    args = parser.parse_args()
+
+    cfg = dict(DB_CONFIG, backend=args.backend, pool={"enabled": False})
+    tmpdir = None
+    if args.backend == "sqlite":
+        tmpdir = tempfile.mkdtemp(prefix="tattle-bench-")
+        cfg["sqlite"] = dict(DB_CONFIG.get("sqlite") or {}, path=os.path.join(tmpdir, "bench.db"))
+
+    db = Database(cfg)
+    print(f"backend: {db.backend.describe()}")
+    print(f"{'method':<24} {'rows':>8} {'rows/s':>10}")
+    try:
+        start = time.perf_counter()
+        for fields in _tips(args.single_rows):
+            db.create_tip(fields)
+        rate = args.single_rows / (time.perf_counter() - start)
+        print(f"{'create_tip (per row)':<24} {args.single_rows:>8} {rate:>10.0f}")
+        _cleanup(db)
+
+        for size in (int(s) for s in args.batch_sizes.split(",")):
+            start = time.perf_counter()
+            result = db.create_tips(_tips(args.rows), batch_size=size, collect_ids=False)
+            rate = result["inserted"] / (time.perf_counter() - start)
+            print(f"{f'create_tips batch={size}':<24} {result['inserted']:>8} {rate:>10.0f}")
+            _cleanup(db)
+    finally:
+        _cleanup(db)
+        db.close()
+        if tmpdir:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
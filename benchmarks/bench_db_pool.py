@@ -0,0 +1,105 @@
+"""Throughput of read_tips/create_tip with 1, 4 and 16 concurrent callers.
+
+Compares the single shared connection against the pooled mode configured in
+config.DB["pool"]. Rows created by the benchmark are tagged and removed at the end.
+``--backend sqlite`` runs the same workload against a throwaway SQLite file.
+
+    python benchmarks/bench_db_pool.py --ops 200 --pool-size 8
+    python benchmarks/bench_db_pool.py --backend sqlite
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from config import DB as DB_CONFIG
+from database.db import Database
+
+BENCH_TAG = "bench-pool"
+
+
+def _run(db: Database, callers: int, ops: int, op: str) -> float:
+    """Run ``ops`` operations per caller on ``callers`` threads; return ops/sec."""
+    barrier = threading.Barrier(callers + 1)
+    errors = []
+
+    def worker():
+        barrier.wait()
+        try:
+            for i in range(ops):
+                if op == "read_tips":
+                    db.read_tips({"urgency": "High"})
+                else:
+                    db.create_tip({
+                        "tip_name": f"{BENCH_TAG} {i}",
+                        "incident_type": "benchmark",
+                        "location": "lab",
+                        "description": "synthetic row created by bench_db_pool.py",
+                        "urgency": "Low",
+                    })
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(callers)]
+    for t in threads:
+        t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    if errors:
+        raise errors[0]
+    return callers * ops / elapsed
+
+
+def _cleanup(db: Database):
+    with db._session() as (conn, cur):
+        cur.execute("DELETE FROM tips WHERE tip_name LIKE %s", (BENCH_TAG + "%",))
+        db._commit(conn)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ops", type=int, default=100, help="operations per caller")
+    parser.add_argument("--pool-size", type=int, default=16)
+    parser.add_argument("--callers", default="1,4,16")
+    parser.add_argument("--backend", default=DB_CONFIG.get("backend", "mysql"), choices=("mysql", "sqlite"))
+    args = parser.parse_args()
+    caller_counts = [int(c) for c in args.callers.split(",")]
+
+    # No read cache: read_tips would measure cache hits, not the connections
+    base = dict(DB_CONFIG, backend=args.backend, cache={"enabled": False})
+    if args.backend == "sqlite":
+        tmpdir = tempfile.mkdtemp(prefix="tattle-bench-")
+        base["sqlite"] = dict(DB_CONFIG.get("sqlite") or {}, path=os.path.join(tmpdir, "bench.db"))
+    modes = {
+        "single": dict(base, pool={"enabled": False}),
+        "pooled": dict(base, pool=dict(DB_CONFIG.get("pool") or {}, enabled=True, size=args.pool_size)),
+    }
+    print(f"backend: {args.backend}")
+    print(f"{'mode':<8} {'op':<11} " + " ".join(f"{c:>4} callers" for c in caller_counts))
+    for mode, cfg in modes.items():
+        db = Database(cfg)
+        try:
+            for op in ("create_tip", "read_tips"):
+                rates = [_run(db, c, args.ops, op) for c in caller_counts]
+                print(f"{mode:<8} {op:<11} " + " ".join(f"{r:>10.0f}/s" for r in rates))
+            if db.pool_stats():
+                print(f"         pool: {db.pool_stats()}")
+        finally:
+            _cleanup(db)
+            db.close()
+    if args.backend == "sqlite":
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Login throughput at several password-hash cost settings.
+
+For each setting, logs one user in through Database.get_user_by_credentials
+on a throwaway SQLite file: first one login at a time (latency), then from
+``--clients`` threads at once (throughput, bounded by the hasher pool's
+``--workers``). Use it to pick the highest cost your hardware can serve at the
+login rate you expect; the legacy unsalted SHA-256 is shown for reference.
+
+    python benchmarks/bench_login.py
+    python benchmarks/bench_login.py --settings scrypt:15,pbkdf2:600000 --workers 4 --clients 16
+"""
+import argparse
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from config import DB as DB_CONFIG
+from database.db import Database
+from database.passwords import PBKDF2, SCRYPT
+
+USERNAME = "bench-login"
+PASSWORD = "correct horse battery staple"
+
+
+def _passwords_config(setting: str, workers: int) -> dict:
+    """"scrypt:15" -> n=2**15; "pbkdf2:600000" -> 600k iterations."""
+    algorithm, cost = setting.split(":")
+    config = dict(DB_CONFIG.get("passwords") or {}, workers=workers)
+    if algorithm == "scrypt":
+        config.update(algorithm=SCRYPT, scrypt_n=2 ** int(cost))
+    elif algorithm == "pbkdf2":
+        config.update(algorithm=PBKDF2, pbkdf2_iterations=int(cost))
+    else:
+        raise SystemExit(f"unknown setting '{setting}'")
+    return config
+
+
+def _store_legacy(db: Database):
+    with db._session() as (conn, cur):
+        cur.execute("UPDATE users SET password_hash=%s WHERE username=%s",
+                    (hashlib.sha256(PASSWORD.encode("utf-8")).hexdigest(), USERNAME))
+        db._commit(conn)
+
+
+def _measure(db: Database, logins: int, clients: int):
+    def login(_):
+        if db.get_user_by_credentials(USERNAME, PASSWORD) is None:
+            raise RuntimeError("login failed")
+
+    start = time.perf_counter()
+    for i in range(max(1, logins // 4)):
+        login(i)
+    latency_ms = (time.perf_counter() - start) * 1000 / max(1, logins // 4)
+
+    with ThreadPoolExecutor(max_workers=clients) as clients_pool:
+        start = time.perf_counter()
+        list(clients_pool.map(login, range(logins)))
+        rate = logins / (time.perf_counter() - start)
+    return latency_ms, rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--settings", default="scrypt:14,scrypt:15,scrypt:16,pbkdf2:210000,pbkdf2:600000")
+    parser.add_argument("--workers", type=int, default=int((DB_CONFIG.get("passwords") or {}).get("workers", 2)))
+    parser.add_argument("--clients", type=int, default=8, help="threads logging in at once")
+    parser.add_argument("--logins", type=int, default=40, help="concurrent logins per setting")
+    args = parser.parse_args()
+
+    tmpdir = tempfile.mkdtemp(prefix="tattle-bench-")
+    base = dict(DB_CONFIG, backend="sqlite", pool={"enabled": True, "size": args.clients},
+                sqlite=dict(DB_CONFIG.get("sqlite") or {}, path=os.path.join(tmpdir, "bench.db")),
+                migrations={"online_in_background": False})
+    try:
+        print(f"hasher workers: {args.workers}  clients: {args.clients}  cpus: {os.cpu_count()}")
+        print(f"{'setting':<22} {'ms/login':>10} {'logins/s':>10}")
+        for setting in ["legacy:0"] + args.settings.split(","):
+            legacy = setting.startswith("legacy")
+            cfg = dict(base, passwords=_passwords_config(args.settings.split(",")[0] if legacy else setting,
+                                                         args.workers))
+            db = Database(cfg)
+            try:
+                db.seed_admin(USERNAME, PASSWORD)
+                if legacy:
+                    # Pretend the row predates salted hashing and stop the upgrade
+                    db.passwords.needs_rehash = lambda encoded: False
+                    _store_legacy(db)
+                latency_ms, rate = _measure(db, args.logins, args.clients)
+            finally:
+                db.close()
+            label = "sha256 (legacy)" if legacy else setting
+            print(f"{label:<22} {latency_ms:>10.1f} {rate:>10.1f}")
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Navigation latency for every screen in TattleApp's frame registry.
+
+Opens the real app window (needs a display) on a throwaway SQLite database
+signed in as an admin. It visits every registered screen, then goes back and
+forth between the dashboard and each screen ``--rounds`` times, and opens the
+edit screen for a different tip each round. This runs twice:
+
+  no cache    FrameCache limited to the shown frame: every visit builds the
+              screen, as EditTipFrame always was
+  cache       the configured FrameCache with prewarming: screens are built
+              once and reused, and the edit screen is rebound with accept_kwargs
+
+For each screen and kind (built / rebound / reused / prewarm) it prints the
+median time in show_frame and until Tk is idle again (i.e. drawn).
+
+    python benchmarks/bench_navigation.py
+    python benchmarks/bench_navigation.py --rounds 20 --rows 5000
+"""
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from config import DB as DB_CONFIG
+from database.db import Database
+from models.incident_factory import IncidentFactory
+from models.user import Admin
+from ui.app import TattleApp
+
+
+def _seed(db: Database, rows: int):
+    rng = random.Random(22)
+    db.create_tips(({
+        "tip_name": f"navigation bench tip {i}",
+        "incident_type": rng.choice(["Theft", "Fraud", "Vandalism", "Other"]),
+        "location": rng.choice(["Lobby", "Annex", "Garage", "Roof"]),
+        "description": "synthetic row created by bench_navigation.py",
+        "urgency": rng.choice(["Low", "Medium", "High"]),
+    } for i in range(rows)), batch_size=5000, collect_ids=False)
+    db.seed_admin("bench-admin", "bench-password")
+
+
+def _settle(app: TattleApp):
+    # Run pending idle work, background-task callbacks and redraws
+    for _ in range(5):
+        app.update()
+
+
+def _run(db: Database, cached: bool, rounds: int) -> TattleApp:
+    app = TattleApp(db=db, incident_factory=IncidentFactory())
+    if not cached:
+        app.frames.max_frames = 0
+        app.prewarm_enabled = False
+    _settle(app)
+    admin = db.get_user_by_credentials("bench-admin", "bench-password")
+    app.current_user = Admin(admin)
+    app.show_frame("DashboardFrame")
+    app.prewarm()
+    _settle(app)
+
+    tips = db.read_tips_page({}, limit=rounds + 1)["rows"]
+    screens = [k for k in app.frame_registry if k not in ("LoginFrame", "DashboardFrame", "EditTipFrame")]
+    for i in range(rounds):
+        for key in screens:
+            app.show_frame(key)
+            _settle(app)
+            app.show_frame("DashboardFrame")
+            _settle(app)
+        app.show_frame("ManageTipsFrame")
+        _settle(app)
+        app.show_frame("EditTipFrame", tip_row=tips[i % len(tips)])
+        _settle(app)
+        app.go_back()
+        _settle(app)
+    app.logout()
+    app.show_frame("RegisterFrame")
+    _settle(app)
+    app.show_frame("LoginFrame")
+    _settle(app)
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    tmpdir = tempfile.mkdtemp(prefix="tattle-bench-")
+    cfg = dict(DB_CONFIG, backend="sqlite", pool={"enabled": False}, migrations={"online_in_background": False},
+               sqlite=dict(DB_CONFIG.get("sqlite") or {}, path=os.path.join(tmpdir, "bench.db")))
+    try:
+        db = Database(cfg)
+        _seed(db, args.rows)
+        for cached in (False, True):
+            print(f"\n== {'cache + prewarm' if cached else 'no cache'} ==")
+            app = _run(db, cached, args.rounds)
+            app.print_nav_report()
+            print(f"[Frames] cache: {app.frames.stats()['frames']} frames, "
+                  f"{app.frames.stats()['widgets']} widgets, {app.frames.evictions} evictions")
+            app.destroy()
+        db.close()
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
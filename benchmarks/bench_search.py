@@ -0,0 +1,120 @@
+"""Search latency as the tips table grows: full-text index vs substring scan.
+
+Fills the table in steps (default 1k, 10k, 100k synthetic tips) and, at each
+size, times Database.search_tips for a few queries with the full-text index and
+with the LIKE fallback it replaces. Runs on a throwaway SQLite file by default;
+``--backend mysql`` uses config.DB and removes its tagged rows afterwards.
+
+    python benchmarks/bench_search.py
+    python benchmarks/bench_search.py --sizes 1000,10000 --backend mysql
+"""
+import argparse
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from config import DB as DB_CONFIG
+from database.db import Database
+
+BENCH_TAG = "bench-search"
+# A few hundred real incident words plus a long tail of rare ones, drawn with a
+# Zipf-like skew so queries match a realistic share of rows, not all of them.
+COMMON = ("burglary lobby window fraud receipt garage parking vandalism graffiti stairwell "
+          "harassment office laptop theft badge camera elevator smoke alarm leak annex roof "
+          "cafeteria wallet phone door broken suspicious package delivery night shift").split()
+QUERIES = ("lobby", "bur gar", "suspicious package", "cafet", "zq")
+
+
+def _vocabulary(rng: random.Random, size: int = 5000):
+    tail = {"".join(rng.choices("abcdefghijklmnoprstuvwy", k=rng.randint(4, 9))) for _ in range(size)}
+    words = COMMON + sorted(tail)
+    weights = [1.0 / (rank + 1) for rank in range(len(words))]
+    return words, weights
+
+
+def _fill(db: Database, count: int, rng: random.Random, vocab):
+    """Insert ``count`` synthetic tips in one transaction per 1000 rows."""
+    words, weights = vocab
+    sql = ("INSERT INTO tips (tip_name, incident_type, location, description, urgency) "
+           "VALUES (%s,%s,%s,%s,%s)")
+    for start in range(0, count, 1000):
+        rows = []
+        for _ in range(min(1000, count - start)):
+            rows.append((
+                f"{BENCH_TAG} " + " ".join(rng.choices(words, weights, k=3)),
+                rng.choice(COMMON),
+                rng.choice(COMMON),
+                " ".join(rng.choices(words, weights, k=20)),
+                rng.choice(("High", "Medium", "Low")),
+            ))
+        with db._session() as (conn, cur):
+            cur.executemany(sql, rows)
+            db._commit(conn)
+
+
+def _time_query(db: Database, query: str, repeat: int) -> float:
+    """Median milliseconds for the first page of ``query``."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        db.search_tips(query, limit=50)
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return statistics.median(samples)
+
+
+def _cleanup(db: Database):
+    with db._session() as (conn, cur):
+        cur.execute("DELETE FROM tips WHERE tip_name LIKE %s", (BENCH_TAG + "%",))
+        db._commit(conn)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1000,10000,100000", help="table sizes to measure at")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--backend", default="sqlite", choices=("mysql", "sqlite"))
+    args = parser.parse_args()
+    sizes = sorted(int(s) for s in args.sizes.split(","))
+
+    # No read cache: repeated queries would be timed as cache hits
+    cfg = dict(DB_CONFIG, backend=args.backend, pool={"enabled": False}, cache={"enabled": False})
+    tmpdir = None
+    if args.backend == "sqlite":
+        tmpdir = tempfile.mkdtemp(prefix="tattle-bench-")
+        cfg["sqlite"] = dict(DB_CONFIG.get("sqlite") or {}, path=os.path.join(tmpdir, "bench.db"))
+
+    db = Database(cfg)
+    rng = random.Random(42)
+    vocab = _vocabulary(rng)
+    print(f"backend: {db.backend.describe()}  full-text index: {'yes' if db.fulltext else 'no'}")
+    print(f"{'rows':>8}  {'query':<20} {'fulltext ms':>12} {'LIKE ms':>10}")
+    try:
+        loaded = 0
+        for size in sizes:
+            _fill(db, size - loaded, rng, vocab)
+            loaded = size
+            for query in QUERIES:
+                fts_ms = _time_query(db, query, args.repeat)
+                has_fulltext, db.fulltext = db.fulltext, False
+                try:
+                    like_ms = _time_query(db, query, args.repeat)
+                finally:
+                    db.fulltext = has_fulltext
+                print(f"{size:>8}  {query:<20} {fts_ms:>12.2f} {like_ms:>10.2f}")
+    finally:
+        _cleanup(db)
+        db.close()
+        if tmpdir:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
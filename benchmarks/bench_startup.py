@@ -0,0 +1,94 @@
+"""Startup cost of Database(): pending migrations vs an up-to-date schema.
+
+On a throwaway SQLite file, times the Database constructor (and the
+statements it issues) when
+  * the file is new and every migration is pending,
+  * the tips table already holds ``--rows`` tips and only the index migration
+    is pending, once applied inline and once left to the background thread,
+  * the schema is current (median of ``--repeat`` runs).
+
+    python benchmarks/bench_startup.py --rows 200000
+"""
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from config import DB as DB_CONFIG
+from database import migrations
+from database.db import Database, TIP_INDEXES
+
+
+def _open(cfg, background=True):
+    start = time.perf_counter()
+    db = Database(dict(cfg, migrations={"online_in_background": background}))
+    return db, (time.perf_counter() - start) * 1000
+
+
+def _report(label: str, ms: float, db: Database):
+    print(f"{label:<40} {ms:>10.1f} {db.stats.snapshot()['queries']:>11}")
+
+
+def _unapply_indexes(db: Database):
+    """Drop the tips indexes and forget the migration that built them."""
+    version = next(m.version for m in migrations.MIGRATIONS if m.apply is migrations._tip_indexes)
+    with db._session() as (conn, cur):
+        for name in TIP_INDEXES:
+            cur.execute(db.backend.drop_index_sql(name, "tips"))
+        cur.execute("DELETE FROM schema_version WHERE version = %s", (version,))
+        db._commit(conn)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    tmpdir = tempfile.mkdtemp(prefix="tattle-bench-")
+    cfg = dict(DB_CONFIG, backend="sqlite", pool={"enabled": False},
+               sqlite=dict(DB_CONFIG.get("sqlite") or {}, path=os.path.join(tmpdir, "bench.db")))
+    try:
+        print(f"{'startup':<40} {'ms':>10} {'statements':>11}")
+        db, ms = _open(cfg, background=False)
+        _report("new file, all migrations pending", ms, db)
+        db.create_tips(({"tip_name": f"bench tip {i}", "incident_type": "benchmark", "location": "lab",
+                         "description": "synthetic row created by bench_startup.py",
+                         "urgency": ("High", "Medium", "Low")[i % 3]} for i in range(args.rows)),
+                       batch_size=5000, collect_ids=False)
+        _unapply_indexes(db)
+        db.close()
+
+        db, ms = _open(cfg, background=False)
+        _report(f"index migration inline ({args.rows} tips)", ms, db)
+        _unapply_indexes(db)
+        db.close()
+
+        start = time.perf_counter()
+        db, ms = _open(cfg, background=True)
+        _report(f"index migration online ({args.rows} tips)", ms, db)
+        db.migration_thread.join()
+        print(f"{'  ... background thread finished after':<40} {(time.perf_counter() - start) * 1000:>10.1f}")
+        db.close()
+
+        timings = []
+        for _ in range(args.repeat):
+            db, ms = _open(cfg)
+            timings.append(ms)
+            if len(timings) < args.repeat:
+                db.close()
+        _report(f"up to date (median of {args.repeat})", statistics.median(timings), db)
+        db.close()
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Memory held by loaded tips: dict rows vs TipRecords.
+
+Seeds a throwaway SQLite file with the largest ``--sizes`` count of synthetic
+tips, then for each size loads the newest N rows two ways, with the same
+query:
+
+  dict rows    the dict cursor every read used before (one dict per row,
+               a fresh string for every urgency/status/type value)
+  records      what read_tips and friends return now: TipRecords built from
+               a tuple cursor, with interned urgency/status/type strings
+
+and prints the Python heap the loaded list holds (tracemalloc, measured in a
+separate pass from the load time), bytes per row, the load time and the time
+of a dashboard-style pass that calls row.get() on every row.
+
+    python benchmarks/bench_tip_memory.py
+    python benchmarks/bench_tip_memory.py --sizes 100000
+"""
+import argparse
+import gc
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from config import DB as DB_CONFIG
+from database.db import Database
+from database.records import read_records
+
+QUERY = "SELECT * FROM tips ORDER BY created_at DESC LIMIT %s"
+
+
+def _seed(db: Database, rows: int):
+    rng = random.Random(23)
+    db.create_tips(({
+        "tip_name": f"memory bench tip {i}",
+        "incident_type": rng.choice(["Theft", "Fraud", "Vandalism", "Harassment", "Other"]),
+        "location": rng.choice(["Lobby", "Annex", "Garage", "Roof", "Car park"]),
+        "description": f"synthetic row {i} created by bench_tip_memory.py",
+        "urgency": rng.choice(["Low", "Medium", "High"]),
+        "status": rng.choice(["Pending", "Investigating", "Resolved"]),
+    } for i in range(rows)), batch_size=5000, collect_ids=False)
+
+
+def _load_dicts(db: Database, count: int):
+    with db._session() as (conn, cur):
+        cur.execute(QUERY, (count,))
+        return cur.fetchall()
+
+
+def _load_records(db: Database, count: int):
+    with db._session() as (conn, _), db._tuple_cursor(conn) as cur:
+        cur.execute(QUERY, (count,))
+        return read_records(cur.description, cur)
+
+
+def _dashboard_pass(rows) -> int:
+    high = 0
+    for row in rows:
+        if row.get("urgency") == "High" and row.get("status") != "Resolved":
+            high += len(row.get("tip_name") or "")
+    return high
+
+
+def _measure(load, db: Database, count: int):
+    gc.collect()
+    start = time.perf_counter()
+    rows = load(db, count)
+    load_s = time.perf_counter() - start
+    start = time.perf_counter()
+    _dashboard_pass(rows)
+    scan_s = time.perf_counter() - start
+    del rows
+    gc.collect()
+
+    tracemalloc.start()
+    rows = load(db, count)
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    loaded = len(rows)
+    del rows
+    gc.collect()
+    return loaded, held, load_s, scan_s
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="100000,1000000", help="comma-separated row counts")
+    args = parser.parse_args()
+    sizes = [int(s) for s in args.sizes.split(",")]
+
+    tmpdir = tempfile.mkdtemp(prefix="tattle-bench-")
+    cfg = dict(DB_CONFIG, backend="sqlite", pool={"enabled": False}, cache={"enabled": False},
+               migrations={"online_in_background": False},
+               sqlite=dict(DB_CONFIG.get("sqlite") or {}, path=os.path.join(tmpdir, "bench.db")))
+    try:
+        db = Database(cfg)
+        start = time.perf_counter()
+        _seed(db, max(sizes))
+        print(f"seeded {max(sizes)} tips in {time.perf_counter() - start:.1f}s ({db.backend.describe()})")
+        print(f"{'rows':>8} {'mode':<10} {'held MB':>9} {'B/row':>7} {'load s':>8} {'get() pass s':>13}")
+        for count in sizes:
+            for mode, load in (("dict rows", _load_dicts), ("records", _load_records)):
+                loaded, held, load_s, scan_s = _measure(load, db, count)
+                print(f"{loaded:>8} {mode:<10} {held / 1e6:>9.1f} {held / max(loaded, 1):>7.0f} "
+                      f"{load_s:>8.2f} {scan_s:>13.3f}")
+        db.close()
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
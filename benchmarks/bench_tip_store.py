@@ -0,0 +1,108 @@
+"""Client-side sort, filter and group-by: a list of rows vs a TipStore.
+
+Builds ``--rows`` synthetic TipRecords in memory (no database needed) and
+times, for each sortable ManageTipsFrame column:
+
+  list        sorted(rows, key=row_sort_key), what re-sorting loaded rows
+              costs without the store (every click sorts again)
+  store 1st   TipStore.order(): the first sort of a column
+  store again the same column again, in the other direction (served from
+              the cached permutation)
+
+then a filter (urgency High and status not Resolved), per-urgency counts,
+counts by (urgency, status), a filtered newest-first order, and folding a
+change-feed delta into a store whose orders are cached.
+
+    python benchmarks/bench_tip_store.py
+    python benchmarks/bench_tip_store.py --rows 100000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from database.db import row_sort_key
+from database.records import TipRecord
+from models.tip_store import TipStore
+
+COLUMNS = ("tip_name", "incident_type", "location", "urgency", "status", "created_at")
+
+
+def _rows(count: int):
+    rng = random.Random(24)
+    start = datetime(2024, 1, 1)
+    return [TipRecord(
+        id=i + 1,
+        tip_name=f"store bench tip {rng.randrange(count)}",
+        incident_type=rng.choice(["Theft", "Fraud", "Vandalism", "Harassment", "Other"]),
+        location=rng.choice(["Lobby", "Annex", "Garage", "Roof", "Car park"]),
+        description="synthetic row created by bench_tip_store.py",
+        urgency=rng.choice(["Low", "Medium", "High"]),
+        created_by=None,
+        created_at=start + timedelta(seconds=rng.randrange(10 ** 8)),
+        status=rng.choice(["Pending", "Investigating", "Resolved"]),
+        row_version=1,
+    ) for i in range(count)]
+
+
+def _ms(fn):
+    start = time.perf_counter()
+    result = fn()
+    return (time.perf_counter() - start) * 1000.0, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--changes", type=int, default=50, help="rows changed in the change-feed delta")
+    args = parser.parse_args()
+
+    rows = _rows(args.rows)
+    build_ms, store = _ms(lambda: TipStore(rows))
+    print(f"{len(rows)} rows; TipStore built in {build_ms:.0f} ms")
+
+    print(f"\n{'column':<14} {'list ms':>9} {'store 1st ms':>13} {'store again ms':>15}")
+    for column in COLUMNS:
+        list_ms, _ = _ms(lambda: sorted(rows, key=lambda r: row_sort_key(column, r)))
+        first_ms, _ = _ms(lambda: store.order(column))
+        again_ms, _ = _ms(lambda: store.order(column, descending=True))
+        print(f"{column:<14} {list_ms:>9.0f} {first_ms:>13.0f} {again_ms:>15.1f}")
+
+    print(f"\n{'operation':<34} {'list ms':>9} {'store ms':>9}")
+    list_ms, expected = _ms(lambda: [r for r in rows if r.urgency == "High" and r.status != "Resolved"])
+    store_ms, mask = _ms(lambda: store.where(urgency="High", status=lambda s: s != "Resolved"))
+    assert sum(mask) == len(expected)
+    print(f"{'filter (High, not Resolved)':<34} {list_ms:>9.0f} {store_ms:>9.1f}")
+
+    list_ms, _ = _ms(lambda: sorted(expected, key=lambda r: row_sort_key("created_at", r), reverse=True))
+    store_ms, _ = _ms(lambda: store.order("created_at", True, mask=mask))
+    print(f"{'  ... newest first':<34} {list_ms:>9.0f} {store_ms:>9.1f}")
+
+    list_ms, expected = _ms(lambda: Counter(r.urgency for r in rows))
+    store_ms, counts = _ms(lambda: store.counts("urgency"))
+    assert counts == dict(expected)
+    print(f"{'counts by urgency':<34} {list_ms:>9.0f} {store_ms:>9.1f}")
+
+    list_ms, expected = _ms(lambda: Counter((r.urgency, r.status) for r in rows))
+    store_ms, counts = _ms(lambda: store.counts(("urgency", "status")))
+    assert counts == dict(expected)
+    print(f"{'counts by (urgency, status)':<34} {list_ms:>9.0f} {store_ms:>9.1f}")
+
+    rng = random.Random(25)
+    changed = [rows[rng.randrange(len(rows))].replace(urgency="High", status="Investigating", row_version=2)
+               for _ in range(args.changes)]
+    deleted = [rng.randrange(1, len(rows) + 1) for _ in range(3)]
+    store_ms, _ = _ms(lambda: store.apply_changes(changed, deleted))
+    print(f"{f'apply {len(changed)} changes, {len(deleted)} deletes':<34} {'':>9} {store_ms:>9.1f}"
+          f"   ({len(store.stats()['orders'])} cached orders kept)")
+
+
+if __name__ == "__main__":
+    main()
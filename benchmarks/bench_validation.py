@@ -0,0 +1,119 @@
+"""Validation throughput: per-incident checks vs batch validation with compiled rules.
+
+Creates a throwaway SQLite database (so the rules come from the
+incident_rules table, as they do in the app), adds a few per-incident-type
+rules to the seeded defaults, then validates ``--rows`` synthetic incidents
+(about one in ten invalid) four ways:
+
+  old dict       GenericIncident.validate against the old hardcoded
+                 {"min_description_length": 20} (checks the description only)
+  per incident   IncidentFactory.create_incident + GenericIncident.validate,
+                 one incident at a time (what the API does per request)
+  errors(row)    IncidentRules.errors on each row dict
+  batch          IncidentRules.validate_batch over chunks of ``--batch`` rows,
+                 as import_tips does
+
+and prints rows/s for each, plus the cost of get_incident_rules() when it
+compiles the rules and when it returns the cached ones.
+
+    python benchmarks/bench_validation.py
+    python benchmarks/bench_validation.py --rows 100000 --batch 5000
+"""
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from config import DB as DB_CONFIG
+from database.db import Database
+from models.incident_factory import IncidentFactory
+
+TYPES = ["Theft", "Fraud", "Vandalism", "Harassment", "Other"]
+
+
+def _rows(count: int):
+    rng = random.Random(25)
+    rows = []
+    for i in range(count):
+        bad = rng.random() < 0.1
+        rows.append({
+            "tip_name": "" if bad and i % 3 == 0 else f"validation bench tip {i}",
+            "incident_type": rng.choice(TYPES),
+            "location": rng.choice(["Lobby", "Annex", "Garage", "Roof", "Car park"]),
+            "description": "too short" if bad and i % 3 == 1 else f"synthetic incident {i} from bench_validation.py",
+            "urgency": "Urgent" if bad and i % 3 == 2 else rng.choice(["Low", "Medium", "High"]),
+            "created_by": None,
+        })
+    return rows
+
+
+def _per_incident(rules, rows) -> int:
+    factory = IncidentFactory()
+    invalid = 0
+    for row in rows:
+        incident = factory.create_incident(None, row["tip_name"], row["incident_type"], row["location"],
+                                           row["description"], row["urgency"], row["created_by"])
+        invalid += not incident.validate(rules)
+    return invalid
+
+
+def _per_row(rules, rows) -> int:
+    return sum(1 for row in rows if rules.errors(row))
+
+
+def _batch(rules, rows, size: int) -> int:
+    invalid = 0
+    for start in range(0, len(rows), size):
+        invalid += sum(1 for errors in rules.validate_batch(rows[start:start + size]) if errors)
+    return invalid
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=10_000, help="rows per validate_batch call")
+    args = parser.parse_args()
+
+    tmpdir = tempfile.mkdtemp(prefix="tattle-bench-")
+    cfg = dict(DB_CONFIG, backend="sqlite", pool={"enabled": False}, migrations={"online_in_background": False},
+               sqlite=dict(DB_CONFIG.get("sqlite") or {}, path=os.path.join(tmpdir, "bench.db")))
+    try:
+        db = Database(cfg)
+        db.add_incident_rule("location", "allowed", "Lobby,Annex,Garage,Roof,Car park", incident_type="Theft")
+        db.add_incident_rule("description", "min_length", 30, incident_type="Fraud")
+        db.add_incident_rule("description", "max_length", 400, incident_type="Harassment")
+
+        start = time.perf_counter()
+        rules = db.get_incident_rules()
+        compile_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        for _ in range(1000):
+            db.get_incident_rules()
+        cached_us = (time.perf_counter() - start) * 1000
+        print(f"get_incident_rules: {len(rules)} rules compiled in {compile_ms:.1f} ms, "
+              f"{cached_us:.2f} us per cached call")
+
+        rows = _rows(args.rows)
+        print(f"{len(rows)} incidents\n{'mode':<16} {'seconds':>8} {'rows/s':>12} {'invalid':>9}")
+        for mode, run in (("old dict", lambda: _per_incident({"min_description_length": 20}, rows)),
+                          ("per incident", lambda: _per_incident(rules, rows)),
+                          ("errors(row)", lambda: _per_row(rules, rows)),
+                          (f"batch {args.batch}", lambda: _batch(rules, rows, args.batch))):
+            start = time.perf_counter()
+            invalid = run()
+            elapsed = time.perf_counter() - start
+            print(f"{mode:<16} {elapsed:>8.2f} {len(rows) / elapsed:>12,.0f} {invalid:>9}")
+        db.close()
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,93 @@
 import os
 
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
 # Database configuration (supports env var overrides)
 DB = {
+    # Storage engine: "mysql" (default) or "sqlite" (embedded, no server needed)
+    "backend": os.getenv("DB_BACKEND", "mysql"),
     "host": os.getenv("DB_HOST", "localhost"),
     "user": os.getenv("DB_USER", "root"),
     "password": os.getenv("DB_PASSWORD", "password"),
     "database": os.getenv("DB_NAME", "tattlestoolie_db"),
     "autocommit": False,
+    # Connection pooling: when enabled, each Database call borrows its own
+    # connection so background work and concurrent callers run in parallel.
+    "pool": {
+        "enabled": os.getenv("DB_POOL", "false").lower() in ("1", "true", "yes", "y"),
+        "size": int(os.getenv("DB_POOL_SIZE", "5")),
+        "min_size": int(os.getenv("DB_POOL_MIN_SIZE", "1")),
+        "timeout": float(os.getenv("DB_POOL_TIMEOUT", "10")),          # seconds to wait for a free connection
+        "health_check": True,                                          # ping idle connections before reuse
+        "health_check_interval": float(os.getenv("DB_POOL_PING_INTERVAL", "30")),
+        "idle_timeout": float(os.getenv("DB_POOL_IDLE_TIMEOUT", "300")),  # close connections idle this long
+    },
+    # Read cache for tip queries (database.cache). Writes through this process
+    # evict exactly the affected entries; other clients' writes are noticed by
+    # polling the data_versions counter at most every version_check_interval s.
+    "cache": {
+        "enabled": os.getenv("DB_CACHE", "true").lower() in ("1", "true", "yes", "y"),
+        "max_entries": int(os.getenv("DB_CACHE_ENTRIES", "2048")),
+        "max_mb": float(os.getenv("DB_CACHE_MB", "16")),
+        "version_check_interval": float(os.getenv("DB_CACHE_CHECK_INTERVAL", "2")),
+    },
+    # Password hashing (database.passwords). Raising the cost upgrades each
+    # user's hash at their next login; benchmarks/bench_login.py helps size it.
+    "passwords": {
+        "algorithm": os.getenv("DB_PASSWORD_HASH", "scrypt"),             # "scrypt" or "pbkdf2_sha256"
+        "scrypt_n": int(os.getenv("DB_SCRYPT_N", str(2 ** 14))),            # CPU/memory cost (power of 2)
+        "scrypt_r": 8,
+        "scrypt_p": 1,
+        "pbkdf2_iterations": int(os.getenv("DB_PBKDF2_ITERATIONS", "600000")),
+        "workers": int(os.getenv("DB_HASH_WORKERS", "2")),                 # concurrent hash/verify calls
+    },
+    # Login defences (database.login_guard): failed attempts are answered from
+    # memory for negative_ttl s, and a username/source with too many failures
+    # inside window s must wait.
+    "login": {
+        "negative_ttl": float(os.getenv("DB_LOGIN_NEGATIVE_TTL", "30")),
+        "window": float(os.getenv("DB_LOGIN_WINDOW", "300")),
+        "max_failures_per_user": int(os.getenv("DB_LOGIN_MAX_FAILURES", "5")),
+        "max_failures_per_source": int(os.getenv("DB_LOGIN_MAX_FAILURES_SOURCE", "20")),
+    },
+    # Schema migrations (database.migrations). Online ones (index builds) run on
+    # a background thread after startup unless this is off.
+    "migrations": {
+        "online_in_background": os.getenv("DB_MIGRATE_BACKGROUND", "true").lower() in ("1", "true", "yes", "y"),
+    },
+    # SQLite backend settings (used when backend == "sqlite")
+    "sqlite": {
+        "path": os.getenv("DB_SQLITE_PATH", os.path.join(BASE_DIR, "tattlestoolie_fallback.db")),
+        "journal_mode": "WAL",          # readers don't block the writer
+        "synchronous": "NORMAL",        # fsync at checkpoints only (safe with WAL)
+        "cache_size_kb": 20000,
+        "mmap_size": 256 * 1024 * 1024,
+        "busy_timeout_ms": 5000,
+        "cached_statements": 256,       # prepared statements kept per connection
+    },
 }
 
 APP = {
     "title": "TattleStoolie",
     "geometry": "1000x700",
-}
\ No newline at end of file
+    # Pre-scaled copies of the image assets (ui/assets.py); "" turns the disk cache off
+    "asset_cache_dir": os.getenv("ASSET_CACHE_DIR", os.path.join(BASE_DIR, ".cache", "assets")),
+    # Built screens kept between visits (ui/frame_cache.py): LRU bounded by frame
+    # count and by Tk widgets held; "prewarm" builds likely-next screens after login
+    "frame_cache": {
+        "max_frames": int(os.getenv("FRAME_CACHE_MAX_FRAMES", "8")),
+        "max_widgets": int(os.getenv("FRAME_CACHE_MAX_WIDGETS", "6000")),
+        "prewarm": os.getenv("FRAME_PREWARM", "true").lower() in ("1", "true", "yes"),
+    },
+    # Manage Incidents loads tables up to this many tips into an in-memory
+    # TipStore at the first header sort (models/tip_store.py); 0 turns it off
+    "tip_store_max_rows": int(os.getenv("TIP_STORE_MAX_ROWS", "20000")),
+}
+
+# Headless HTTP/JSON API (api_server.py)
+API = {
+    "host": os.getenv("API_HOST", "127.0.0.1"),
+    "port": int(os.getenv("API_PORT", "8080")),
+    "workers": int(os.getenv("API_WORKERS", "8")),        # concurrent DB calls (and pooled connections)
+    "token_ttl": float(os.getenv("API_TOKEN_TTL", "3600")),  # seconds a login token stays valid
+}
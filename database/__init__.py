@@ -1,4 +1,12 @@
 # database package init
-from .db import Database
+# Database is resolved on first use, so importing a light submodule (the login
+# screen needs only database.login_guard) does not load db.py and its imports.
 
-__all__ = ["Database"]
\ No newline at end of file
+__all__ = ["Database"]
+
+
+def __getattr__(name):
+    if name == "Database":
+        from .db import Database
+        return Database
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,94 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from .db import Database
+
+# Awaitable variant of Database for asyncio code (the API server, or any loop
+# that wants hundreds of DB operations in flight). The drivers are blocking, so
+# rather than a second implementation each coroutine runs the very same
+# Database method on a bounded executor: queries are built in one place, and
+# the async methods below are generated from the sync ones, so renaming or
+# removing a Database method breaks this module at import instead of drifting.
+
+# Database methods exposed as coroutines with the same signature and docstring.
+ASYNC_METHODS = (
+    "create_user", "get_user_by_credentials", "seed_admin",
+    "create_tip", "create_tips", "read_tips", "read_tips_after", "read_tips_page", "search_tips", "read_tip",
+    "update_tip", "delete_tip", "count_tips", "dashboard_snapshot",
+    "get_all_incidents", "get_incidents_by_urgency",
+    "change_watermark", "changes_since", "data_version", "refresh_statistics", "explain",
+    "get_incident_rules", "add_incident_rule", "delete_incident_rule",
+)
+
+
+class AsyncDatabase:
+    """Database API as coroutines, run on at most ``max_concurrency`` threads.
+
+    Callers beyond that wait their turn in the executor's queue, without a
+    thread each. The default concurrency is the connection pool size. In
+    single-connection mode it is always 1: calls serialise on the shared
+    connection anyway, and its lock must be released by the thread that took
+    it (iter_tips spans several calls). Attributes that are not I/O (stats,
+    cache_stats, backend...) are read straight from the wrapped Database.
+    """
+
+    def __init__(self, db: Database, max_concurrency: Optional[int] = None):
+        self.db = db
+        if db.pool is None:
+            max_concurrency = 1
+        elif max_concurrency is None:
+            max_concurrency = db.pool.size
+        self.max_concurrency = max(1, int(max_concurrency))
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="tattle-adb")
+
+    @classmethod
+    async def connect(cls, config: dict, max_concurrency: Optional[int] = None) -> "AsyncDatabase":
+        """Open a Database (schema check included) without blocking the event loop."""
+        db = await asyncio.get_running_loop().run_in_executor(None, Database, config)
+        return cls(db, max_concurrency)
+
+    async def run(self, fn, *args, **kwargs) -> Any:
+        """Run any blocking callable on this database's executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+    async def iter_tips(self, filters: dict = None, chunk_size: int = 1000,
+                        columns: Optional[List[str]] = None) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Async counterpart of Database.iter_tips; each chunk is fetched on the executor."""
+        chunks = self.db.iter_tips(filters, chunk_size, columns)
+        done = object()
+        try:
+            while True:
+                chunk = await self.run(next, chunks, done)
+                if chunk is done:
+                    return
+                yield chunk
+        finally:
+            # Close on the executor too: it releases the connection and may talk to the server
+            await self.run(chunks.close)
+
+    async def close(self):
+        """Wait for running calls, then close the wrapped Database."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._executor.shutdown, True)
+        self.db.close()
+
+    def __getattr__(self, name):
+        return getattr(self.db, name)
+
+
+def _coroutine(name: str):
+    sync = getattr(Database, name)
+
+    @functools.wraps(sync)
+    async def method(self, *args, **kwargs):
+        return await self.run(getattr(self.db, name), *args, **kwargs)
+
+    return method
+
+
+for _name in ASYNC_METHODS:
+    setattr(AsyncDatabase, _name, _coroutine(_name))
+del _name
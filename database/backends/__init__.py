@@ -0,0 +1,23 @@
+# database.backends package init
+from .base import Backend, SEARCH_COLUMNS
+
+# Backend modules are imported on demand so the MySQL driver is only loaded
+# when the MySQL backend is actually selected.
+BACKENDS = {
+    "mysql": ("database.backends.mysql_backend", "MySQLBackend"),
+    "sqlite": ("database.backends.sqlite_backend", "SQLiteBackend"),
+}
+
+
+def get_backend(config: dict) -> Backend:
+    """Instantiate the backend named by config["backend"] (default "mysql")."""
+    name = (config.get("backend") or "mysql").lower()
+    entry = BACKENDS.get(name)
+    if entry is None:
+        raise ValueError(f"Unknown database backend '{name}'. Choose one of: {', '.join(BACKENDS)}")
+    module_name, class_name = entry
+    module = __import__(module_name, fromlist=[class_name])
+    return getattr(module, class_name)(config)
+
+
+__all__ = ["Backend", "BACKENDS", "SEARCH_COLUMNS", "get_backend"]
@@ -0,0 +1,121 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Type
+
+# Tip columns covered by the full-text index, in relevance-weight order.
+SEARCH_COLUMNS = ("tip_name", "incident_type", "location", "description")
+
+
+class Backend(ABC):
+    """Dialect and driver details behind Database.
+
+    Database writes its statements once, with ``%s`` placeholders; a backend
+    opens connections, hands out cursors that return rows as dicts (or plain
+    tuples, which Database turns into TipRecords), and owns the bits of SQL
+    that differ between engines (DDL, index introspection).
+    """
+
+    name = "base"
+    # Shortest search term the full-text index can match; shorter ones are dropped.
+    fulltext_min_token = 1
+    # Most placeholders one statement may bind (caps rows per multi-row INSERT).
+    max_bind_params = 999
+    # Whether every connect() reaches the same data (False for SQLite ":memory:").
+    shared_connections = True
+
+    def __init__(self, config: dict):
+        self.config = config
+        self.autocommit = bool(config.get("autocommit", False))
+
+    @abstractmethod
+    def connect(self):
+        """Open a new DB-API connection."""
+
+    @abstractmethod
+    def cursor(self, conn, tuples: bool = False):
+        """Return a cursor on ``conn`` whose fetch methods yield dict rows (tuples with ``tuples``)."""
+
+    def stream_cursor(self, conn, tuples: bool = False):
+        """Cursor that fetches rows from the server as they are read (for exports)."""
+        return self.cursor(conn, tuples)
+
+    def end_stream(self, conn, cur):
+        """Discard any unread rows of a stream_cursor() result (early exit)."""
+
+    @abstractmethod
+    def is_alive(self, conn) -> bool:
+        """Cheap liveness check used by the pool before reusing a connection."""
+
+    @property
+    @abstractmethod
+    def integrity_errors(self) -> Tuple[Type[BaseException], ...]:
+        """Exception types raised for constraint violations (e.g. duplicate username)."""
+
+    @property
+    def row_errors(self) -> Tuple[Type[BaseException], ...]:
+        """Errors caused by the data in a row (constraints, bad values), not the connection."""
+        return self.integrity_errors
+
+    @abstractmethod
+    def inserted_ids(self, cur, count: int) -> List[int]:
+        """Ids assigned by the multi-row INSERT just executed on ``cur`` (``count`` rows)."""
+
+    @abstractmethod
+    def schema_statements(self) -> List[str]:
+        """CREATE TABLE IF NOT EXISTS statements for users and tips."""
+
+    def migrate_legacy(self, cur):
+        """Bring older schemas up to date (no-op unless the engine has history)."""
+
+    @abstractmethod
+    def existing_indexes(self, cur, table: str) -> Set[str]:
+        """Names of the indexes currently defined on ``table``."""
+
+    def index_columns(self, cur, table: str) -> Dict[str, List[Optional[str]]]:
+        """Indexes on ``table`` with their key columns in order (None for an expression part)."""
+        return {name: [] for name in self.existing_indexes(cur, table)}
+
+    def modify_column_sql(self, table: str, column: str, definition: str) -> Optional[str]:
+        """Statement changing a column's type, or None where declared types aren't enforced."""
+        return f"ALTER TABLE {table} MODIFY {column} {definition}"
+
+    def create_index_sql(self, name: str, table: str, columns: str, online: bool = False) -> str:
+        """CREATE INDEX statement; ``online`` asks for one that doesn't block writers, if the engine can."""
+        return f"CREATE INDEX {name} ON {table} {columns}"
+
+    def drop_index_sql(self, name: str, table: str) -> str:
+        return f"DROP INDEX {name} ON {table}"
+
+    def analyze(self, cur, table: str):
+        """Refresh the planner's statistics for ``table`` (after creating indexes)."""
+
+    def explain(self, cur, sql: str, params=()) -> Tuple[List[str], List[str]]:
+        """Plan of ``sql`` without running it: (readable plan lines, warnings).
+
+        Warnings flag full table scans and sorts that no index serves.
+        """
+        raise NotImplementedError
+
+    def ensure_fulltext(self, cur) -> bool:
+        """Create the full-text index over SEARCH_COLUMNS; False if the engine has none."""
+        return False
+
+    def has_fulltext(self, cur) -> bool:
+        """Whether the full-text index made by ensure_fulltext() exists."""
+        return False
+
+    def fulltext_match(self, terms: List[str]) -> Tuple[str, str, list, str, list]:
+        """SQL pieces for a search requiring every term as a word prefix.
+
+        Returns (FROM clause, relevance expression, its params, WHERE clause, its
+        params). Higher relevance is better. Only called if ensure_fulltext()
+        returned True.
+        """
+        raise NotImplementedError
+
+    def describe(self) -> str:
+        """Human-readable target for log lines (never includes credentials)."""
+        return self.name
+
+    @staticmethod
+    def _names(rows: Iterable[dict], key: str) -> Set[str]:
+        return {row[key] for row in rows}
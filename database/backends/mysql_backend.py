@@ -0,0 +1,231 @@
+from typing import Dict, List, Optional, Set, Tuple
+
+import mysql.connector
+
+from .base import Backend, SEARCH_COLUMNS
+
+
+class MySQLBackend(Backend):
+    """mysql-connector-python backend (the production default)."""
+
+    name = "mysql"
+    # InnoDB ignores words shorter than innodb_ft_min_token_size (default 3).
+    fulltext_min_token = 3
+    max_bind_params = 65535
+
+    def connect(self):
+        conn = mysql.connector.connect(
+            host=self.config.get("host", "localhost"),
+            user=self.config.get("user", "root"),
+            password=self.config.get("password", "password"),
+            database=self.config.get("database", "TattleStoolie_DB"),
+        )
+        conn.autocommit = self.autocommit
+        return conn
+
+    def cursor(self, conn, tuples: bool = False):
+        return conn.cursor() if tuples else conn.cursor(dictionary=True)
+
+    def stream_cursor(self, conn, tuples: bool = False):
+        # Unbuffered: rows stay on the server until fetched, so memory is per chunk.
+        return conn.cursor(dictionary=not tuples, buffered=False)
+
+    def end_stream(self, conn, cur):
+        # The connection can't run another statement until the result is drained.
+        try:
+            conn.consume_results()
+        except Exception:
+            pass
+
+    def is_alive(self, conn) -> bool:
+        try:
+            conn.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
+
+    @property
+    def integrity_errors(self):
+        return (mysql.connector.IntegrityError,)
+
+    @property
+    def row_errors(self):
+        return (mysql.connector.IntegrityError, mysql.connector.DataError)
+
+    def inserted_ids(self, cur, count: int) -> List[int]:
+        # LAST_INSERT_ID() is the first id of a multi-row INSERT; InnoDB gives a
+        # "simple insert" consecutive ids in every auto-increment lock mode.
+        first = cur.lastrowid
+        return list(range(first, first + count))
+
+    def schema_statements(self) -> List[str]:
+        return [
+            """
+            CREATE TABLE IF NOT EXISTS users (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                username VARCHAR(255) UNIQUE NOT NULL,
+                email VARCHAR(255),
+                password_hash VARCHAR(255) NOT NULL,
+                role VARCHAR(50) NOT NULL DEFAULT 'reporter'
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS tips (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                tip_name VARCHAR(255),
+                incident_type VARCHAR(255),
+                location VARCHAR(255),
+                description VARCHAR(500),
+                urgency VARCHAR(50),
+                created_by INT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                status VARCHAR(50) DEFAULT 'Pending',
+                row_version BIGINT NOT NULL DEFAULT 0,
+                updated_at TIMESTAMP NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                FOREIGN KEY (created_by) REFERENCES users(id) ON DELETE SET NULL
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS tip_tombstones (
+                version BIGINT NOT NULL,
+                tip_id INT NOT NULL,
+                deleted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (version, tip_id)
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS data_versions (
+                name VARCHAR(64) PRIMARY KEY,
+                version BIGINT NOT NULL DEFAULT 0
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS incident_rules (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                field_name VARCHAR(64) NOT NULL,
+                kind VARCHAR(32) NOT NULL,
+                value VARCHAR(500),
+                incident_type VARCHAR(255),
+                message VARCHAR(255)
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+            """,
+        ]
+
+    def migrate_legacy(self, cur):
+        schema = self.config.get("database", "TattleStoolie_DB")
+        # Migrate legacy schema if needed
+        try:
+            cur.execute(
+                """
+                SELECT COLUMN_NAME FROM INFORMATION_SCHEMA.COLUMNS
+                WHERE TABLE_SCHEMA=%s AND TABLE_NAME='tips' AND COLUMN_NAME IN ('id','tips_ID')
+                """,
+                (schema,),
+            )
+            cols = {row["COLUMN_NAME"] for row in cur.fetchall()}
+        except Exception:
+            cols = set()
+
+        # Migrate tips.description from TEXT to VARCHAR(500) if needed
+        try:
+            cur.execute(
+                """
+                SELECT DATA_TYPE FROM INFORMATION_SCHEMA.COLUMNS
+                WHERE TABLE_SCHEMA=%s AND TABLE_NAME='tips' AND COLUMN_NAME='description'
+                """,
+                (schema,),
+            )
+            row = cur.fetchone()
+            if row and row["DATA_TYPE"].lower() == "text":
+                cur.execute("SELECT MAX(CHAR_LENGTH(description)) AS maxlen FROM tips")
+                maxlen = cur.fetchone()["maxlen"] or 0
+                if maxlen <= 500:
+                    cur.execute("ALTER TABLE tips MODIFY description VARCHAR(500)")
+        except Exception:
+            pass
+
+        # Add the change-feed columns to tips tables created before they existed
+        try:
+            cur.execute(
+                """
+                SELECT COLUMN_NAME FROM INFORMATION_SCHEMA.COLUMNS
+                WHERE TABLE_SCHEMA=%s AND TABLE_NAME='tips' AND COLUMN_NAME IN ('row_version','updated_at')
+                """,
+                (schema,),
+            )
+            present = {row["COLUMN_NAME"] for row in cur.fetchall()}
+            if "row_version" not in present:
+                cur.execute("ALTER TABLE tips ADD COLUMN row_version BIGINT NOT NULL DEFAULT 0")
+            if "updated_at" not in present:
+                cur.execute("ALTER TABLE tips ADD COLUMN updated_at TIMESTAMP NULL "
+                            "DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP")
+        except Exception as e:
+            print("[DB] Could not add change-feed columns to tips:", e)
+
+    def existing_indexes(self, cur, table: str) -> Set[str]:
+        cur.execute(
+            """
+            SELECT DISTINCT INDEX_NAME FROM INFORMATION_SCHEMA.STATISTICS
+            WHERE TABLE_SCHEMA=%s AND TABLE_NAME=%s
+            """,
+            (self.config.get("database", "TattleStoolie_DB"), table),
+        )
+        return self._names(cur.fetchall(), "INDEX_NAME")
+
+    def index_columns(self, cur, table: str) -> Dict[str, List[Optional[str]]]:
+        # COLUMN_NAME is NULL for functional key parts (MySQL 8.0.13+)
+        cur.execute(
+            """
+            SELECT INDEX_NAME, SEQ_IN_INDEX, COLUMN_NAME FROM INFORMATION_SCHEMA.STATISTICS
+            WHERE TABLE_SCHEMA=%s AND TABLE_NAME=%s ORDER BY INDEX_NAME, SEQ_IN_INDEX
+            """,
+            (self.config.get("database", "TattleStoolie_DB"), table),
+        )
+        result: Dict[str, List[Optional[str]]] = {}
+        for row in cur.fetchall():
+            result.setdefault(row["INDEX_NAME"], []).append(row["COLUMN_NAME"])
+        return result
+
+    def create_index_sql(self, name: str, table: str, columns: str, online: bool = False) -> str:
+        sql = super().create_index_sql(name, table, columns)
+        # InnoDB builds plain secondary indexes in place while allowing writes;
+        # functional ones add a hidden column, so let the server pick the lock.
+        if online and "(" not in columns.strip()[1:-1]:
+            sql += " ALGORITHM=INPLACE LOCK=NONE"
+        return sql
+
+    def analyze(self, cur, table: str):
+        cur.execute(f"ANALYZE TABLE {table}")
+        cur.fetchall()
+
+    def explain(self, cur, sql: str, params=()) -> Tuple[List[str], List[str]]:
+        cur.execute("EXPLAIN " + sql, params)
+        lines, warnings = [], []
+        for row in cur.fetchall():
+            table, access, extra = row.get("table") or "", row.get("type"), row.get("Extra") or ""
+            lines.append(f"{table}: type={access} key={row.get('key')} rows={row.get('rows')} {extra}".rstrip())
+            # Derived tables (<derived2>) are scanned by design; their source is listed separately
+            if access == "ALL" and not table.startswith("<"):
+                warnings.append(f"full table scan of {table} (~{row.get('rows')} rows)")
+            if "Using filesort" in extra:
+                warnings.append(f"sort without an index on {table}")
+            if "Using temporary" in extra:
+                warnings.append(f"temporary table for {table}")
+        return lines, warnings
+
+    def ensure_fulltext(self, cur) -> bool:
+        if "ftx_tips_text" not in self.existing_indexes(cur, "tips"):
+            cur.execute(f"ALTER TABLE tips ADD FULLTEXT INDEX ftx_tips_text ({', '.join(SEARCH_COLUMNS)})")
+        return True
+
+    def has_fulltext(self, cur) -> bool:
+        return "ftx_tips_text" in self.existing_indexes(cur, "tips")
+
+    def fulltext_match(self, terms: List[str]) -> Tuple[str, str, list, str, list]:
+        # Boolean mode: +word* requires each term as a prefix; MATCH() doubles as the score.
+        match = f"MATCH({', '.join(SEARCH_COLUMNS)}) AGAINST (%s IN BOOLEAN MODE)"
+        query = " ".join(f"+{term}*" for term in terms)
+        return "tips", match, [query], match, [query]
+
+    def describe(self) -> str:
+        return f"MySQL {self.config.get('host', 'localhost')}/{self.config.get('database', '')}"
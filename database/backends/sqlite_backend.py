@@ -0,0 +1,332 @@
+import datetime
+import sqlite3
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
+
+from .base import Backend, SEARCH_COLUMNS
+
+
+def _dict_row(cursor, row):
+    return {col[0]: value for col, value in zip(cursor.description, row)}
+
+
+def _convert_timestamp(raw: bytes):
+    try:
+        return datetime.datetime.fromisoformat(raw.decode("utf-8"))
+    except ValueError:
+        return raw.decode("utf-8")
+
+
+# Return created_at as datetime (like mysql-connector) and bind datetimes the way
+# CURRENT_TIMESTAMP stores them, so keyset cursors compare correctly.
+sqlite3.register_converter("TIMESTAMP", _convert_timestamp)
+sqlite3.register_converter("DATETIME", _convert_timestamp)
+sqlite3.register_adapter(datetime.datetime, lambda value: value.isoformat(sep=" "))
+sqlite3.register_adapter(datetime.date, lambda value: value.isoformat())
+
+
+@lru_cache(maxsize=1024)
+def _to_qmark(sql: str) -> str:
+    """Translate Database's %s placeholders to sqlite's ? (cached per statement text)."""
+    return sql.replace("%s", "?")
+
+
+# Column definitions mirror the MySQL schema. Text columns use NOCASE so sorting,
+# equality and the UNIQUE username check behave like MySQL's default collation.
+_TABLES = {
+    "users": """
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        username TEXT COLLATE NOCASE UNIQUE NOT NULL,
+        email TEXT COLLATE NOCASE,
+        password_hash TEXT NOT NULL,
+        role TEXT COLLATE NOCASE NOT NULL DEFAULT 'reporter'
+    """,
+    "tips": """
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        tip_name TEXT COLLATE NOCASE,
+        incident_type TEXT COLLATE NOCASE,
+        location TEXT COLLATE NOCASE,
+        description TEXT,
+        urgency TEXT COLLATE NOCASE,
+        created_by INTEGER REFERENCES users(id) ON DELETE SET NULL,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        status TEXT COLLATE NOCASE DEFAULT 'Pending',
+        row_version INTEGER NOT NULL DEFAULT 0,
+        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    """,
+    "tip_tombstones": """
+        version INTEGER NOT NULL,
+        tip_id INTEGER NOT NULL,
+        deleted_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (version, tip_id)
+    """,
+    "data_versions": """
+        name TEXT COLLATE NOCASE PRIMARY KEY,
+        version INTEGER NOT NULL DEFAULT 0
+    """,
+    "incident_rules": """
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        field_name TEXT NOT NULL,
+        kind TEXT NOT NULL,
+        value TEXT,
+        incident_type TEXT COLLATE NOCASE,
+        message TEXT
+    """,
+}
+
+
+class _SQLiteCursor:
+    """sqlite3 cursor that accepts %s placeholders."""
+
+    __slots__ = ("_cur",)
+
+    def __init__(self, cur):
+        self._cur = cur
+
+    def execute(self, sql, params=()):
+        self._cur.execute(_to_qmark(sql), params)
+        return self
+
+    def executemany(self, sql, seq_of_params):
+        self._cur.executemany(_to_qmark(sql), seq_of_params)
+        return self
+
+    def fetchone(self):
+        return self._cur.fetchone()
+
+    def fetchall(self):
+        return self._cur.fetchall()
+
+    def fetchmany(self, size=None):
+        return self._cur.fetchmany(size) if size is not None else self._cur.fetchmany()
+
+    def close(self):
+        self._cur.close()
+
+    def __iter__(self):
+        return iter(self._cur)
+
+    @property
+    def lastrowid(self):
+        return self._cur.lastrowid
+
+    @property
+    def rowcount(self):
+        return self._cur.rowcount
+
+    @property
+    def description(self):
+        return self._cur.description
+
+    @property
+    def connection(self):
+        return self._cur.connection
+
+
+class SQLiteBackend(Backend):
+    """Embedded SQLite backend: zero network latency for small sites and test rigs.
+
+    Each connection runs in WAL mode so readers never block the writer, with
+    relaxed fsync (synchronous=NORMAL), an in-memory temp store, a larger page
+    cache, mmap I/O and a busy timeout instead of immediate "database is locked"
+    errors. sqlite3's per-connection statement cache is sized so the handful of
+    statements Database issues stay prepared and are reused.
+
+    A ":memory:" path gives every connection its own database, so use it only
+    with pooling disabled.
+    """
+
+    name = "sqlite"
+    # SQLITE_MAX_VARIABLE_NUMBER default: 999 before 3.32, 32766 since.
+    max_bind_params = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+
+    def __init__(self, config: dict):
+        super().__init__(config)
+        opts = config.get("sqlite") or {}
+        self.path = opts.get("path", "tattlestoolie_fallback.db")
+        self.journal_mode = opts.get("journal_mode", "WAL")
+        self.synchronous = opts.get("synchronous", "NORMAL")
+        self.cache_size_kb = int(opts.get("cache_size_kb", 20000))
+        self.mmap_size = int(opts.get("mmap_size", 256 * 1024 * 1024))
+        self.busy_timeout_ms = int(opts.get("busy_timeout_ms", 5000))
+        self.cached_statements = int(opts.get("cached_statements", 256))
+        self.shared_connections = self.path != ":memory:"
+
+    def connect(self):
+        conn = sqlite3.connect(
+            self.path,
+            timeout=self.busy_timeout_ms / 1000.0,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            check_same_thread=False,  # pooled connections move between worker threads
+            cached_statements=self.cached_statements,
+            isolation_level=None if self.autocommit else "",
+        )
+        conn.execute(f"PRAGMA journal_mode={self.journal_mode}")
+        conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute(f"PRAGMA cache_size=-{self.cache_size_kb}")
+        conn.execute(f"PRAGMA mmap_size={self.mmap_size}")
+        conn.execute(f"PRAGMA busy_timeout={self.busy_timeout_ms}")
+        conn.row_factory = _dict_row
+        return conn
+
+    def cursor(self, conn, tuples: bool = False):
+        cur = conn.cursor()
+        if tuples:
+            cur.row_factory = None
+        return _SQLiteCursor(cur)
+
+    # sqlite3 cursors already step through results lazily, so the default
+    # stream_cursor() is a streaming cursor.
+
+    def is_alive(self, conn) -> bool:
+        try:
+            conn.execute("SELECT 1")
+            return True
+        except Exception:
+            return False
+
+    @property
+    def integrity_errors(self):
+        return (sqlite3.IntegrityError,)
+
+    def inserted_ids(self, cur, count: int) -> List[int]:
+        # last_insert_rowid() is the last row; one statement assigns consecutive rowids.
+        last = cur.lastrowid
+        return list(range(last - count + 1, last + 1))
+
+    def schema_statements(self) -> List[str]:
+        return [f"CREATE TABLE IF NOT EXISTS {name} ({body})" for name, body in _TABLES.items()]
+
+    def migrate_legacy(self, cur):
+        # Files created before text columns were declared NOCASE (including the
+        # bundled fallback db) sort and match case-sensitively, unlike MySQL's
+        # default collation. Rebuild them; SQLite cannot ALTER a column's collation.
+        # Tables missing later columns (tips.row_version/updated_at) are rebuilt
+        # too, since ADD COLUMN cannot take a CURRENT_TIMESTAMP default.
+        for name, body in _TABLES.items():
+            cur.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = %s", (name,))
+            row = cur.fetchone()
+            if not row:
+                continue
+            sql = (row["sql"] or "").upper()
+            cur.execute(f"PRAGMA table_info({name})")
+            present = {r["name"].lower() for r in cur.fetchall()}
+            wanted = {line.split()[0].lower() for line in body.strip().splitlines()
+                      if not line.strip().upper().startswith("PRIMARY KEY")}
+            if ("NOCASE" in body.upper() and "NOCASE" not in sql) or not wanted <= present:
+                self._rebuild_table(cur, name, body)
+
+    def _rebuild_table(self, cur, name: str, body: str):
+        """Copy ``name`` into a table declared with ``body`` (SQLite's 12-step ALTER)."""
+        conn = cur.connection
+        conn.commit()
+        cur.execute("PRAGMA foreign_keys=OFF")
+        try:
+            cur.execute(f"PRAGMA table_info({name})")
+            old_cols = [r["name"] for r in cur.fetchall()]
+            tmp = f"{name}__rebuild"
+            cur.execute(f"DROP TABLE IF EXISTS {tmp}")
+            cur.execute(f"CREATE TABLE {tmp} ({body})")
+            cur.execute(f"PRAGMA table_info({tmp})")
+            cols = ", ".join(c for c in (r["name"] for r in cur.fetchall()) if c in old_cols)
+            cur.execute(f"INSERT INTO {tmp} ({cols}) SELECT {cols} FROM {name}")
+            cur.execute(f"DROP TABLE {name}")
+            cur.execute(f"ALTER TABLE {tmp} RENAME TO {name}")
+            conn.commit()
+            print(f"[DB] Rebuilt SQLite table '{name}' with the current column definitions.")
+        except sqlite3.IntegrityError as e:
+            # e.g. usernames that differ only by case; keep the old table as-is
+            conn.rollback()
+            print(f"[DB] Could not rebuild SQLite table '{name}':", e)
+        finally:
+            cur.execute("PRAGMA foreign_keys=ON")
+
+    def modify_column_sql(self, table: str, column: str, definition: str) -> Optional[str]:
+        # Declared types are only affinities here; TEXT already holds any length.
+        return None
+
+    def existing_indexes(self, cur, table: str) -> Set[str]:
+        cur.execute(f"PRAGMA index_list({table})")
+        return self._names(cur.fetchall(), "name")
+
+    def index_columns(self, cur, table: str) -> Dict[str, List[Optional[str]]]:
+        result = {}
+        for name in self.existing_indexes(cur, table):
+            cur.execute(f"PRAGMA index_info({name})")
+            # Expression parts have cid -2 and no name
+            result[name] = [row["name"] for row in sorted(cur.fetchall(), key=lambda r: r["seqno"])]
+        return result
+
+    def drop_index_sql(self, name: str, table: str) -> str:
+        return f"DROP INDEX {name}"
+
+    def analyze(self, cur, table: str):
+        cur.execute(f"ANALYZE {table}")
+
+    def explain(self, cur, sql: str, params=()) -> Tuple[List[str], List[str]]:
+        cur.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        tables = {row["name"].lower() for row in cur.fetchall()}
+        cur.execute("EXPLAIN QUERY PLAN " + sql, params)
+        lines, warnings = [], []
+        for row in cur.fetchall():
+            detail = row["detail"]
+            lines.append(detail)
+            # "SCAN tips" reads every row; "SCAN tips USING INDEX x" walks an index in
+            # order. SQLite before 3.36 writes "SCAN TABLE tips".
+            words = [w for w in detail.split() if w != "TABLE"]
+            if (words[:1] == ["SCAN"] and len(words) > 1 and words[1].lower() in tables
+                    and "USING" not in words and "VIRTUAL" not in words):
+                warnings.append(f"full table scan of {words[1]}")
+            if "TEMP B-TREE" in detail:
+                warnings.append(f"sort without an index ({detail.lower()})")
+        return lines, warnings
+
+    def ensure_fulltext(self, cur) -> bool:
+        # External-content FTS5 table: the index lives in tips_fts, the text stays
+        # in tips. Triggers keep them in sync; prefix indexes make "ab*" cheap.
+        cols = ", ".join(SEARCH_COLUMNS)
+        new_cols = ", ".join(f"new.{c}" for c in SEARCH_COLUMNS)
+        old_cols = ", ".join(f"old.{c}" for c in SEARCH_COLUMNS)
+        cur.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tips_fts'")
+        created = cur.fetchone() is None
+        try:
+            cur.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS tips_fts USING fts5({cols}, content='tips', "
+                "content_rowid='id', tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+            )
+        except sqlite3.OperationalError as e:
+            print("[DB] SQLite FTS5 unavailable, search falls back to LIKE:", e)
+            return False
+        cur.execute(
+            f"CREATE TRIGGER IF NOT EXISTS tips_fts_ai AFTER INSERT ON tips BEGIN "
+            f"INSERT INTO tips_fts(rowid, {cols}) VALUES (new.id, {new_cols}); END"
+        )
+        cur.execute(
+            f"CREATE TRIGGER IF NOT EXISTS tips_fts_ad AFTER DELETE ON tips BEGIN "
+            f"INSERT INTO tips_fts(tips_fts, rowid, {cols}) VALUES ('delete', old.id, {old_cols}); END"
+        )
+        cur.execute(
+            f"CREATE TRIGGER IF NOT EXISTS tips_fts_au AFTER UPDATE OF {cols} ON tips BEGIN "
+            f"INSERT INTO tips_fts(tips_fts, rowid, {cols}) VALUES ('delete', old.id, {old_cols}); "
+            f"INSERT INTO tips_fts(rowid, {cols}) VALUES (new.id, {new_cols}); END"
+        )
+        if created:
+            # Index rows that predate the FTS table (or a rebuilt tips table).
+            cur.execute("INSERT INTO tips_fts(tips_fts) VALUES ('rebuild')")
+        return True
+
+    def has_fulltext(self, cur) -> bool:
+        cur.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tips_fts'")
+        return cur.fetchone() is not None
+
+    def fulltext_match(self, terms: List[str]) -> Tuple[str, str, list, str, list]:
+        # Quoted prefix terms, implicitly ANDed; bm25 weights favour the tip name.
+        # bm25() is lower-is-better, so negate it for a higher-is-better score.
+        query = " ".join('"{}"*'.format(term.replace('"', '""')) for term in terms)
+        return ("tips JOIN tips_fts ON tips_fts.rowid = tips.id",
+                "-bm25(tips_fts, 4.0, 2.0, 2.0, 1.0)", [], "tips_fts MATCH %s", [query])
+
+    def describe(self) -> str:
+        return f"SQLite {self.path}"
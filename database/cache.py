@@ -0,0 +1,211 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set
+
+from .records import INTERNED_FIELDS, TipRecord
+
+# Read cache used by Database for tip queries. Entries are keyed by query shape
+# (method + arguments) and remember which tips they contain and which filters
+# produced them, so a write only evicts the entries it can actually affect.
+# A shared version counter (data_versions table) catches other clients' writes.
+# Tip rows are read-only TipRecords, so they are shared with callers as is; only
+# the lists and page dicts around them are copied.
+
+
+def _matches(filters: Dict[str, Any], fields: Dict[str, Any]) -> bool:
+    """Could a tip with ``fields`` satisfy ``filters``? Unknown columns count as a match."""
+    for key, wanted in filters.items():
+        if key not in fields:
+            continue
+        value = fields[key]
+        if isinstance(value, str) and isinstance(wanted, str):
+            # MySQL compares text case-insensitively (and SQLite columns are NOCASE)
+            if value.lower() != wanted.lower():
+                return False
+        elif value != wanted:
+            return False
+    return True
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate deep size in bytes of cached rows (records, dicts, lists of scalars)."""
+    size = sys.getsizeof(value)
+    if isinstance(value, TipRecord):
+        # Interned strings are shared by every record, so they cost nothing per row
+        size += sum(estimate_size(v) for k, v in value.items() if k not in INTERNED_FIELDS)
+    elif isinstance(value, dict):
+        size += sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple)):
+        size += sum(estimate_size(v) for v in value)
+    return size
+
+
+def copy_rows(value: Any) -> Any:
+    """Shallow-copy rows so callers can't mutate what the cache holds."""
+    if isinstance(value, list):
+        return [dict(v) if isinstance(v, dict) else v for v in value]
+    if isinstance(value, dict):
+        out = dict(value)
+        if isinstance(out.get("rows"), list):
+            out["rows"] = copy_rows(out["rows"])
+        return out
+    return value
+
+
+class _Entry:
+    __slots__ = ("value", "size", "ids", "filters", "columns")
+
+    def __init__(self, value, size, ids, filters, columns):
+        self.value = value
+        self.size = size
+        self.ids = ids          # tip ids in the result; None = depends on every tip
+        self.filters = filters  # equality filters of a list query, if any
+        self.columns = columns  # other columns whose change can reorder/extend it
+
+
+class TipCache:
+    """Thread-safe LRU of query results, capped by entry count and estimated bytes."""
+
+    def __init__(self, max_entries: int = 2048, max_bytes: int = 16 * 1024 * 1024,
+                 version_check_interval: float = 2.0):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.version_check_interval = version_check_interval
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._bytes = 0
+        # Bumped by every invalidation so a load that raced with a write is not stored
+        self._generation = 0
+        self.version: Optional[int] = None
+        self._checked_at = 0.0
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0, "version_resets": 0}
+
+    # ---------- Lookup ----------
+    def get(self, key: Hashable):
+        """Return (True, copy of value) on a hit, (False, None) on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return True, copy_rows(entry.value)
+
+    def generation(self) -> int:
+        """Token to take before loading a value and hand back to put()."""
+        return self._generation
+
+    def put(self, key: Hashable, value: Any, ids: Optional[Iterable[int]] = None,
+            filters: Optional[Dict[str, Any]] = None, columns: Iterable[str] = (),
+            generation: Optional[int] = None):
+        """Store ``value``; ``ids`` lists the tips it contains (None: all tips).
+
+        ``filters`` are the equality filters that selected the rows and
+        ``columns`` any other columns (sort key, searched text) an update of
+        which may pull a tip into the result. With ``generation`` the value is
+        dropped if something was invalidated since that token was taken.
+        """
+        value = copy_rows(value)
+        entry = _Entry(value, estimate_size(value), set(ids) if ids is not None else None,
+                       filters, frozenset(columns))
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.size
+            self._entries[key] = entry
+            self._bytes += entry.size
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+                self._stats["evictions"] += 1
+
+    # ---------- Invalidation ----------
+    def _drop_where(self, predicate: Callable[[Hashable, _Entry], bool]):
+        with self._lock:
+            self._generation += 1
+            doomed = [key for key, entry in self._entries.items() if predicate(key, entry)]
+            for key in doomed:
+                self._bytes -= self._entries.pop(key).size
+            self._stats["invalidations"] += len(doomed)
+
+    def tips_created(self, rows: List[Dict[str, Any]]):
+        """Drop aggregate results and lists whose filters any new tip may satisfy."""
+        self._drop_where(lambda key, e: e.ids is None or (
+            e.filters is not None and any(_matches(e.filters, fields) for fields in rows)))
+
+    def tip_updated(self, tip_id: int, updates: Dict[str, Any], write_through: Set[str]):
+        """Drop results containing the tip, or that it may have joined.
+
+        The tip's own entry is patched in place when only ``write_through``
+        columns changed, so the next read_tip is still a hit.
+        """
+        own_key = ("tip", tip_id)
+        patch = set(updates) <= write_through
+
+        def affected(key, e):
+            if key == own_key:
+                return not patch or e.value is None
+            if e.ids is None or tip_id in e.ids or not e.columns.isdisjoint(updates):
+                return True
+            touched = {k: v for k, v in updates.items() if k in (e.filters or {})}
+            return bool(touched) and _matches(e.filters, touched)
+
+        self._drop_where(affected)
+        if patch:
+            with self._lock:
+                entry = self._entries.get(own_key)
+                if entry is not None:
+                    if isinstance(entry.value, TipRecord):
+                        entry.value = entry.value.replace(**updates)
+                    else:
+                        entry.value.update(updates)
+
+    def tip_deleted(self, tip_id: int):
+        self._drop_where(lambda key, e: key == ("tip", tip_id) or e.ids is None or tip_id in e.ids)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._bytes = 0
+
+    # ---------- Cross-client changes ----------
+    def version_due(self) -> bool:
+        """True when it's time to compare the shared data version again."""
+        return time.monotonic() - self._checked_at >= self.version_check_interval
+
+    def observe_version(self, version: int, local_write: bool = False):
+        """Record the shared data version; anything unexpected clears the cache.
+
+        After our own write the version moves by exactly one; any other change
+        means another client wrote, and we can't tell what, so start over.
+        """
+        with self._lock:
+            self._checked_at = time.monotonic()
+            expected = self.version + 1 if local_write and self.version is not None else self.version
+            if version != expected and self.version is not None:
+                self._generation += 1
+                self._entries.clear()
+                self._bytes = 0
+                self._stats["version_resets"] += 1
+            self.version = version
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            out = dict(self._stats)
+            out.update(
+                entries=len(self._entries),
+                bytes=self._bytes,
+                max_bytes=self.max_bytes,
+                hit_rate=self._stats["hits"] / lookups if lookups else 0.0,
+                version=self.version,
+            )
+            return out
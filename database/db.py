@@ -1,142 +1,741 @@
-import mysql.connector
-import hashlib
-from typing import Optional, Dict, Any, List
+import base64
+import datetime
+import json
+import re
+import threading
+import time
+import unicodedata
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Tuple
+
+from . import migrations
+from .backends import SEARCH_COLUMNS, get_backend
+from .cache import TipCache
+from .incident_rules import DEFAULT_RULES, IncidentRules
+from .login_guard import LoginGuard
+from .metrics import CountingCursor, QueryStats
+from .passwords import PasswordHasher
+from .pool import ConnectionPool
+from .records import TipRecord, read_records
+
+# Columns of the tips table that callers may filter on.
+TIP_COLUMNS = {"id", "tip_name", "incident_type", "location", "description",
+               "urgency", "created_by", "created_at", "status", "row_version", "updated_at"}
+
+# Columns create_tips accepts. status/created_at are only sent when given, so
+# the table defaults apply otherwise; the rest mirror create_tip.
+TIP_INSERT_COLUMNS = ("tip_name", "incident_type", "location", "description", "urgency", "created_by")
+TIP_OPTIONAL_INSERT_COLUMNS = ("status", "created_at")
+# Character limits from the MySQL schema, checked up front so both backends
+# reject the same rows.
+TIP_TEXT_LIMITS = {"tip_name": 255, "incident_type": 255, "location": 255,
+                   "description": 500, "urgency": 50, "status": 50}
+
+# Row of the data_versions table bumped by every tip write, so read caches in
+# other processes can tell their copies are stale (see database.cache).
+DATA_VERSION_NAME = "tips"
+# Every write stamps the rows it touches with the new data version (tips.row_version,
+# or a tip_tombstones row for deletes), which is what changes_since() reads.
+# Only the newest TOMBSTONES_KEPT tombstones are kept; the version up to which
+# older ones were purged is stored under TOMBSTONE_HORIZON_NAME.
+TOMBSTONE_HORIZON_NAME = "tip_tombstones"
+TOMBSTONES_KEPT = 10000
+# Each client prunes after this many of its own deletes, so the table stays near TOMBSTONES_KEPT.
+TOMBSTONE_PRUNE_EVERY = 500
+# Row of data_versions bumped by every incident_rules write; get_incident_rules
+# recompiles the rules only when it moves. Bump it after editing the table by hand.
+RULES_VERSION_NAME = "incident_rules"
+# Columns of an incident_rules row, in the order add_incident_rule takes them.
+RULE_COLUMNS = ("field_name", "kind", "value", "incident_type", "message")
+# What a login reads (and, minus the hash, returns) from users.
+LOGIN_COLUMNS = ("id", "username", "email", "role", "password_hash")
+# Columns whose new value update_tip can patch straight into a cached row;
+# others (created_at, created_by) are re-read so types match the database's.
+# updated_at is set by the server, so update_tip reads it back before patching.
+CACHE_WRITE_THROUGH = {"tip_name", "incident_type", "location", "description", "urgency", "status",
+                       "row_version", "updated_at"}
+
+# Sort keys accepted by read_tips_page, mapped to the SQL expression ordered on.
+# Urgency and status sort by rank (Low < Medium < High, Pending < Investigating
+# < Resolved) to match ManageTipsFrame; unknown values sort last.
+SORT_EXPRESSIONS = {
+    "created_at": "created_at",
+    "tip_name": "tip_name",
+    "incident_type": "incident_type",
+    "location": "location",
+    "urgency": "(CASE LOWER(urgency) WHEN 'low' THEN 0 WHEN 'medium' THEN 1 "
+               "WHEN 'high' THEN 2 ELSE 99 END)",
+    "status": "(CASE LOWER(status) WHEN 'pending' THEN 0 WHEN 'investigating' THEN 1 "
+              "WHEN 'resolved' THEN 2 ELSE 99 END)",
+}
+
+# Extra sort key for searches: best full-text match first (needs ``search``).
+RELEVANCE_SORT = "relevance"
+
+# Dimensions accepted by count_tips, mapped to their GROUP BY expression.
+COUNT_DIMENSIONS = {
+    "urgency": "urgency",
+    "status": "status",
+    "incident_type": "incident_type",
+    "day": "DATE(created_at)",
+}
+
+# Secondary indexes on tips: one per sortable column, each ending in id so the
+# keyset predicate (value, id) can be answered from the index. _ensure_indexes
+# creates missing ones and rebuilds any whose columns differ from these; it runs
+# as a schema migration, so a change here needs a new one in database.migrations.
+TIP_INDEXES = {
+    "idx_tips_created_at": "(created_at, id)",
+    "idx_tips_tip_name": "(tip_name, id)",
+    "idx_tips_incident_type": "(incident_type, id)",
+    "idx_tips_location": "(location, id)",
+    # urgency/status are filtered on far more than sorted by their raw value
+    # (list sorts use the rank indexes below), so these also carry created_at:
+    # read_tips({"urgency": ...}) ORDER BY created_at DESC is an index range read.
+    "idx_tips_urgency": "(urgency, created_at, id)",
+    "idx_tips_status": "(status, created_at, id)",
+    # Composites for count_tips: urgency x status badges, and a covering index
+    # for any grouping restricted to a created_at window.
+    "idx_tips_urgency_status": "(urgency, status)",
+    "idx_tips_created_dims": "(created_at, urgency, status, incident_type)",
+    # Functional indexes for the rank sorts (MySQL 8.0.13+; skipped elsewhere).
+    "idx_tips_urgency_rank": f"(({SORT_EXPRESSIONS['urgency']}), id)",
+    "idx_tips_status_rank": f"(({SORT_EXPRESSIONS['status']}), id)",
+    # Change feed: rows written after a watermark.
+    "idx_tips_row_version": "(row_version)",
+}
+
+
+def _index_key_columns(spec: str) -> Optional[List[str]]:
+    """Columns of a TIP_INDEXES definition, or None if it has expression parts."""
+    inner = spec.strip()[1:-1]
+    if "(" in inner:
+        return None
+    return [c.strip() for c in inner.split(",")]
+
+
+def _as_id(tip_id):
+    """Tip ids arrive as int or str from the UI; cache keys use int."""
+    try:
+        return int(tip_id)
+    except (TypeError, ValueError):
+        return tip_id
+
+
+def _freeze(filters: Optional[dict]) -> tuple:
+    """Hashable form of a filters dict, for cache keys."""
+    return tuple(sorted((filters or {}).items()))
+
+
+def _tip_insert_values(fields) -> Tuple[Tuple[str, ...], tuple]:
+    """Validate one tip for create_tips; returns (columns, values) or raises ValueError."""
+    if not isinstance(fields, dict):
+        raise ValueError(f"expected a mapping of tip fields, got {type(fields).__name__}")
+    columns = TIP_INSERT_COLUMNS + tuple(c for c in TIP_OPTIONAL_INSERT_COLUMNS if fields.get(c) is not None)
+    values = []
+    for col in columns:
+        value = fields.get(col)
+        if col == "created_by":
+            if value is not None and not isinstance(value, int):
+                try:
+                    value = int(value)
+                except (TypeError, ValueError):
+                    raise ValueError(f"created_by must be a user id, got {value!r}") from None
+        elif col == "created_at":
+            if not isinstance(value, datetime.datetime):
+                try:
+                    value = datetime.datetime.fromisoformat(str(value))
+                except ValueError:
+                    raise ValueError(f"created_at is not an ISO date/time: {value!r}") from None
+        elif value is not None:
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                value = str(value)
+            if not isinstance(value, str):
+                raise ValueError(f"{col} must be text, got {type(value).__name__}")
+            if len(value) > TIP_TEXT_LIMITS[col]:
+                raise ValueError(f"{col} is longer than {TIP_TEXT_LIMITS[col]} characters")
+        values.append(value)
+    return columns, tuple(values)
+
+
+def _encode_cursor(sort: str, descending: bool, value: Any, last_id: int) -> str:
+    """Pack the position after the last row of a page into an opaque token."""
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        value = value.isoformat(sep=" ") if isinstance(value, datetime.datetime) else value.isoformat()
+    raw = json.dumps([sort, bool(descending), value, last_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(token: str):
+    """Inverse of _encode_cursor. Raises ValueError for malformed tokens."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        sort, descending, value, last_id = json.loads(base64.urlsafe_b64decode(padded))
+    except Exception as e:
+        raise ValueError("Invalid page cursor.") from e
+    if sort not in SORT_EXPRESSIONS and sort != RELEVANCE_SORT:
+        raise ValueError("Invalid page cursor.")
+    return sort, bool(descending), value, int(last_id)
+
+
+def _keyset_clause(expr: str, descending: bool, value: Any, last_id: int):
+    """WHERE fragment selecting rows strictly after (value, last_id) in sort order.
+
+    NULLs sort first ascending and last descending (MySQL and SQLite agree), so
+    they are handled explicitly instead of relying on NULL comparisons.
+    """
+    if not descending:
+        if value is None:
+            return f"(({expr} IS NULL AND id > %s) OR {expr} IS NOT NULL)", [last_id]
+        return f"({expr} > %s OR ({expr} = %s AND id > %s))", [value, value, last_id]
+    if value is None:
+        return f"({expr} IS NULL AND id < %s)", [last_id]
+    return f"({expr} < %s OR ({expr} = %s AND id < %s) OR {expr} IS NULL)", [value, value, last_id]
+
+
+def _search_terms(text: str, min_length: int = 1) -> List[str]:
+    """Split free text into lowercase word terms usable as full-text prefixes."""
+    return [t for t in re.findall(r"[^\W_]+", text.lower()) if len(t) >= min_length]
+
+
+def _fold(text: str) -> str:
+    """Lowercase and strip accents, like the full-text tokenizers do."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def row_matches_search(plan, row: Dict[str, Any]) -> bool:
+    """Evaluate a Database.search_plan() against a tip row in memory.
+
+    Mirrors the SQL: for ("fulltext", terms) every term must start a word in one
+    of SEARCH_COLUMNS; for ("like", text) the text must occur in one of them.
+    """
+    mode, value = plan
+    texts = [_fold(str(row.get(col) or "")) for col in SEARCH_COLUMNS]
+    if mode == "like":
+        needle = _fold(value)
+        return any(needle in text for text in texts)
+    words = [w for text in texts for w in re.findall(r"[^\W_]+", text)]
+    return all(any(w.startswith(_fold(term)) for w in words) for term in value)
+
+
+# Python mirrors of the rank CASE expressions in SORT_EXPRESSIONS.
+_SORT_RANKS = {
+    "urgency": {"low": 0, "medium": 1, "high": 2},
+    "status": {"pending": 0, "investigating": 1, "resolved": 2},
+}
+
+
+def row_sort_key(sort: str, row: Dict[str, Any]) -> tuple:
+    """Ascending key of ``row`` under ORDER BY SORT_EXPRESSIONS[sort], id.
+
+    Lets callers place a changed row into an already sorted list without a
+    query. NULLs come first, as they do in SQL; text compares case-insensitively
+    like the column collations.
+    """
+    value = row.get(sort)
+    if sort in _SORT_RANKS:
+        value = _SORT_RANKS[sort].get(str(value).lower() if value is not None else None, 99)
+    elif isinstance(value, str):
+        value = value.lower()
+    return (value is not None, value if value is not None else 0, row.get("id") or 0)
 
 
 class Database:
-    """MySQL Database connection and CRUD operations with automatic schema management."""
+    """Database connection and CRUD operations with automatic schema management.
+
+    The storage engine (MySQL or SQLite) is chosen by config["backend"]; see
+    database.backends.
+    """
 
     def __init__(self, config: dict):
         self.config = config.copy()
-        conn_args = {
-            "host": self.config.get("host", "localhost"),
-            "user": self.config.get("user", "root"),
-            "password": self.config.get("password", "password"),
-            "database": self.config.get("database", "TattleStoolie_DB"),
-        }
         self.autocommit = bool(self.config.get("autocommit", False))
-        self.conn = mysql.connector.connect(**conn_args)
-        self.conn.autocommit = self.autocommit
-        self.cursor = self.conn.cursor(dictionary=True)
+        self.backend = get_backend(self.config)
+        # Single-connection mode keeps one connection/cursor guarded by a lock;
+        # pooled mode (config["pool"]["enabled"]) lets callers run in parallel.
+        self._lock = threading.RLock()
+        self._session_depth = 0
+        # Every statement is counted so screens can report their round-trips.
+        self.stats = QueryStats()
+        self.pool: Optional[ConnectionPool] = None
+        self.conn = None
+        self.cursor = None
+        # Whether search can use the full-text index; looked up on first search
+        # unless a migration just created it.
+        self._fulltext: Optional[bool] = None
+        # Background thread applying online schema migrations, if any are pending.
+        self.migration_thread: Optional[threading.Thread] = None
+        # Deletes since tombstones were last pruned (see delete_tip).
+        self._deletes_since_prune = 0
+        # Compiled validation rules and when their version was last checked.
+        self._rules: Optional[IncidentRules] = None
+        self._rules_checked = 0.0
+        # Read cache for tip queries; None when config["cache"]["enabled"] is off.
+        self.cache: Optional[TipCache] = None
+        cache_cfg = self.config.get("cache") or {}
+        self._rules_check_interval = float(cache_cfg.get("version_check_interval", 2.0))
+        if cache_cfg.get("enabled", True):
+            self.cache = TipCache(
+                max_entries=int(cache_cfg.get("max_entries", 2048)),
+                max_bytes=int(float(cache_cfg.get("max_mb", 16)) * 1024 * 1024),
+                version_check_interval=float(cache_cfg.get("version_check_interval", 2.0)),
+            )
+        # Password hashing/verification with its own bounded worker pool.
+        self.passwords = PasswordHasher.from_config(self.config.get("passwords"))
+        # Negative cache and failed-attempt throttle in front of logins.
+        self.login_guard = LoginGuard.from_config(self.config.get("login"))
+        pool_cfg = self.config.get("pool") or {}
+        if pool_cfg.get("enabled"):
+            self.pool = ConnectionPool(
+                self._connect,
+                size=int(pool_cfg.get("size", 5)),
+                min_size=int(pool_cfg.get("min_size", 1)),
+                timeout=float(pool_cfg.get("timeout", 10.0)),
+                health_check=self.backend.is_alive if pool_cfg.get("health_check", True) else None,
+                health_check_interval=float(pool_cfg.get("health_check_interval", 30.0)),
+                idle_timeout=float(pool_cfg.get("idle_timeout", 300.0)),
+            )
+        else:
+            self.conn = self._connect()
+            self.cursor = CountingCursor(self.backend.cursor(self.conn), self.stats)
         self._ensure_schema()
 
-    def _ensure_schema(self):
-        """Create tables if missing and apply schema migrations."""
-        self.cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS users (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                username VARCHAR(255) UNIQUE NOT NULL,
-                email VARCHAR(255),
-                password_hash CHAR(64) NOT NULL,
-                role VARCHAR(50) NOT NULL DEFAULT 'reporter'
-            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
-            """
-        )
-        self.cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS tips (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                tip_name VARCHAR(255),
-                incident_type VARCHAR(255),
-                location VARCHAR(255),
-                description VARCHAR(500),
-                urgency VARCHAR(50),
-                created_by INT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                status VARCHAR(50) DEFAULT 'Pending',
-                FOREIGN KEY (created_by) REFERENCES users(id) ON DELETE SET NULL
-            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
-            """
-        )
-        # Migrate legacy schema if needed
+    # ---------- Connection handling ----------
+    def _connect(self):
+        """Open a new connection through the configured backend."""
+        return self.backend.connect()
+
+    @contextmanager
+    def _session(self):
+        """Yield a (connection, dict cursor) pair; rolls back on error.
+
+        The transaction is always ended on the way out, reads included: under
+        REPEATABLE READ an open read transaction would keep serving the next
+        caller (or the next borrower of a pooled connection) its old snapshot.
+        """
+        if self.pool is None:
+            with self._lock:
+                self._session_depth += 1
+                try:
+                    yield self.conn, self.cursor
+                except Exception:
+                    self._rollback(self.conn)
+                    raise
+                else:
+                    # Nested sessions share the connection; only the outermost ends the transaction
+                    if self._session_depth == 1:
+                        self._commit(self.conn)
+                finally:
+                    self._session_depth -= 1
+            return
+        with self.pool.connection() as conn:
+            cur = CountingCursor(self.backend.cursor(conn), self.stats)
+            try:
+                yield conn, cur
+            except Exception:
+                self._rollback(conn)
+                raise
+            else:
+                self._commit(conn)
+            finally:
+                try:
+                    cur.close()
+                except Exception:
+                    pass
+
+    @contextmanager
+    def _own_session(self):
+        """Like _session(), but on a connection of its own, outside the pool and the lock.
+
+        For long background work (online migrations) that must not hold up
+        other callers. Falls back to _session() when a second connection would
+        not see the same database.
+        """
+        if not self.backend.shared_connections:
+            with self._session() as session:
+                yield session
+            return
+        conn = self._connect()
+        cur = CountingCursor(self.backend.cursor(conn), self.stats)
         try:
-            self.cursor.execute(
-                """
-                SELECT COLUMN_NAME FROM INFORMATION_SCHEMA.COLUMNS
-                WHERE TABLE_SCHEMA=%s AND TABLE_NAME='tips' AND COLUMN_NAME IN ('id','tips_ID')
-                """,
-                (self.config.get("database", "TattleStoolie_DB"),),
-            )
-            cols = {row["COLUMN_NAME"] for row in self.cursor.fetchall()}
+            yield conn, cur
         except Exception:
-            cols = set()
-        
-        # Migrate tips.description from TEXT to VARCHAR(500) if needed
+            self._rollback(conn)
+            raise
+        else:
+            self._commit(conn)
+        finally:
+            for resource in (cur, conn):
+                try:
+                    resource.close()
+                except Exception:
+                    pass
+
+    @contextmanager
+    def _tuple_cursor(self, conn):
+        """Cursor on ``conn`` that yields plain tuples (turn them into TipRecords with read_records)."""
+        cur = CountingCursor(self.backend.cursor(conn, tuples=True), self.stats)
         try:
-            self.cursor.execute(
-                """
-                SELECT DATA_TYPE FROM INFORMATION_SCHEMA.COLUMNS
-                WHERE TABLE_SCHEMA=%s AND TABLE_NAME='tips' AND COLUMN_NAME='description'
-                """,
-                (self.config.get("database", "TattleStoolie_DB"),),
-            )
-            row = self.cursor.fetchone()
-            if row and row["DATA_TYPE"].lower() == "text":
-                self.cursor.execute("SELECT MAX(CHAR_LENGTH(description)) AS maxlen FROM tips")
-                maxlen = self.cursor.fetchone()["maxlen"] or 0
-                if maxlen <= 500:
-                    self.cursor.execute("ALTER TABLE tips MODIFY description VARCHAR(500)")
-        except Exception:
-            pass
-        
+            yield cur
+        finally:
+            try:
+                cur.close()
+            except Exception:
+                pass
+
+    def _commit(self, conn):
         if not self.autocommit:
-            self.conn.commit()
+            conn.commit()
+
+    def _rollback(self, conn):
+        if not self.autocommit:
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+
+    def _ensure_schema(self):
+        """Apply pending schema migrations; a current schema costs one version query."""
+        background = (self.config.get("migrations") or {}).get("online_in_background", True)
+        self.migration_thread = migrations.run(self, background=background)
+
+    def _ensure_indexes(self, cur, conn=None):
+        """Create missing secondary indexes on tips and rebuild ones defined differently.
+
+        One catalogue lookup, then only the differences. With ``conn`` each index
+        is committed as it is built. Planner statistics are refreshed after any change.
+        """
+        try:
+            existing = self.backend.index_columns(cur, "tips")
+        except Exception:
+            return
+        changed = []
+        for name, columns in TIP_INDEXES.items():
+            if name in existing:
+                expected = _index_key_columns(columns)
+                actual = [c.lower() if c else c for c in existing[name]]
+                if expected is None or not actual or actual == expected:
+                    continue
+                print(f"[Database] Index {name} is on ({', '.join(map(str, actual))}); rebuilding as {columns}")
+                try:
+                    cur.execute(self.backend.drop_index_sql(name, "tips"))
+                except Exception as e:
+                    print(f"[Database] Could not drop index {name}: {e}")
+                    continue
+            try:
+                cur.execute(self.backend.create_index_sql(name, "tips", columns, online=True))
+                changed.append(name)
+            except Exception as e:
+                # Functional indexes need MySQL 8.0.13+; older servers just sort unindexed.
+                print(f"[Database] Could not create index {name}: {e}")
+            if conn is not None:
+                self._commit(conn)
+        if changed:
+            print(f"[Database] Created indexes: {', '.join(changed)}")
+            self._analyze(cur)
+
+    def _analyze(self, cur):
+        try:
+            self.backend.analyze(cur, "tips")
+        except Exception as e:
+            print(f"[Database] Could not refresh statistics: {e}")
+
+    def refresh_statistics(self):
+        """Recompute planner statistics for tips (e.g. after a large import)."""
+        with self._session() as (conn, cur):
+            self._analyze(cur)
+            self._commit(conn)
+
+    def explain(self, sql: str, params=()) -> Tuple[List[str], List[str]]:
+        """Plan of a statement without running it: (plan lines, scan/sort warnings)."""
+        with self._session() as (conn, cur):
+            try:
+                return self.backend.explain(cur, sql, params or ())
+            finally:
+                self._rollback(conn)
+
+    def _ensure_fulltext(self, cur):
+        """Create the full-text index used by search; searches fall back to LIKE without it."""
+        try:
+            self.fulltext = bool(self.backend.ensure_fulltext(cur))
+        except Exception as e:
+            print(f"[Database] Full-text index unavailable: {e}")
+            self.fulltext = False
+
+    @property
+    def fulltext(self) -> bool:
+        """True when searches go through the full-text index."""
+        if self._fulltext is None:
+            try:
+                with self._session() as (conn, cur):
+                    self._fulltext = bool(self.backend.has_fulltext(cur))
+                    self._commit(conn)
+            except Exception as e:
+                print(f"[Database] Could not check for the full-text index: {e}")
+                self._fulltext = False
+        return self._fulltext
+
+    @fulltext.setter
+    def fulltext(self, value: bool):
+        self._fulltext = value
+
+    def _ensure_data_version(self, cur):
+        """Seed the change counter rows used to notice other clients' writes."""
+        for name in (DATA_VERSION_NAME, TOMBSTONE_HORIZON_NAME):
+            cur.execute("SELECT version FROM data_versions WHERE name=%s", (name,))
+            if cur.fetchone() is None:
+                try:
+                    cur.execute("INSERT INTO data_versions (name, version) VALUES (%s, 0)", (name,))
+                except self.backend.integrity_errors:
+                    pass  # another client seeded it first
 
-    @staticmethod
-    def hash_password(password: str) -> str:
-        """SHA-256 hash a password string."""
-        return hashlib.sha256(password.encode("utf-8")).hexdigest()
+    def _prune_tombstones(self, cur):
+        """Keep the newest TOMBSTONES_KEPT delete markers and record the purge horizon."""
+        cur.execute("SELECT version FROM tip_tombstones ORDER BY version DESC LIMIT 1 OFFSET %s",
+                    (TOMBSTONES_KEPT,))
+        row = cur.fetchone()
+        if row:
+            cur.execute("DELETE FROM tip_tombstones WHERE version <= %s", (row["version"],))
+            cur.execute("UPDATE data_versions SET version=%s WHERE name=%s AND version < %s",
+                        (row["version"], TOMBSTONE_HORIZON_NAME, row["version"]))
+
+    # ---------- Read cache ----------
+    def data_version(self) -> int:
+        """Current value of the shared tips change counter."""
+        with self._session() as (conn, cur):
+            cur.execute("SELECT version FROM data_versions WHERE name=%s", (DATA_VERSION_NAME,))
+            row = cur.fetchone()
+            # Ends the read transaction too, so a REPEATABLE READ snapshot on a
+            # long-lived MySQL connection doesn't hide other clients' writes.
+            self._commit(conn)
+        return int(row["version"]) if row else 0
+
+    def _bump_version(self, cur) -> int:
+        """Advance the change counter inside the caller's write transaction.
+
+        Call it before writing: the row lock on data_versions then orders
+        concurrent writers, so versions become visible in increasing order.
+        """
+        cur.execute("UPDATE data_versions SET version = version + 1 WHERE name=%s", (DATA_VERSION_NAME,))
+        cur.execute("SELECT version FROM data_versions WHERE name=%s", (DATA_VERSION_NAME,))
+        row = cur.fetchone()
+        return int(row["version"]) if row else 0
+
+    def _cached(self, key, load, ids=None, filters=None, columns=(), prime=False):
+        """Serve ``key`` from the read cache, or call ``load()`` and remember its result.
+
+        ``ids(result)`` lists the tips in the result (None: any tip write drops
+        it); ``filters``/``columns`` are described in TipCache.put. With
+        ``prime`` the full rows of a list are also cached for read_tip.
+        """
+        cache = self.cache
+        if cache is None:
+            return load()
+        if cache.version_due():
+            cache.observe_version(self.data_version())
+        hit, value = cache.get(key)
+        if hit:
+            return value
+        token = cache.generation()
+        value = load()
+        cache.put(key, value, ids(value) if ids else None, filters, columns, generation=token)
+        if prime:
+            for row in value["rows"] if isinstance(value, dict) else value:
+                if TIP_COLUMNS <= row.keys():
+                    cache.put(("tip", row["id"]), row, (row["id"],), generation=token)
+        return value
+
+    def _note_write(self, version: int, invalidate):
+        """After a committed tip write: drop affected cache entries, record the version."""
+        if self.cache is not None:
+            invalidate(self.cache)
+            self.cache.observe_version(version, local_write=True)
+
+    def cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Read cache counters (hits, misses, hit_rate, entries, bytes...), or None when disabled."""
+        return self.cache.stats() if self.cache else None
+
+    def hash_password(self, password: str) -> str:
+        """Salted KDF hash of a password (see database.passwords)."""
+        return self.passwords.hash(password)
 
     def create_user(self, username: str, email: str, password: str, role: str = "reporter") -> bool:
         """Create a new user. Returns True on success, False if username already exists."""
         sql = "INSERT INTO users (username, email, password_hash, role) VALUES (%s,%s,%s,%s)"
         try:
-            self.cursor.execute(sql, (username, email, self.hash_password(password), role))
-            if not self.autocommit:
-                self.conn.commit()
+            with self._session() as (conn, cur):
+                cur.execute(sql, (username, email, self.hash_password(password), role))
+                self._commit(conn)
+            self.login_guard.forget(username)
             return True
-        except mysql.connector.IntegrityError:
+        except self.backend.integrity_errors:
             return False
         except Exception:
             return False
 
-    def get_user_by_credentials(self, username: str, password: str) -> Optional[Dict[str, Any]]:
-        """Retrieve user by username and password (hashed). Returns None if not found."""
-        sql = "SELECT * FROM users WHERE username=%s AND password_hash=%s"
-        self.cursor.execute(sql, (username, self.hash_password(password)))
-        return self.cursor.fetchone()
+    def get_user_by_credentials(self, username: str, password: str,
+                                source: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Retrieve user by username and password. Returns None if not found or wrong.
+
+        Reads only the login columns through the unique username index; the hash
+        is checked on the password pool with no connection held, and one made
+        with an older scheme or cost (including legacy SHA-256) is replaced.
+        Raises LoginThrottled after too many recent failures for the username
+        or ``source`` (client address, when there is one); repeats of a failure
+        within a few seconds skip the query. Every failed login runs one key
+        derivation (against a dummy hash when the user is unknown or the
+        failure is cached), so failures all take about the same time.
+        """
+        guard = self.login_guard
+        guard.check(username, source)
+        if guard.known_bad(username, password):
+            # Still derive a key: a cached failure must take as long as any
+            # other, or repeat probes would tell unknown usernames apart
+            self.passwords.verify(password, self.passwords.dummy_hash())
+            guard.failed(username, password, source, remember=False)
+            return None
+        with self._session() as (conn, cur):
+            cur.execute(f"SELECT {', '.join(LOGIN_COLUMNS)} FROM users WHERE username=%s", (username,))
+            row = cur.fetchone()
+            self._commit(conn)
+        # Unknown usernames still pay for a key derivation, so timing doesn't reveal them
+        stored = row["password_hash"] if row is not None else self.passwords.dummy_hash()
+        if not self.passwords.verify(password, stored) or row is None:
+            guard.failed(username, password, source, user_exists=row is not None)
+            return None
+        guard.succeeded(username, source)
+        if self.passwords.needs_rehash(row["password_hash"]):
+            self._rehash_password(row, password)
+        return {k: v for k, v in row.items() if k != "password_hash"}
+
+    def _rehash_password(self, row: Dict[str, Any], password: str):
+        new_hash = self.passwords.hash(password)
+        try:
+            with self._session() as (conn, cur):
+                # Guarded by the old hash so a concurrent password change wins
+                cur.execute("UPDATE users SET password_hash=%s WHERE id=%s AND password_hash=%s",
+                            (new_hash, row["id"], row["password_hash"]))
+                self._commit(conn)
+            row["password_hash"] = new_hash
+        except Exception as e:
+            print(f"[Database] Could not upgrade password hash for user {row['id']}: {e}")
 
     def seed_admin(self, username: str, password: str, email: str = "admin@example.com"):
         """Create or update an admin user."""
         hashed = self.hash_password(password)
-        try:
-            self.cursor.execute(
-                "INSERT INTO users (username, email, password_hash, role) VALUES (%s,%s,%s,%s)",
-                (username, email, hashed, "admin"),
-            )
-        except mysql.connector.IntegrityError:
-            self.cursor.execute(
-                "UPDATE users SET password_hash=%s, role=%s, email=%s WHERE username=%s",
-                (hashed, "admin", email, username),
-            )
-        if not self.autocommit:
-            self.conn.commit()
+        with self._session() as (conn, cur):
+            try:
+                cur.execute(
+                    "INSERT INTO users (username, email, password_hash, role) VALUES (%s,%s,%s,%s)",
+                    (username, email, hashed, "admin"),
+                )
+            except self.backend.integrity_errors:
+                cur.execute(
+                    "UPDATE users SET password_hash=%s, role=%s, email=%s WHERE username=%s",
+                    (hashed, "admin", email, username),
+                )
+            self._commit(conn)
+        self.login_guard.forget(username)
 
     def create_tip(self, fields: dict) -> int:
         """Create a new tip. Returns the inserted id."""
-        sql = """INSERT INTO tips (tip_name, incident_type, location, description, urgency, created_by)
-                 VALUES (%s,%s,%s,%s,%s,%s)"""
-        self.cursor.execute(sql, (
-            fields.get("tip_name"), fields.get("incident_type"), fields.get("location"),
-            fields.get("description"), fields.get("urgency"), fields.get("created_by")
-        ))
-        if not self.autocommit:
-            self.conn.commit()
-        return self.cursor.lastrowid
+        sql = """INSERT INTO tips (tip_name, incident_type, location, description, urgency, created_by, row_version)
+                 VALUES (%s,%s,%s,%s,%s,%s,%s)"""
+        with self._session() as (conn, cur):
+            version = self._bump_version(cur)
+            cur.execute(sql, (
+                fields.get("tip_name"), fields.get("incident_type"), fields.get("location"),
+                fields.get("description"), fields.get("urgency"), fields.get("created_by"), version
+            ))
+            tip_id = cur.lastrowid
+            self._commit(conn)
+        self._note_write(version, lambda cache: cache.tips_created([fields]))
+        return tip_id
+
+    def create_tips(self, tips: Iterable[dict], batch_size: int = 500, collect_ids: bool = True) -> Dict[str, Any]:
+        """Insert many tips: multi-row INSERTs and one commit per ``batch_size`` rows.
 
-    def read_tips(self, filters: dict = None) -> List[Dict[str, Any]]:
-        """Retrieve all tips, optionally filtered by column values."""
+        ``tips`` may be any iterable (e.g. a generator over a file); it is consumed
+        one batch at a time. A row that fails validation or is rejected by the
+        database (e.g. unknown created_by) is reported and skipped; the rest of
+        its batch is still inserted. Returns {"inserted": n, "failed": [{"index",
+        "error"}], "ids": [...], "batches": n}, where ids[i] is the id of input
+        row i (None if it failed) and is omitted when ``collect_ids`` is False.
+        """
+        batch_size = max(1, int(batch_size))
+        result: Dict[str, Any] = {"inserted": 0, "failed": [], "batches": 0}
+        if collect_ids:
+            result["ids"] = []
+        batch, offset = [], 0
+        for fields in tips:
+            batch.append(fields)
+            if len(batch) >= batch_size:
+                self._insert_tip_batch(batch, offset, result)
+                offset += len(batch)
+                batch = []
+        if batch:
+            self._insert_tip_batch(batch, offset, result)
+        return result
+
+    def _insert_tip_batch(self, batch: List[dict], offset: int, result: Dict[str, Any]):
+        """Insert one batch in one transaction; ``offset`` is its first row's input index."""
+        ids: Dict[int, int] = {}
+        errors: Dict[int, str] = {}
+        # Rows with the same column set share a statement (usually the whole batch)
+        groups: Dict[Tuple[str, ...], List[Tuple[int, tuple]]] = {}
+        for i, fields in enumerate(batch):
+            try:
+                columns, values = _tip_insert_values(fields)
+            except ValueError as e:
+                errors[i] = str(e)
+                continue
+            groups.setdefault(columns, []).append((i, values))
+
+        version = None
+        with self._session() as (conn, cur):
+            if groups:
+                version = self._bump_version(cur)
+            for columns, rows in groups.items():
+                columns += ("row_version",)
+                rows = [(i, values + (version,)) for i, values in rows]
+                per_statement = max(1, self.backend.max_bind_params // len(columns))
+                one_row = "(" + ",".join(["%s"] * len(columns)) + ")"
+                head = f"INSERT INTO tips ({', '.join(columns)}) VALUES "
+                for start in range(0, len(rows), per_statement):
+                    chunk = rows[start:start + per_statement]
+                    try:
+                        cur.execute(head + ",".join([one_row] * len(chunk)),
+                                    tuple(v for _, values in chunk for v in values))
+                        ids.update(zip((i for i, _ in chunk), self.backend.inserted_ids(cur, len(chunk))))
+                    except self.backend.row_errors:
+                        # The failed statement inserted nothing; retry its rows one
+                        # by one so only the offending ones are dropped.
+                        for i, values in chunk:
+                            try:
+                                cur.execute(head + one_row, values)
+                                ids[i] = cur.lastrowid
+                            except self.backend.row_errors as e:
+                                errors[i] = str(e)
+            self._commit(conn)
+        if version is not None:
+            self._note_write(version, lambda cache: cache.tips_created([batch[i] for i in ids]))
+
+        result["batches"] += 1
+        result["inserted"] += len(ids)
+        result["failed"].extend({"index": offset + i, "error": errors[i]} for i in sorted(errors))
+        if "ids" in result:
+            result["ids"].extend(ids.get(i) for i in range(len(batch)))
+
+    def read_tips(self, filters: dict = None) -> List[TipRecord]:
+        """Retrieve all tips, optionally filtered by column values (cached).
+
+        Rows are TipRecords (read-only, dict-like); see database.records.
+        """
+        return self._cached(("tips", _freeze(filters)), lambda: self._read_tips(filters),
+                            ids=lambda rows: [r["id"] for r in rows], filters=dict(filters or {}), prime=True)
+
+    def _read_tips(self, filters: dict = None) -> List[TipRecord]:
         q = "SELECT * FROM tips"
         params = []
         if filters:
@@ -146,17 +745,202 @@ class Database:
                 params.append(v)
             q += " WHERE " + " AND ".join(clauses)
         q += " ORDER BY created_at DESC"
-        self.cursor.execute(q, tuple(params))
-        return self.cursor.fetchall()
+        with self._session() as (conn, _), self._tuple_cursor(conn) as cur:
+            cur.execute(q, tuple(params))
+            # Iterate the cursor so each tuple is freed once its record is built
+            return read_records(cur.description, cur)
+
+    def iter_tips(self, filters: dict = None, chunk_size: int = 1000,
+                  columns: Optional[List[str]] = None) -> Iterator[List[Dict[str, Any]]]:
+        """Stream tips in id order as lists of up to ``chunk_size`` rows.
+
+        Uses a server-side (unbuffered) cursor, so memory stays at one chunk no
+        matter how large the table is. ``filters`` works like read_tips. The
+        connection (and, without pooling, the shared one's lock) is held until
+        the generator is exhausted or closed. Full rows are TipRecords; with
+        ``columns`` each row is a dict of just those columns.
+        """
+        columns = list(columns or [])
+        for col in list(columns) + list(filters or {}):
+            if col not in TIP_COLUMNS:
+                raise ValueError(f"Unknown tip column '{col}'.")
+        q = f"SELECT {', '.join(columns) if columns else '*'} FROM tips"
+        params = []
+        if filters:
+            q += " WHERE " + " AND ".join(f"{k}=%s" for k in filters)
+            params = list(filters.values())
+        q += " ORDER BY id"
+        chunk_size = max(1, int(chunk_size))
+
+        with self._session() as (conn, _):
+            cur = CountingCursor(self.backend.stream_cursor(conn, tuples=not columns), self.stats)
+            finished = False
+            try:
+                cur.execute(q, tuple(params))
+                while True:
+                    rows = cur.fetchmany(chunk_size)
+                    if not rows:
+                        finished = True
+                        return
+                    yield rows if columns else read_records(cur.description, rows)
+            finally:
+                if not finished:
+                    self.backend.end_stream(conn, cur)
+                try:
+                    cur.close()
+                except Exception:
+                    pass
+
+    def read_tips_after(self, after_id: int = 0, limit: int = 1000) -> List[TipRecord]:
+        """Up to ``limit`` tips with id above ``after_id``, in id order (not cached).
+
+        A primary-key range read: callers can walk the whole table in short
+        queries without holding a connection in between, unlike iter_tips.
+        """
+        sql = "SELECT * FROM tips WHERE id > %s ORDER BY id LIMIT %s"
+        with self._session() as (conn, _), self._tuple_cursor(conn) as cur:
+            cur.execute(sql, (int(after_id), max(1, int(limit))))
+            return read_records(cur.description, cur.fetchall())
+
+    def read_tips_page(
+        self,
+        filters: dict = None,
+        sort: str = "created_at",
+        descending: bool = True,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Retrieve one page of tips using keyset (seek) pagination.
+
+        Rows are ordered by ``sort`` then ``id``. Returns ``{"rows": [...],
+        "next_cursor": token_or_None}``; pass the token back as ``cursor`` to get
+        the following page. ``search`` keeps tips containing every word of the
+        query as a word prefix in any of SEARCH_COLUMNS (full-text index), and
+        enables ``sort="relevance"``. Pages are cached like read_tips.
+        """
+        columns = set(SEARCH_COLUMNS) if search else set()
+        if sort in SORT_EXPRESSIONS:
+            columns.add(sort)
+        # The plan mode is part of the key: full-text and LIKE can match different rows
+        mode = self.search_plan(search)[0] if search else None
+        key = ("page", _freeze(filters), sort, bool(descending), limit, cursor, search, mode)
+        return self._cached(key, lambda: self._read_tips_page(filters, sort, descending, limit, cursor, search),
+                            ids=lambda page: [r["id"] for r in page["rows"]], filters=dict(filters or {}),
+                            columns=columns, prime=True)
+
+    def _read_tips_page(self, filters, sort, descending, limit, cursor, search) -> Dict[str, Any]:
+        if sort == RELEVANCE_SORT:
+            if not search:
+                raise ValueError("Relevance ordering needs a search query.")
+            expr = "_score"
+        elif sort in SORT_EXPRESSIONS:
+            expr = SORT_EXPRESSIONS[sort]
+        else:
+            raise ValueError(f"Cannot sort tips by '{sort}'.")
+        limit = max(1, int(limit))
 
-    def read_tip(self, tip_id: int) -> Optional[Dict[str, Any]]:
-        """Retrieve a single tip by id."""
+        clauses, params = [], []
+        for k, v in (filters or {}).items():
+            if k not in TIP_COLUMNS:
+                raise ValueError(f"Unknown tip column '{k}'.")
+            clauses.append(f"tips.{k}=%s")
+            params.append(v)
+        source = "tips"
+        if search:
+            # Match (and any filters) in a derived table; sorting and paging apply to it.
+            source, params = self._search_source(search, clauses, params)
+            clauses = []
+        if cursor:
+            c_sort, c_desc, value, last_id = _decode_cursor(cursor)
+            if c_sort != sort or c_desc != bool(descending):
+                raise ValueError("Page cursor does not match the requested ordering.")
+            clause, extra = _keyset_clause(expr, c_desc, value, last_id)
+            clauses.append(clause)
+            params.extend(extra)
+
+        direction = "DESC" if descending else "ASC"
+        q = f"SELECT *, {expr} AS _sort_value FROM {source}"
+        if clauses:
+            q += " WHERE " + " AND ".join(clauses)
+        # Fetch one extra row to learn whether another page exists.
+        q += f" ORDER BY {expr} {direction}, id {direction} LIMIT %s"
+        params.append(limit + 1)
+
+        with self._session() as (conn, _), self._tuple_cursor(conn) as cur:
+            cur.execute(q, tuple(params))
+            raw = cur.fetchall()
+            description = cur.description
+        names = [col[0] for col in description]
+
+        next_cursor = None
+        if len(raw) > limit:
+            raw = raw[:limit]
+            last = raw[-1]
+            next_cursor = _encode_cursor(sort, descending, last[names.index("_sort_value")],
+                                         last[names.index("id")])
+        return {"rows": read_records(description, raw), "next_cursor": next_cursor}
+
+    def _search_source(self, search: str, clauses: List[str], params: list):
+        """Derived table of tips matching ``search`` plus ``clauses``, with a _score column."""
+        mode, value = self.search_plan(search)
+        if mode == "fulltext":
+            source, score, score_params, match, match_params = self.backend.fulltext_match(value)
+            where = [match] + clauses
+            params = score_params + match_params + params
+        else:
+            # No full-text index (or only words too short for it): substring scan.
+            pattern = "%" + value.replace("!", "!!").replace("%", "!%").replace("_", "!_") + "%"
+            source, score = "tips", "0"
+            where = ["(" + " OR ".join(f"tips.{c} LIKE %s ESCAPE '!'" for c in SEARCH_COLUMNS) + ")"] + clauses
+            params = [pattern] * len(SEARCH_COLUMNS) + params
+        sql = f"SELECT tips.*, {score} AS _score FROM {source} WHERE {' AND '.join(where)}"
+        return f"({sql}) AS matched", params
+
+    def search_plan(self, search: str):
+        """How ``search`` is matched: ("fulltext", [terms]) or ("like", text).
+
+        Lets callers (e.g. the incremental search cache) reproduce the match in
+        memory with row_matches_search().
+        """
+        terms = _search_terms(search, self.backend.fulltext_min_token)
+        if self.fulltext and terms:
+            return "fulltext", terms
+        return "like", search.strip()
+
+    def search_tips(
+        self,
+        query: str,
+        filters: dict = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Full-text search across tip name, type, location and description.
+
+        Every word of ``query`` must appear as a word prefix ("bur lob" finds
+        "Burglary" in the "Lobby"); best matches come first. Paginated like
+        read_tips_page. An empty query returns the newest tips.
+        """
+        if not (query or "").strip():
+            return self.read_tips_page(filters, limit=limit, cursor=cursor)
+        return self.read_tips_page(filters, sort=RELEVANCE_SORT, descending=True,
+                                   limit=limit, cursor=cursor, search=query)
+
+    def read_tip(self, tip_id: int) -> Optional[TipRecord]:
+        """Retrieve a single tip by id (cached; rows listed by read_tips/read_tips_page are hits)."""
+        tip_id = _as_id(tip_id)
+        return self._cached(("tip", tip_id), lambda: self._read_tip(tip_id), ids=lambda row: [tip_id])
+
+    def _read_tip(self, tip_id: int) -> Optional[TipRecord]:
         sql = "SELECT * FROM tips WHERE id=%s"
-        self.cursor.execute(sql, (tip_id,))
-        return self.cursor.fetchone()
+        with self._session() as (conn, _), self._tuple_cursor(conn) as cur:
+            cur.execute(sql, (tip_id,))
+            rows = read_records(cur.description, cur.fetchall())
+            return rows[0] if rows else None
 
     def update_tip(self, tip_id: int, updates: dict) -> bool:
         """Update tip fields. Returns True if a row was modified."""
+        updates = {k: v for k, v in updates.items() if k not in ("row_version", "updated_at")}
         if not updates:
             return False
         assignments = []
@@ -164,37 +948,251 @@ class Database:
         for key, val in updates.items():
             assignments.append(f"{key}=%s")
             params.append(val)
-        params.append(tip_id)
-        sql = f"UPDATE tips SET {', '.join(assignments)} WHERE id=%s"
-        self.cursor.execute(sql, tuple(params))
-        if not self.autocommit:
-            self.conn.commit()
-        return self.cursor.rowcount > 0
+        sql = f"UPDATE tips SET {', '.join(assignments)}, row_version=%s, updated_at=CURRENT_TIMESTAMP WHERE id=%s"
+        with self._session() as (conn, cur):
+            version = self._bump_version(cur)
+            cur.execute(sql, tuple(params) + (version, tip_id))
+            changed = cur.rowcount > 0
+            if changed:
+                written = dict(updates, row_version=version)
+                if self.cache is not None:
+                    # The server's clock stamped the row; patch the cached tip with that value
+                    cur.execute("SELECT updated_at FROM tips WHERE id=%s", (tip_id,))
+                    written["updated_at"] = cur.fetchone()["updated_at"]
+                self._commit(conn)
+            else:
+                self._rollback(conn)  # no such tip: undo the version bump
+        if changed:
+            self._note_write(version, lambda cache: cache.tip_updated(_as_id(tip_id), written, CACHE_WRITE_THROUGH))
+        return changed
 
     def delete_tip(self, tip_id: int) -> bool:
-        """Delete a tip by id. Returns True if deleted."""
+        """Delete a tip by id, leaving a tombstone for changes_since(). Returns True if deleted."""
         sql = "DELETE FROM tips WHERE id=%s"
-        self.cursor.execute(sql, (tip_id,))
-        if not self.autocommit:
-            self.conn.commit()
-        return self.cursor.rowcount > 0
+        with self._session() as (conn, cur):
+            version = self._bump_version(cur)
+            cur.execute(sql, (tip_id,))
+            deleted = cur.rowcount > 0
+            if deleted:
+                cur.execute("INSERT INTO tip_tombstones (version, tip_id) VALUES (%s, %s)", (version, tip_id))
+                self._deletes_since_prune += 1
+                if self._deletes_since_prune >= TOMBSTONE_PRUNE_EVERY:
+                    self._prune_tombstones(cur)
+                    self._deletes_since_prune = 0
+                self._commit(conn)
+            else:
+                self._rollback(conn)
+        if deleted:
+            self._note_write(version, lambda cache: cache.tip_deleted(_as_id(tip_id)))
+        return deleted
+
+    # ---------- Change feed ----------
+    def change_watermark(self) -> int:
+        """Data version to start changes_since() from, for rows read after this call.
+
+        With the read cache on this is the version the cache was last validated
+        against, so rows it serves are never newer than the watermark implies.
+        """
+        if self.cache is not None and self.cache.version is not None:
+            return self.cache.version
+        return self.data_version()
+
+    def changes_since(self, watermark: int, limit: int = 1000) -> Dict[str, Any]:
+        """Tips written after ``watermark`` (a data version), for incremental refresh.
 
-    def get_all_incidents(self) -> List[Dict[str, Any]]:
+        Returns {"version", "changed": [rows], "deleted": [ids], "reset"}; pass
+        ``version`` back as the next watermark. When nothing changed this costs a
+        single primary-key lookup. "reset" is True (and the lists are empty) when
+        more than ``limit`` tips changed or the tombstones needed were purged;
+        the caller should then reload from scratch.
+        """
+        with self._session() as (conn, cur):
+            cur.execute("SELECT name, version FROM data_versions WHERE name IN (%s, %s)",
+                        (DATA_VERSION_NAME, TOMBSTONE_HORIZON_NAME))
+            versions = {row["name"]: int(row["version"]) for row in cur.fetchall()}
+            version = versions.get(DATA_VERSION_NAME, 0)
+            result = {"version": version, "changed": [], "deleted": [], "reset": False}
+            if version <= watermark:
+                result["version"] = watermark
+            elif watermark < versions.get(TOMBSTONE_HORIZON_NAME, 0):
+                result["reset"] = True
+            else:
+                # Bounded by version: later writes are picked up by the next call
+                with self._tuple_cursor(conn) as tuple_cur:
+                    tuple_cur.execute("SELECT * FROM tips WHERE row_version > %s AND row_version <= %s "
+                                      "ORDER BY row_version, id LIMIT %s", (watermark, version, limit + 1))
+                    changed = read_records(tuple_cur.description, tuple_cur.fetchall())
+                if len(changed) > limit:
+                    result["reset"] = True
+                else:
+                    cur.execute("SELECT tip_id FROM tip_tombstones WHERE version > %s AND version <= %s",
+                                (watermark, version))
+                    result["changed"] = changed
+                    result["deleted"] = [row["tip_id"] for row in cur.fetchall()]
+            # End the read transaction so the next poll sees new commits
+            self._commit(conn)
+        return result
+
+    def get_all_incidents(self) -> List[TipRecord]:
         """Retrieve all tips (alias for read_tips)."""
         return self.read_tips()
 
-    def get_incidents_by_urgency(self, urgency: str) -> List[Dict[str, Any]]:
+    def get_incidents_by_urgency(self, urgency: str) -> List[TipRecord]:
         """Retrieve tips filtered by urgency level."""
         return self.read_tips({"urgency": urgency})
 
-    def get_incident_rules(self):
-        """Return tip validation rules."""
-        return {"min_description_length": 20}
+    def dashboard_snapshot(self, per_urgency_limit: int = 50) -> List[Dict[str, Any]]:
+        """Rows needed by the dashboard, with per-urgency totals, in one round-trip.
+
+        Returns at most ``per_urgency_limit`` newest tips per urgency value; every
+        row carries ``urgency_total``, the full count for its urgency. Urgencies
+        with no rows are absent.
+        """
+        sql = """
+            SELECT id, tip_name, incident_type, urgency, created_at, urgency_total FROM (
+                SELECT id, tip_name, incident_type, urgency, created_at,
+                       ROW_NUMBER() OVER (PARTITION BY urgency ORDER BY created_at DESC, id DESC) AS rn,
+                       COUNT(*) OVER (PARTITION BY urgency) AS urgency_total
+                FROM tips
+            ) ranked
+            WHERE rn <= %s
+            ORDER BY created_at DESC, id DESC
+        """
+        def load():
+            with self._session() as (conn, cur):
+                cur.execute(sql, (int(per_urgency_limit),))
+                return cur.fetchall()
+        return self._cached(("dashboard", int(per_urgency_limit)), load)
+
+    def count_tips(
+        self,
+        group_by=("urgency",),
+        since=None,
+        until=None,
+        filters: dict = None,
+    ) -> List[Dict[str, Any]]:
+        """Grouped tip counts computed server-side.
+
+        ``group_by`` is any combination of "urgency", "status", "incident_type"
+        and "day" (DATE(created_at)). ``since``/``until`` restrict created_at to
+        [since, until). Returns rows like {"urgency": "High", "count": 12}.
+        """
+        if isinstance(group_by, str):
+            group_by = (group_by,)
+        dims = list(group_by)
+        unknown = [d for d in dims if d not in COUNT_DIMENSIONS]
+        if unknown:
+            raise ValueError(f"Cannot group tips by {', '.join(unknown)}.")
+
+        clauses, params = [], []
+        if since is not None:
+            clauses.append("created_at >= %s")
+            params.append(since)
+        if until is not None:
+            clauses.append("created_at < %s")
+            params.append(until)
+        for k, v in (filters or {}).items():
+            if k not in TIP_COLUMNS:
+                raise ValueError(f"Unknown tip column '{k}'.")
+            clauses.append(f"{k}=%s")
+            params.append(v)
+
+        select = [f"{COUNT_DIMENSIONS[d]} AS {d}" for d in dims] + ["COUNT(*) AS count"]
+        q = f"SELECT {', '.join(select)} FROM tips"
+        if clauses:
+            q += " WHERE " + " AND ".join(clauses)
+        if dims:
+            exprs = ", ".join(COUNT_DIMENSIONS[d] for d in dims)
+            q += f" GROUP BY {exprs} ORDER BY {exprs}"
+
+        def load():
+            with self._session() as (conn, cur):
+                cur.execute(q, tuple(params))
+                rows = cur.fetchall()
+            for row in rows:
+                row["count"] = int(row["count"])
+                # SQLite returns DATE() as text; normalise to date like MySQL.
+                if isinstance(row.get("day"), str):
+                    row["day"] = datetime.date.fromisoformat(row["day"])
+            return rows
+        return self._cached(("counts", q, tuple(params)), load)
+
+    # ---------- Validation rules ----------
+    def _ensure_incident_rules(self, cur):
+        """Seed the rules version row and, for a new table, the default rules."""
+        cur.execute("SELECT version FROM data_versions WHERE name=%s", (RULES_VERSION_NAME,))
+        if cur.fetchone() is None:
+            try:
+                cur.execute("INSERT INTO data_versions (name, version) VALUES (%s, 0)", (RULES_VERSION_NAME,))
+            except self.backend.integrity_errors:
+                pass  # another client seeded it first
+        cur.execute("SELECT COUNT(*) AS n FROM incident_rules")
+        if int(cur.fetchone()["n"]) == 0:
+            for rule in DEFAULT_RULES:
+                cur.execute(f"INSERT INTO incident_rules ({', '.join(RULE_COLUMNS)}) VALUES (%s, %s, %s, %s, %s)",
+                            tuple(rule.get(col) for col in RULE_COLUMNS))
+
+    def get_incident_rules(self) -> IncidentRules:
+        """Tip validation rules from the incident_rules table, compiled.
+
+        The compiled rules are reused until the rules' data version changes;
+        the version is looked up at most every ``version_check_interval``
+        seconds (config["cache"]), so most calls cost nothing.
+        """
+        rules = self._rules
+        now = time.monotonic()
+        if rules is not None and now - self._rules_checked < self._rules_check_interval:
+            return rules
+        with self._session() as (conn, cur):
+            cur.execute("SELECT version FROM data_versions WHERE name=%s", (RULES_VERSION_NAME,))
+            row = cur.fetchone()
+            version = int(row["version"]) if row else 0
+            if rules is None or rules.version != version:
+                cur.execute(f"SELECT id, {', '.join(RULE_COLUMNS)} FROM incident_rules ORDER BY id")
+                rules = IncidentRules(cur.fetchall(), version=version)
+            self._commit(conn)
+        self._rules, self._rules_checked = rules, now
+        return rules
+
+    def add_incident_rule(self, field_name: str, kind: str, value=None, incident_type: Optional[str] = None,
+                          message: Optional[str] = None) -> int:
+        """Store one validation rule (see database.incident_rules.RULE_KINDS); returns its id.
+
+        Raises ValueError for a rule that would not compile.
+        """
+        values = (field_name, kind, None if value is None else str(value), incident_type, message)
+        IncidentRules([dict(zip(RULE_COLUMNS, values))])
+        with self._session() as (conn, cur):
+            cur.execute("UPDATE data_versions SET version = version + 1 WHERE name=%s", (RULES_VERSION_NAME,))
+            cur.execute(f"INSERT INTO incident_rules ({', '.join(RULE_COLUMNS)}) VALUES (%s, %s, %s, %s, %s)",
+                        values)
+            rule_id = cur.lastrowid
+            self._commit(conn)
+        self._rules_checked = 0.0  # the version moved: recompile on next use
+        return rule_id
+
+    def delete_incident_rule(self, rule_id: int) -> bool:
+        """Remove a validation rule; returns False if there was none with that id."""
+        with self._session() as (conn, cur):
+            cur.execute("UPDATE data_versions SET version = version + 1 WHERE name=%s", (RULES_VERSION_NAME,))
+            cur.execute("DELETE FROM incident_rules WHERE id=%s", (int(rule_id),))
+            deleted = cur.rowcount > 0
+            self._commit(conn)
+        self._rules_checked = 0.0  # the version moved: recompile on next use
+        return deleted
+
+    def pool_stats(self) -> Optional[Dict[str, Any]]:
+        """Return connection pool counters, or None in single-connection mode."""
+        return self.pool.stats() if self.pool else None
 
     def close(self):
-        """Close database connection."""
+        """Close database connection(s)."""
         try:
-            self.cursor.close()
-            self.conn.close()
+            self.passwords.close()
+            if self.pool is not None:
+                self.pool.close()
+            else:
+                self.cursor.close()
+                self.conn.close()
         except Exception:
-            pass
\ No newline at end of file
+            pass
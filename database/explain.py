@@ -0,0 +1,156 @@
+"""Index advisor: EXPLAIN every statement Database issues and flag scans.
+
+Runs a workload that calls each Database read path (lists, filters, every sort
+order and its next page, searches, counts, the dashboard, the change feed,
+logins) with the read cache off, records each distinct statement through
+QueryStats listeners and prints its plan. Full table scans and sorts no index
+serves are flagged.
+
+By default the configured database is examined with reads only. ``--scratch N``
+instead fills a throwaway SQLite file with N synthetic tips (planner statistics
+refreshed) and also covers the write statements.
+
+    python -m database.explain
+    python -m database.explain --scratch 20000 --strict
+"""
+import argparse
+import datetime
+import os
+import random
+import shutil
+import sys
+import tempfile
+from typing import Any, Dict, List, Tuple
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from config import DB as DB_CONFIG
+from database.db import Database, SORT_EXPRESSIONS
+
+# Statements worth a plan; INSERTs, DDL and pragmas have nothing to choose.
+EXPLAINABLE = ("SELECT", "UPDATE", "DELETE")
+
+# Flags that no index can remove; reported, but not counted against --strict.
+ACCEPTED = {
+    "search_tips(full-text)": "relevance order is computed per match",
+    "count_tips(day, window)": "groups on DATE(created_at), read in created_at order",
+    "dashboard_snapshot": "window function over every tip, one pass",
+    "iter_tips(urgency)": "exports read a large share of the table in id order",
+}
+
+
+def _seed(db: Database, count: int):
+    rng = random.Random(14)
+    start = datetime.datetime(2024, 1, 1)
+    db.create_tips(({
+        "tip_name": f"tip {i} {rng.choice(['burglary', 'fraud', 'lobby', 'garage', 'smoke'])}",
+        "incident_type": rng.choice(["Theft", "Fraud", "Vandalism", "Harassment", "Other"]),
+        "location": rng.choice(["Lobby", "Annex", "Garage", "Roof", "Cafeteria"]),
+        "description": "synthetic tip for the index advisor",
+        "urgency": rng.choice(["Low", "Medium", "High"]),
+        "status": rng.choice(["Pending", "Investigating", "Resolved"]),
+        "created_at": start + datetime.timedelta(minutes=rng.randint(0, 500000)),
+    } for i in range(count)), batch_size=2000, collect_ids=False)
+    db.refresh_statistics()
+
+
+def _workload(db: Database, writes: bool):
+    """Yield (label, call) pairs covering every statement shape Database issues."""
+    yield "read_tips()", lambda: db.read_tips()
+    yield "read_tips(urgency)", lambda: db.read_tips({"urgency": "High"})
+    yield "read_tips(status)", lambda: db.read_tips({"status": "Pending"})
+    yield "read_tips(urgency, status)", lambda: db.read_tips({"urgency": "High", "status": "Pending"})
+    for sort in SORT_EXPRESSIONS:
+        for descending in (False, True):
+            def page(sort=sort, descending=descending):
+                first = db.read_tips_page(sort=sort, descending=descending, limit=50)
+                if first["next_cursor"]:
+                    db.read_tips_page(sort=sort, descending=descending, limit=50, cursor=first["next_cursor"])
+            yield f"read_tips_page({sort}, {'desc' if descending else 'asc'})", page
+    yield "read_tips_page(urgency filter)", lambda: db.read_tips_page({"urgency": "High"}, limit=50)
+    yield "search_tips(full-text)", lambda: db.search_tips("burglary lob")
+    yield "search_tips(LIKE fallback)", lambda: db.search_tips("#1")
+    yield "count_tips(urgency)", lambda: db.count_tips(("urgency",))
+    yield "count_tips(urgency, status)", lambda: db.count_tips(("urgency", "status"))
+    yield "count_tips(day, window)", lambda: db.count_tips(
+        ("day",), since=datetime.datetime(2024, 3, 1), until=datetime.datetime(2024, 4, 1))
+    yield "count_tips(type, status filter)", lambda: db.count_tips(("incident_type",), filters={"status": "Pending"})
+    yield "dashboard_snapshot", lambda: db.dashboard_snapshot(50)
+    yield "read_tip", lambda: db.read_tip(1)
+    yield "read_tips_after", lambda: db.read_tips_after(100, 1000)
+    yield "changes_since", lambda: db.changes_since(max(0, db.data_version() - 5))
+    yield "iter_tips(urgency)", lambda: next(db.iter_tips({"urgency": "High"}, chunk_size=100), None)
+    yield "get_user_by_credentials", lambda: db.get_user_by_credentials("nobody", "not-a-password")
+    if writes:
+        yield "update_tip", lambda: db.update_tip(2, {"status": "Investigating"})
+        yield "delete_tip", lambda: db.delete_tip(3)
+        yield "seed_admin", lambda: db.seed_admin("advisor-admin", "advisor-password")
+
+
+def _collect(db: Database, writes: bool) -> List[Tuple[str, str, Any]]:
+    """Run the workload; returns distinct (label, sql, params) in first-seen order."""
+    seen: Dict[str, Tuple[str, str, Any]] = {}
+    label = ""
+
+    def record(sql, params=None):
+        key = " ".join(str(sql).split())
+        if key.split(" ", 1)[0].upper() in EXPLAINABLE and key not in seen:
+            seen[key] = (label, key, params)
+
+    db.stats.add_listener(record)
+    try:
+        for label, call in _workload(db, writes):
+            call()
+    finally:
+        db.stats.remove_listener(record)
+    return list(seen.values())
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scratch", type=int, metavar="N",
+                        help="examine a throwaway SQLite file with N synthetic tips (includes writes)")
+    parser.add_argument("--strict", action="store_true", help="exit with status 1 if anything is flagged")
+    args = parser.parse_args()
+
+    tmpdir = None
+    # Indexes come from an online migration; build them before looking at plans.
+    config = dict(DB_CONFIG, cache=dict(DB_CONFIG.get("cache") or {}, enabled=False),
+                  migrations={"online_in_background": False})
+    if args.scratch is not None:
+        tmpdir = tempfile.mkdtemp(prefix="tattle-explain-")
+        config.update(backend="sqlite", pool={"enabled": False},
+                      sqlite=dict(DB_CONFIG.get("sqlite") or {}, path=os.path.join(tmpdir, "explain.db")))
+    db = Database(config)
+    try:
+        if args.scratch is not None:
+            _seed(db, args.scratch)
+        statements = _collect(db, writes=args.scratch is not None)
+        flagged = 0
+        for label, sql, params in statements:
+            lines, warnings = db.explain(sql, params)
+            if not warnings:
+                verdict = "ok"
+            elif label in ACCEPTED:
+                verdict = f"accepted ({ACCEPTED[label]})"
+            else:
+                verdict = "FLAGGED"
+                flagged += 1
+            print(f"[Explain] {label}: {verdict}")
+            print(f"    {sql[:160]}{'...' if len(sql) > 160 else ''}")
+            for line in lines:
+                print(f"      {line}")
+            for warning in warnings:
+                print(f"    !! {warning}")
+        print(f"[Explain] {len(statements)} statements on {db.backend.describe()}: {flagged} flagged")
+    finally:
+        db.close()
+        if tmpdir:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+    return 1 if args.strict and flagged else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+import csv
+import datetime
+import io
+import json
+import struct
+import time
+import zlib
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional
+
+# Export tips to CSV, JSONL or a compact columnar file, streaming from
+# Database.iter_tips so memory is bounded by one chunk regardless of table size.
+
+EXPORT_COLUMNS = ["id", "tip_name", "incident_type", "location", "description",
+                  "urgency", "created_by", "created_at", "status"]
+
+COLUMNAR_MAGIC = b"TSCOL1\n"
+
+
+def _text(value: Any) -> Any:
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat(sep=" ") if isinstance(value, datetime.datetime) else value.isoformat()
+    return value
+
+
+class CsvWriter:
+    """CSV with a header row; NULLs become empty cells."""
+
+    binary = False
+
+    def __init__(self, fh, columns: List[str]):
+        self.columns = columns
+        self._writer = csv.writer(fh)
+        self._writer.writerow(columns)
+
+    def write_rows(self, rows: List[Dict[str, Any]]):
+        self._writer.writerows([_text(row.get(c)) for c in self.columns] for row in rows)
+
+    def close(self):
+        pass
+
+
+class JsonlWriter:
+    """One JSON object per line; NULLs are kept as null."""
+
+    binary = False
+
+    def __init__(self, fh, columns: List[str]):
+        self.columns = columns
+        self._fh = fh
+
+    def write_rows(self, rows: List[Dict[str, Any]]):
+        self._fh.write("".join(
+            json.dumps({c: _text(row.get(c)) for c in self.columns}, ensure_ascii=False) + "\n" for row in rows
+        ))
+
+    def close(self):
+        pass
+
+
+class ColumnarWriter:
+    """Row-group columnar file in the spirit of Parquet, without a dependency.
+
+    Layout: COLUMNAR_MAGIC, then one block per row group: a 4-byte big-endian
+    length followed by a zlib-compressed JSON document
+    ``{"rows": n, "columns": {name: encoded}}``. A column is stored either as
+    ``{"values": [...]}`` or, when it repeats a lot (urgency, status, type),
+    dictionary-encoded as ``{"dict": [...], "codes": [...]}``. Storing each column
+    contiguously lets zlib exploit the repetition; read_columnar() reads it back.
+    """
+
+    binary = True
+
+    def __init__(self, fh: BinaryIO, columns: List[str], row_group_size: int = 10000):
+        self.columns = columns
+        self.row_group_size = row_group_size
+        self._fh = fh
+        self._pending: List[Dict[str, Any]] = []
+        fh.write(COLUMNAR_MAGIC)
+
+    def write_rows(self, rows: List[Dict[str, Any]]):
+        self._pending.extend(rows)
+        while len(self._pending) >= self.row_group_size:
+            group, self._pending = self._pending[:self.row_group_size], self._pending[self.row_group_size:]
+            self._write_group(group)
+
+    def _encode_column(self, values: List[Any]) -> Dict[str, Any]:
+        distinct: Dict[Any, int] = {}
+        for v in values:
+            if v not in distinct:
+                distinct[v] = len(distinct)
+                if len(distinct) * 2 > len(values):
+                    return {"values": values}
+        return {"dict": list(distinct), "codes": [distinct[v] for v in values]}
+
+    def _write_group(self, rows: List[Dict[str, Any]]):
+        doc = {
+            "rows": len(rows),
+            "columns": {c: self._encode_column([_text(row.get(c)) for row in rows]) for c in self.columns},
+        }
+        block = zlib.compress(json.dumps(doc, ensure_ascii=False, separators=(",", ":")).encode("utf-8"), 6)
+        self._fh.write(struct.pack(">I", len(block)))
+        self._fh.write(block)
+
+    def close(self):
+        if self._pending:
+            self._write_group(self._pending)
+            self._pending = []
+
+
+def read_columnar(fh: BinaryIO) -> Iterator[Dict[str, Any]]:
+    """Yield the rows of a file written by ColumnarWriter, one row group at a time."""
+    if fh.read(len(COLUMNAR_MAGIC)) != COLUMNAR_MAGIC:
+        raise ValueError("Not a TattleStoolie columnar export.")
+    while True:
+        header = fh.read(4)
+        if not header:
+            return
+        (length,) = struct.unpack(">I", header)
+        doc = json.loads(zlib.decompress(fh.read(length)))
+        columns = {}
+        for name, enc in doc["columns"].items():
+            columns[name] = [enc["dict"][i] for i in enc["codes"]] if "dict" in enc else enc["values"]
+        for i in range(doc["rows"]):
+            yield {name: values[i] for name, values in columns.items()}
+
+
+EXPORT_FORMATS = {
+    "csv": CsvWriter,
+    "jsonl": JsonlWriter,
+    "columnar": ColumnarWriter,
+}
+
+
+def export_tips(
+    db,
+    fh,
+    fmt: str = "csv",
+    filters: Optional[dict] = None,
+    columns: Optional[List[str]] = None,
+    chunk_size: int = 2000,
+    progress: Optional[Callable[[int, float], None]] = None,
+) -> Dict[str, Any]:
+    """Stream tips matching ``filters`` into the open file ``fh``.
+
+    ``fh`` must be binary for "columnar" and text (newline="") otherwise.
+    ``progress(rows_so_far, seconds)`` is called after every chunk. Returns
+    {"rows", "seconds", "rows_per_sec"}.
+    """
+    writer_cls = EXPORT_FORMATS.get(fmt)
+    if writer_cls is None:
+        raise ValueError(f"Unknown export format '{fmt}'. Choose one of: {', '.join(EXPORT_FORMATS)}")
+    if writer_cls.binary != (not isinstance(fh, io.TextIOBase)):
+        raise ValueError(f"The {fmt} format needs a {'binary' if writer_cls.binary else 'text'} file.")
+    columns = list(columns or EXPORT_COLUMNS)
+
+    writer = writer_cls(fh, columns)
+    count = 0
+    start = time.perf_counter()
+    for rows in db.iter_tips(filters, chunk_size=chunk_size, columns=columns):
+        writer.write_rows(rows)
+        count += len(rows)
+        if progress:
+            progress(count, time.perf_counter() - start)
+    writer.close()
+    seconds = time.perf_counter() - start
+    return {"rows": count, "seconds": seconds, "rows_per_sec": count / seconds if seconds > 0 else 0.0}
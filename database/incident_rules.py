@@ -0,0 +1,159 @@
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Tip validation rules, stored one per row in the incident_rules table and
+# compiled into IncidentRules. A rule applies to every tip (incident_type NULL)
+# or to one incident type (matched case-insensitively, like the column
+# collations). Compiling turns each rule into a function over a whole column of
+# values, so validating a batch costs one list comprehension per rule rather
+# than a chain of checks per row. Database.get_incident_rules() keeps the
+# compiled rules until the incident_rules data version changes.
+
+# kind -> what ``value`` holds
+RULE_KINDS = {
+    "required": None,           # field must be present and not blank
+    "min_length": "int",        # at least this many characters (surrounding spaces ignored)
+    "max_length": "int",        # at most this many characters
+    "allowed": "list",          # one of these comma-separated values
+}
+
+# Seeded by the migration that creates the table; they are the checks the API
+# and GenericIncident made before rules lived in the database.
+DEFAULT_RULES = (
+    {"field_name": "tip_name", "kind": "required"},
+    {"field_name": "incident_type", "kind": "required"},
+    {"field_name": "location", "kind": "required"},
+    {"field_name": "description", "kind": "required"},
+    {"field_name": "description", "kind": "min_length", "value": "20"},
+    {"field_name": "urgency", "kind": "allowed", "value": "Low,Medium,High"},
+)
+
+# Error vector of a row that passed: one shared empty tuple
+VALID: Tuple[str, ...] = ()
+
+# column values -> indexes of the values that fail
+Finder = Callable[[Sequence[Any]], Iterable[int]]
+
+
+def _type_key(incident_type) -> Optional[str]:
+    return incident_type.strip().lower() if isinstance(incident_type, str) else None
+
+
+def _compile(rule: Mapping) -> Tuple[str, Finder, str]:
+    """(field, finder, message) for one rule row. Raises ValueError for malformed rules."""
+    field, kind, value = rule.get("field_name"), rule.get("kind"), rule.get("value")
+    if not field or kind not in RULE_KINDS:
+        raise ValueError(f"Unknown incident rule {kind!r} for field {field!r}.")
+    if RULE_KINDS[kind] == "int":
+        try:
+            n = int(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"Incident rule {kind} on {field} needs a number, got {value!r}.") from None
+    message = rule.get("message")
+
+    if kind == "required":
+        def find(col):
+            return [i for i, v in enumerate(col) if v is None or (v.__class__ is str and not v.strip())]
+        return field, find, message or f"{field} is required."
+    if kind == "min_length":
+        def find(col):
+            return [i for i, v in enumerate(col)
+                    if v is not None and len(v.strip() if v.__class__ is str else str(v)) < n]
+        return field, find, message or f"{field} must be at least {n} characters."
+    if kind == "max_length":
+        def find(col):
+            return [i for i, v in enumerate(col)
+                    if v is not None and len(v if v.__class__ is str else str(v)) > n]
+        return field, find, message or f"{field} must be at most {n} characters."
+    allowed = [part.strip() for part in str(value or "").split(",") if part.strip()]
+    allowed_set = frozenset(allowed)
+
+    def find(col):
+        return [i for i, v in enumerate(col) if v is not None and v not in allowed_set]
+    return field, find, message or f"{field} must be one of {', '.join(allowed)}."
+
+
+class IncidentRules:
+    """Validation rules compiled once; validates single tips or whole batches.
+
+    ``rules`` are incident_rules rows (mappings with field_name, kind, value
+    and optionally incident_type and message). ``version`` is the data version
+    they were read at.
+    """
+
+    def __init__(self, rules: Iterable[Mapping], version: Optional[int] = None):
+        self.version = version
+        self.rules = [dict(rule) for rule in rules]
+        self._common: List[Tuple[str, Finder, str]] = []
+        self._by_type: Dict[str, List[Tuple[str, Finder, str]]] = {}
+        for rule in self.rules:
+            key = _type_key(rule.get("incident_type"))
+            checks = self._common if key is None else self._by_type.setdefault(key, [])
+            checks.append(_compile(rule))
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def errors(self, row: Mapping) -> Tuple[str, ...]:
+        """Messages for every rule ``row`` breaks (empty when it is valid)."""
+        if not isinstance(row, Mapping):
+            return self.validate_batch([row])[0]
+        found = [message for field, find, message in self._common if find((row.get(field),))]
+        checks = self._by_type.get(_type_key(row.get("incident_type")))
+        if checks:
+            found.extend(message for field, find, message in checks if find((row.get(field),)))
+        return tuple(found) if found else VALID
+
+    def is_valid(self, row: Mapping) -> bool:
+        return not self.errors(row)
+
+    def validate_batch(self, rows: Sequence[Any]) -> List[Tuple[str, ...]]:
+        """One error vector per row, in input order; VALID (an empty tuple) for rows that pass.
+
+        Rules run column by column over the batch: first those for every
+        incident type, then each type's own rules over the rows of that type.
+        Rows that are not mappings get a single error.
+        """
+        found: Dict[int, List[str]] = {}
+        positions: Sequence[int] = [i for i, row in enumerate(rows) if isinstance(row, Mapping)]
+        if len(positions) == len(rows):
+            records, positions = rows, range(len(rows))
+        else:
+            for i, row in enumerate(rows):
+                if not isinstance(row, Mapping):
+                    found[i] = [f"expected a mapping of tip fields, got {type(row).__name__}"]
+            records = [rows[i] for i in positions]
+        self._run(self._common, records, positions, found)
+        if self._by_type:
+            groups: Dict[str, List[int]] = {}
+            for j, row in enumerate(records):
+                key = _type_key(row.get("incident_type"))
+                if key in self._by_type:
+                    groups.setdefault(key, []).append(j)
+            for key, members in groups.items():
+                self._run(self._by_type[key], [records[j] for j in members],
+                          [positions[j] for j in members], found)
+        result = [VALID] * len(rows)
+        for i, messages in found.items():
+            result[i] = tuple(messages)
+        return result
+
+    @staticmethod
+    def _run(checks, records: Sequence[Mapping], positions: Sequence[int], found: Dict[int, List[str]]):
+        columns: Dict[str, List[Any]] = {}
+        for field, find, message in checks:
+            col = columns.get(field)
+            if col is None:
+                col = columns[field] = [row.get(field) for row in records]
+            for j in find(col):
+                found.setdefault(positions[j], []).append(message)
+
+    # ---------- Legacy dict view ----------
+    def get(self, key: str, default=None):
+        """Values of the old get_incident_rules() dict, e.g. "min_description_length"."""
+        if key == "min_description_length":
+            lengths = [int(rule["value"]) for rule in self.rules
+                       if rule.get("field_name") == "description" and rule.get("kind") == "min_length"
+                       and _type_key(rule.get("incident_type")) is None]
+            return max(lengths) if lengths else default
+        return default
@@ -0,0 +1,138 @@
+import collections
+import hashlib
+import hmac
+import os
+import threading
+import time
+from typing import Any, Deque, Dict, Optional
+
+# Cheap defences for the login path, kept in process memory:
+#  * a short-lived negative cache, so a burst repeating the same wrong
+#    username/password pair costs no query (the caller still runs one key
+#    derivation per attempt, so a cached failure is not faster than a fresh
+#    one and cannot be used to tell unknown usernames apart);
+#  * a sliding-window throttle on failed attempts per username and per
+#    source (client address), so credential stuffing is slowed down without
+#    hashing every guess.
+# Failed pairs are remembered only as an HMAC under a per-process random key,
+# never as the password itself.
+
+
+class LoginThrottled(Exception):
+    """Too many failed logins for this username or source; retry after ``retry_after`` seconds."""
+
+    def __init__(self, retry_after: float):
+        self.retry_after = max(1, int(retry_after + 0.999))
+        super().__init__(f"Too many failed login attempts. Try again in {self.retry_after} s.")
+
+
+class LoginGuard:
+    """Negative cache plus per-username/per-source failure throttle (thread-safe)."""
+
+    def __init__(self, negative_ttl: float = 30.0, negative_max_entries: int = 10000,
+                 window: float = 300.0, max_failures_per_user: int = 5,
+                 max_failures_per_source: int = 20):
+        self.negative_ttl = negative_ttl
+        self.negative_max_entries = negative_max_entries
+        self.window = window
+        self.max_failures_per_user = max_failures_per_user
+        self.max_failures_per_source = max_failures_per_source
+        self._key = os.urandom(32)
+        self._lock = threading.Lock()
+        # digest -> (expires_at, username); insertion order doubles as expiry order
+        self._negative: "collections.OrderedDict[bytes, tuple]" = collections.OrderedDict()
+        self._failures: Dict[tuple, Deque[float]] = {}
+        self._stats = {"negative_hits": 0, "throttled": 0}
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> "LoginGuard":
+        config = config or {}
+        return cls(
+            negative_ttl=float(config.get("negative_ttl", 30)),
+            negative_max_entries=int(config.get("negative_max_entries", 10000)),
+            window=float(config.get("window", 300)),
+            max_failures_per_user=int(config.get("max_failures_per_user", 5)),
+            max_failures_per_source=int(config.get("max_failures_per_source", 20)),
+        )
+
+    @staticmethod
+    def _user_key(username: str) -> str:
+        # Usernames match case-insensitively in both backends
+        return (username or "").lower()
+
+    def _digest(self, username: str, password: Optional[str]) -> bytes:
+        # password None marks "no such user", which holds for any password
+        message = self._user_key(username) + "\0" + ("" if password is None else "\1" + password)
+        return hmac.new(self._key, message.encode("utf-8"), hashlib.sha256).digest()
+
+    # ---------- Throttle ----------
+    def _recent(self, key: tuple, now: float) -> Deque[float]:
+        attempts = self._failures.get(key)
+        if attempts is None:
+            return collections.deque()
+        while attempts and attempts[0] <= now - self.window:
+            attempts.popleft()
+        if not attempts:
+            del self._failures[key]
+        return attempts
+
+    def check(self, username: str, source: Optional[str] = None):
+        """Raise LoginThrottled if this username or source has failed too often lately."""
+        now = time.monotonic()
+        limits = [(("user", self._user_key(username)), self.max_failures_per_user)]
+        if source:
+            limits.append((("source", source), self.max_failures_per_source))
+        with self._lock:
+            for key, limit in limits:
+                attempts = self._recent(key, now)
+                if limit and len(attempts) >= limit:
+                    self._stats["throttled"] += 1
+                    raise LoginThrottled(attempts[len(attempts) - limit] + self.window - now)
+
+    def failed(self, username: str, password: str, source: Optional[str] = None,
+               user_exists: bool = True, remember: bool = True):
+        """Record a failed attempt; with ``remember`` also add it to the negative cache."""
+        now = time.monotonic()
+        with self._lock:
+            self._failures.setdefault(("user", self._user_key(username)), collections.deque()).append(now)
+            if source:
+                self._failures.setdefault(("source", source), collections.deque()).append(now)
+            if not remember:
+                return
+            digest = self._digest(username, password if user_exists else None)
+            self._negative.pop(digest, None)
+            self._negative[digest] = (now + self.negative_ttl, self._user_key(username))
+            while len(self._negative) > self.negative_max_entries:
+                self._negative.popitem(last=False)
+
+    def succeeded(self, username: str, source: Optional[str] = None):
+        """Clear the username's failure count after a good login (the source's stays)."""
+        with self._lock:
+            self._failures.pop(("user", self._user_key(username)), None)
+
+    # ---------- Negative cache ----------
+    def known_bad(self, username: str, password: str) -> bool:
+        """True if this username (or username/password pair) failed within negative_ttl."""
+        now = time.monotonic()
+        with self._lock:
+            while self._negative:
+                digest, (expires, _) = next(iter(self._negative.items()))
+                if expires > now:
+                    break
+                self._negative.popitem(last=False)
+            hit = (self._digest(username, None) in self._negative
+                   or self._digest(username, password) in self._negative)
+            if hit:
+                self._stats["negative_hits"] += 1
+            return hit
+
+    def forget(self, username: str):
+        """Drop cached failures for a username whose account or password just changed."""
+        user = self._user_key(username)
+        with self._lock:
+            for digest in [d for d, (_, u) in self._negative.items() if u == user]:
+                del self._negative[digest]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats, negative_entries=len(self._negative), tracked=len(self._failures))
@@ -0,0 +1,91 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List
+
+
+class QueryStats:
+    """Counts statement round-trips and time spent in them.
+
+    Totals are process-wide; measure() additionally counts only the statements
+    issued by the calling thread, so a screen refresh running on a worker thread
+    can report its own round-trips while other tasks are active.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.queries = 0
+        self.seconds = 0.0
+        # callback(sql, params) per statement; empty outside diagnostics
+        self.listeners: List[Callable[[str, Any], None]] = []
+
+    def record(self, seconds: float):
+        with self._lock:
+            self.queries += 1
+            self.seconds += seconds
+        scopes = getattr(self._local, "scopes", None)
+        if scopes:
+            for scope in scopes:
+                scope["queries"] += 1
+                scope["seconds"] += seconds
+
+    @contextmanager
+    def measure(self):
+        """Yield a dict that accumulates {"queries", "seconds"} for this thread's statements."""
+        scope = {"queries": 0, "seconds": 0.0}
+        scopes = getattr(self._local, "scopes", None)
+        if scopes is None:
+            scopes = self._local.scopes = []
+        scopes.append(scope)
+        try:
+            yield scope
+        finally:
+            scopes.remove(scope)
+
+    def add_listener(self, callback: Callable[[str, Any], None]):
+        """Also report every statement's SQL and parameters to ``callback`` (see database.explain)."""
+        self.listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[str, Any], None]):
+        self.listeners.remove(callback)
+
+    def notify(self, sql: str, params: Any = None):
+        for callback in list(self.listeners):
+            callback(sql, params)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"queries": self.queries, "seconds": self.seconds}
+
+
+class CountingCursor:
+    """Cursor proxy that reports every execute()/executemany() to a QueryStats."""
+
+    __slots__ = ("_cursor", "_stats")
+
+    def __init__(self, cursor, stats: QueryStats):
+        self._cursor = cursor
+        self._stats = stats
+
+    def execute(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self._cursor.execute(*args, **kwargs)
+        finally:
+            self._stats.record(time.perf_counter() - start)
+            if self._stats.listeners:
+                self._stats.notify(*args[:2])
+
+    def executemany(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self._cursor.executemany(*args, **kwargs)
+        finally:
+            self._stats.record(time.perf_counter() - start)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        return iter(self._cursor)
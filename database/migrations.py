@@ -0,0 +1,154 @@
+import threading
+import time
+from typing import Any, Callable, List, NamedTuple, Optional, Set
+
+# Versioned schema migrations. schema_version keeps one row per applied
+# migration, so startup on a current schema costs a single read of that small
+# table. Migrations are idempotent (they also bring databases from before
+# versioning, which have no rows there, up to date) and run in order, each in
+# its own transaction. Online migrations (e.g. building indexes on a large
+# table) are held back until the blocking ones are applied and then run on a
+# background thread while the app is usable, on a connection of their own so
+# they never hold the single-connection lock or a pool slot for the whole
+# build. Neither the app nor a later migration may depend on one having
+# finished. A schema change means appending a Migration; never edit one that
+# has shipped.
+
+SCHEMA_VERSION_DDL = """
+CREATE TABLE IF NOT EXISTS schema_version (
+    version INT PRIMARY KEY,
+    name VARCHAR(255) NOT NULL,
+    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    duration_ms INT
+)
+"""
+
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    apply: Callable[[Any, Any, Any], None]  # (database, conn, cur)
+    online: bool = False
+
+
+def _base_tables(db, conn, cur):
+    for statement in db.backend.schema_statements():
+        cur.execute(statement)
+    db.backend.migrate_legacy(cur)
+
+
+def _change_counters(db, conn, cur):
+    db._ensure_data_version(cur)
+
+
+def _fulltext(db, conn, cur):
+    db._ensure_fulltext(cur)
+
+
+def _tip_indexes(db, conn, cur):
+    # Committed index by index, so writers get in between and an interrupted
+    # run keeps the indexes it finished.
+    db._ensure_indexes(cur, conn=conn)
+
+
+def _password_hash_width(db, conn, cur):
+    # Salted KDF hashes (database.passwords) outgrow the SHA-256 CHAR(64).
+    sql = db.backend.modify_column_sql("users", "password_hash", "VARCHAR(255) NOT NULL")
+    if sql:
+        cur.execute(sql)
+
+
+def _incident_rules(db, conn, cur):
+    # Every statement is CREATE TABLE IF NOT EXISTS; only incident_rules is new here.
+    for statement in db.backend.schema_statements():
+        cur.execute(statement)
+    db._ensure_incident_rules(cur)
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "base tables and legacy columns", _base_tables),
+    Migration(2, "change counters", _change_counters),
+    Migration(3, "full-text search index", _fulltext),
+    Migration(4, "tips secondary indexes", _tip_indexes, online=True),
+    Migration(5, "widen users.password_hash", _password_hash_width),
+    Migration(6, "incident validation rules", _incident_rules),
+]
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+def applied_versions(db) -> Optional[Set[int]]:
+    """Versions recorded in schema_version (empty before migrations); None if the table is missing."""
+    with db._session() as (conn, cur):
+        try:
+            cur.execute("SELECT version FROM schema_version")
+            rows = cur.fetchall()
+        except Exception:
+            db._rollback(conn)
+            return None
+        db._commit(conn)
+    return {int(row["version"]) for row in rows}
+
+
+def pending(applied: Set[int]) -> List[Migration]:
+    # Not "above the highest": an online migration can finish after later ones
+    return [m for m in MIGRATIONS if m.version not in applied]
+
+
+def _apply(db, migration: Migration) -> bool:
+    start = time.perf_counter()
+    try:
+        with (db._own_session() if migration.online else db._session()) as (conn, cur):
+            migration.apply(db, conn, cur)
+            elapsed_ms = int((time.perf_counter() - start) * 1000)
+            try:
+                cur.execute("INSERT INTO schema_version (version, name, duration_ms) VALUES (%s, %s, %s)",
+                            (migration.version, migration.name, elapsed_ms))
+            except db.backend.integrity_errors:
+                pass  # another client applied it at the same time
+            db._commit(conn)
+    except Exception as e:
+        print(f"[Migrations] {migration.version} {migration.name} failed: {e}")
+        return False
+    print(f"[Migrations] {migration.version} {migration.name}: {elapsed_ms} ms")
+    return True
+
+
+def run(db, background: bool = True) -> Optional[threading.Thread]:
+    """Bring the schema up to LATEST_VERSION.
+
+    Blocking migrations are applied before returning; pending online ones then
+    run on a daemon thread, which is returned (with ``background=False`` they
+    run inline too and None is returned).
+    """
+    applied = applied_versions(db)
+    if applied is None:
+        with db._session() as (conn, cur):
+            cur.execute(SCHEMA_VERSION_DDL)
+            db._commit(conn)
+        applied = set()
+    todo = pending(applied)
+    if not todo:
+        return None
+
+    start = time.perf_counter()
+    deferred = [m for m in todo if m.online and background]
+    for migration in todo:
+        if migration in deferred:
+            continue
+        if not _apply(db, migration):
+            raise RuntimeError("schema migration failed; see the log above")
+    print(f"[Migrations] schema migrated in {(time.perf_counter() - start) * 1000:.0f} ms"
+          + (f"; {len(deferred)} online migration(s) continuing in the background" if deferred else ""))
+    if not deferred:
+        return None
+
+    def run_online():
+        for migration in deferred:
+            if not _apply(db, migration):
+                return  # retried at the next startup
+        print(f"[Migrations] online migrations done; schema at version {LATEST_VERSION}")
+
+    thread = threading.Thread(target=run_online, name="schema-migrations", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,340 @@
+"""Backend parity check: run every Database operation on each storage engine.
+
+The same scripted workload is replayed on a fresh SQLite file and, when a
+MySQL server is reachable, on a scratch MySQL database (created and dropped by
+this script; the configured application database is never touched). Each
+backend's results are normalised (tip ids replaced by labels, timestamps
+truncated to seconds) and compared; any difference is printed and the exit status is
+non-zero. Key operations are also checked against known results, and an
+operation that raises fails the run, so a bug shared by every backend still
+shows up. tests/test_parity.py runs the same checks under pytest.
+
+    python -m database.parity_check                 # SQLite, plus MySQL if reachable
+    python -m database.parity_check --sqlite-only
+"""
+import argparse
+import datetime
+import os
+import shutil
+import sys
+import tempfile
+import traceback
+from typing import Any, Callable, Dict, List, Tuple
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from config import DB as DB_CONFIG
+from database.db import Database, SORT_EXPRESSIONS
+
+BASE_TIME = datetime.datetime(2024, 3, 1, 9, 0, 0)
+
+# Default for check(expect=...): no known result, compared across backends only
+_ANY = object()
+
+# (tip_name, incident_type, location, urgency, status); mixed case on purpose so
+# collation differences between engines show up in sorting and filtering.
+SAMPLE_TIPS = [
+    ("alpha", "Theft", "Lobby", "High", "Pending"),
+    ("Bravo", "Fraud", "Annex", "Medium", "Resolved"),
+    ("charlie", "Theft", "lobby", "Low", "Pending"),
+    ("Delta", "Vandalism", None, "High", "In Progress"),
+    ("echo 50%_off", "Fraud", "Garage", "Low", "Pending"),
+    ("Foxtrot", None, "Annex", "Medium", "Pending"),
+    ("golf", "Theft", "Roof", "High", "Resolved"),
+    ("Hotel", "Harassment", "Lobby", None, "Pending"),
+    ("india", "Fraud", "Garage", "Medium", "Pending"),
+    ("Juliet", "Theft", "Annex", "High", "Pending"),
+    ("alpha", "Vandalism", "Roof", "Low", "In Progress"),
+    (None, "Fraud", "Lobby", "Medium", "Pending"),
+]
+
+
+class _Normalizer:
+    """Rewrites backend-specific values (ids, datetimes) into comparable ones."""
+
+    def __init__(self):
+        self.ids: Dict[int, str] = {}
+
+    def register(self, tip_id: int, label: str):
+        self.ids[tip_id] = label
+
+    def value(self, key: str, value: Any):
+        if key in ("id", "tip_id") and value in self.ids:
+            return self.ids[value]
+        if isinstance(value, datetime.datetime):
+            return value.replace(microsecond=0).isoformat(sep=" ")
+        if isinstance(value, datetime.date):
+            return value.isoformat()
+        if key in ("count", "urgency_total") and value is not None:
+            return int(value)
+        return value
+
+    def row(self, row: Dict[str, Any]):
+        if row is None:
+            return None
+        # password_hash is salted and updated_at is the wall clock: never equal across runs
+        return {k: self.value(k, v) for k, v in sorted(row.items())
+                if k not in ("created_by", "password_hash", "updated_at")}
+
+    def rows(self, rows: List[Dict[str, Any]]):
+        return [self.row(r) for r in rows]
+
+
+class ParityError(Exception):
+    """An operation in the workload raised, or returned something other than its known result."""
+
+
+def _scenario(db: Database) -> List[Tuple[str, Any]]:
+    """Run the workload and return (check name, normalised result) pairs.
+
+    Raises ParityError if an operation raises or a check with ``expect``
+    returns anything else.
+    """
+    n = _Normalizer()
+    out: List[Tuple[str, Any]] = []
+
+    def check(name: str, fn: Callable[[], Any], expect: Any = _ANY):
+        try:
+            result = fn()
+        except Exception as e:
+            raise ParityError(f"{name} raised {e.__class__.__name__}: {e}") from e
+        if expect is not _ANY and result != expect:
+            raise ParityError(f"{name}: expected {expect!r}, got {result!r}")
+        out.append((name, result))
+
+    def labels(rows):
+        return [n.value("id", r["id"]) for r in rows]
+
+    # Users
+    check("create_user", lambda: db.create_user("Parity", "parity@example.com", "pw"), expect=True)
+    check("create_user duplicate (case-insensitive)", lambda: db.create_user("parity", "x@example.com", "pw"),
+          expect=False)
+    check("get_user_by_credentials ok", lambda: n.row(db.get_user_by_credentials("Parity", "pw")))
+    check("get_user_by_credentials fields",
+          lambda: {k: db.get_user_by_credentials("parity", "pw")[k] for k in ("username", "email", "role")},
+          expect={"username": "Parity", "email": "parity@example.com", "role": "reporter"})
+    check("get_user_by_credentials wrong password", lambda: db.get_user_by_credentials("Parity", "nope"),
+          expect=None)
+    db.seed_admin("parity_admin", "pw1")
+    db.seed_admin("parity_admin", "pw2", "root@example.com")
+    check("seed_admin upsert", lambda: n.row(db.get_user_by_credentials("parity_admin", "pw2")))
+    check("seed_admin old password", lambda: db.get_user_by_credentials("parity_admin", "pw1"), expect=None)
+
+    # Tips: explicit, distinct created_at values make every ordering deterministic
+    for i, (name, itype, location, urgency, status) in enumerate(SAMPLE_TIPS):
+        tip_id = db.create_tip({
+            "tip_name": name, "incident_type": itype, "location": location,
+            "description": f"parity row {i}", "urgency": urgency,
+        })
+        n.register(tip_id, f"tip{i}")
+        db.update_tip(tip_id, {"status": status, "created_at": BASE_TIME + datetime.timedelta(hours=7 * i)})
+    ids = {label: tip_id for tip_id, label in n.ids.items()}
+
+    check("incident rules", lambda: db.get_incident_rules().validate_batch(db.read_tips()))
+    check("incident rules tip_name required",
+          lambda: [label for label, errors in zip(labels(db.read_tips()),
+                                                  db.get_incident_rules().validate_batch(db.read_tips()))
+                   if "tip_name is required." in errors],
+          expect=["tip11"])
+    db.add_incident_rule("location", "allowed", "Lobby,Annex", incident_type="theft")
+    check("incident rules per type", lambda: db.get_incident_rules().validate_batch(db.read_tips()))
+    # Theft tips at "lobby" (case differs) and Roof; other types may be anywhere
+    check("incident rules per type locations",
+          lambda: sorted(label for label, errors in zip(labels(db.read_tips()),
+                                                        db.get_incident_rules().validate_batch(db.read_tips()))
+                         if "location must be one of Lobby, Annex." in errors),
+          expect=["tip2", "tip6"])
+
+    check("read_tips", lambda: n.rows(db.read_tips()))
+    check("read_tips urgency filter", lambda: n.rows(db.read_tips({"urgency": "High"})))
+    check("read_tips two filters", lambda: n.rows(db.read_tips({"incident_type": "Theft", "status": "Pending"})))
+    check("read_tip", lambda: n.row(db.read_tip(ids["tip3"])))
+    check("read_tips ids", lambda: labels(db.read_tips()), expect=[f"tip{i}" for i in range(11, -1, -1)])
+    check("read_tips urgency filter ids", lambda: labels(db.read_tips({"urgency": "High"})),
+          expect=["tip9", "tip6", "tip3", "tip0"])
+    check("read_tip missing", lambda: db.read_tip(-1), expect=None)
+    check("read_tips_after", lambda: n.rows(db.read_tips_after(ids["tip3"], limit=4)))
+    check("read_tips_after ids", lambda: labels(db.read_tips_after(ids["tip3"], limit=4)),
+          expect=["tip4", "tip5", "tip6", "tip7"])
+
+    # Known orders: NULLs first, case-insensitive, ties broken by id
+    known_orders = {
+        "created_at": [f"tip{i}" for i in range(12)],
+        "tip_name": ["tip11", "tip0", "tip10", "tip1", "tip2", "tip3", "tip4", "tip5", "tip6", "tip7", "tip8",
+                     "tip9"],
+        "urgency": ["tip2", "tip4", "tip10", "tip1", "tip5", "tip8", "tip11", "tip0", "tip3", "tip6", "tip9",
+                    "tip7"],
+    }
+    for sort in SORT_EXPRESSIONS:
+        for descending in (False, True):
+            def walk(sort=sort, descending=descending):
+                seen, cursor = [], None
+                while True:
+                    page = db.read_tips_page(sort=sort, descending=descending, limit=5, cursor=cursor)
+                    seen.extend(labels(page["rows"]))
+                    cursor = page["next_cursor"]
+                    if not cursor:
+                        return seen
+            expect = known_orders.get(sort, _ANY)
+            if expect is not _ANY and descending:
+                expect = expect[::-1]
+            check(f"read_tips_page sort={sort} desc={descending}", walk, expect=expect)
+    check("read_tips_page search", lambda: labels(db.read_tips_page(search="echo", limit=10)["rows"]),
+          expect=["tip4"])
+    check("read_tips_page search + filter",
+          lambda: labels(db.read_tips_page({"urgency": "Low"}, search="alp")["rows"]), expect=["tip10"])
+    # Relevance scores differ between engines, so compare the matched sets.
+    known_matches = {"theft": ["tip0", "tip2", "tip6", "tip9"], "fraud garage": ["tip4", "tip8"], "zzz": []}
+    for query in ("theft", "lob", "fraud garage", "ann", "zzz"):
+        check(f"search_tips {query!r}", lambda q=query: sorted(labels(db.search_tips(q, limit=50)["rows"])),
+              expect=known_matches.get(query, _ANY))
+    check("search_tips filtered", lambda: sorted(labels(db.search_tips("theft", {"status": "Pending"})["rows"])),
+          expect=["tip0", "tip2", "tip9"])
+
+    check("get_all_incidents", lambda: n.rows(db.get_all_incidents()))
+    check("get_incidents_by_urgency", lambda: n.rows(db.get_incidents_by_urgency("Medium")))
+    check("dashboard_snapshot", lambda: n.rows(db.dashboard_snapshot(per_urgency_limit=2)))
+    check("count_tips urgency,status", lambda: n.rows(db.count_tips(("urgency", "status"))))
+    check("count_tips day range", lambda: n.rows(db.count_tips(
+        "day", since=BASE_TIME + datetime.timedelta(hours=20), until=BASE_TIME + datetime.timedelta(days=3))))
+    check("count_tips total", lambda: n.rows(db.count_tips(())), expect=[{"count": len(SAMPLE_TIPS)}])
+
+    # Backdate the stamp so the update's new updated_at differs, then cache the row for it to patch
+    with db._session() as (conn, cur):
+        cur.execute("UPDATE tips SET updated_at=%s WHERE id=%s", (BASE_TIME, ids["tip0"]))
+        db._commit(conn)
+    if db.cache is not None:
+        db.cache.clear()
+    db.read_tip(ids["tip0"])
+    check("update_tip", lambda: db.update_tip(ids["tip0"], {"status": "Resolved", "urgency": "Low"}), expect=True)
+    # Whole row, updated_at included: a cached read must equal one from the database
+    check("read_tip after update, cached vs uncached",
+          lambda: dict(db.read_tip(ids["tip0"])) == dict(db._read_tip(ids["tip0"])), expect=True)
+    check("update_tip missing", lambda: db.update_tip(-1, {"status": "Resolved"}), expect=False)
+    check("read_tip after update", lambda: n.row(db.read_tip(ids["tip0"])))
+    check("read_tip after update fields",
+          lambda: {k: db.read_tip(ids["tip0"])[k] for k in ("status", "urgency")},
+          expect={"status": "Resolved", "urgency": "Low"})
+    check("delete_tip", lambda: db.delete_tip(ids["tip1"]), expect=True)
+    check("delete_tip again", lambda: db.delete_tip(ids["tip1"]), expect=False)
+    check("read_tip deleted", lambda: db.read_tip(ids["tip1"]), expect=None)
+    check("count_tips after delete", lambda: n.rows(db.count_tips("urgency")),
+          expect=[{"count": 1, "urgency": None}, {"count": 3, "urgency": "High"},
+                  {"count": 4, "urgency": "Low"}, {"count": 3, "urgency": "Medium"}])
+
+    def bulk():
+        result = db.create_tips([
+            {"tip_name": "bulk a", "urgency": "High"},
+            {"tip_name": "x" * 300},
+            {"tip_name": "bulk b", "created_by": 10 ** 6},
+            {"tip_name": "bulk c", "status": "Resolved", "created_at": "2024-03-09 10:00:00"},
+        ], batch_size=3)
+        return {"inserted": result["inserted"], "failed": [f["index"] for f in result["failed"]],
+                "ids": [i is not None for i in result["ids"]],
+                "rows": [(r["tip_name"], r["status"]) for r in (db.read_tip(i) for i in result["ids"] if i)]}
+    check("create_tips with rejects", bulk,
+          expect={"inserted": 2, "failed": [1, 2], "ids": [True, False, False, True],
+                  "rows": [("bulk a", "Pending"), ("bulk c", "Resolved")]})
+    return out
+
+
+# ---------- Targets ----------
+def _sqlite_target(tmpdir: str, pooled: bool, cached: bool = True) -> Dict[str, Any]:
+    path = os.path.join(tmpdir, f"parity-{'pooled' if pooled else 'single'}{'' if cached else '-nocache'}.db")
+    return dict(DB_CONFIG, backend="sqlite", pool={"enabled": pooled, "size": 4},
+                cache=dict(DB_CONFIG.get("cache") or {}, enabled=cached),
+                sqlite=dict(DB_CONFIG.get("sqlite") or {}, path=path))
+
+
+def _mysql_scratch(database: str, drop: bool = False) -> bool:
+    """Create (or drop) the scratch MySQL database; False if MySQL is unreachable."""
+    try:
+        import mysql.connector
+        conn = mysql.connector.connect(host=DB_CONFIG.get("host"), user=DB_CONFIG.get("user"),
+                                       password=DB_CONFIG.get("password"))
+    except Exception as e:
+        if not drop:
+            print(f"[Parity] MySQL not available, skipping: {e}")
+        return False
+    try:
+        cur = conn.cursor()
+        cur.execute(f"DROP DATABASE IF EXISTS `{database}`")
+        if not drop:
+            cur.execute(f"CREATE DATABASE `{database}` CHARACTER SET utf8mb4")
+        return True
+    finally:
+        conn.close()
+
+
+def _run_target(cfg: Dict[str, Any]):
+    db = Database(cfg)
+    try:
+        return _scenario(db)
+    finally:
+        db.close()
+
+
+def sqlite_targets(tmpdir: str) -> Dict[str, Dict[str, Any]]:
+    """The SQLite configurations compared on every run, by name."""
+    return {
+        "sqlite": _sqlite_target(tmpdir, pooled=False),
+        "sqlite (pooled)": _sqlite_target(tmpdir, pooled=True),
+        # Same scenario with the read cache off: cached reads must not differ.
+        "sqlite (no cache)": _sqlite_target(tmpdir, pooled=False, cached=False),
+    }
+
+
+def mismatches(results: Dict[str, List[Tuple[str, Any]]]) -> List[str]:
+    """One message per check whose result differs from the first target's."""
+    reference_name = next(iter(results))
+    reference = results[reference_name]
+    found = []
+    for name, got in results.items():
+        if name == reference_name:
+            continue
+        for (check, expected), (_, actual) in zip(reference, got):
+            if expected != actual:
+                found.append(f"{check}:\n  {reference_name}: {expected}\n  {name}: {actual}")
+    return found
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sqlite-only", action="store_true", help="do not try to reach MySQL")
+    parser.add_argument("--mysql-database", default=f"{DB_CONFIG.get('database', 'tattlestoolie_db')}_parity",
+                        help="scratch database created and dropped for the MySQL run")
+    args = parser.parse_args()
+
+    tmpdir = tempfile.mkdtemp(prefix="tattle-parity-")
+    results: Dict[str, List[Tuple[str, Any]]] = {}
+    name = None
+    try:
+        for name, cfg in sqlite_targets(tmpdir).items():
+            results[name] = _run_target(cfg)
+        if not args.sqlite_only and _mysql_scratch(args.mysql_database):
+            name = "mysql"
+            try:
+                results[name] = _run_target(dict(DB_CONFIG, backend="mysql", database=args.mysql_database))
+            finally:
+                _mysql_scratch(args.mysql_database, drop=True)
+    except ParityError as e:
+        print(f"[Parity] FAILED on {name}: {e}")
+        return 1
+    except Exception:
+        traceback.print_exc()
+        return 2
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+    found = mismatches(results)
+    for message in found:
+        print(f"[Parity] MISMATCH {message}")
+    print(f"[Parity] {len(next(iter(results.values())))} checks on {', '.join(results)}: "
+          f"{'all match' if not found else f'{len(found)} mismatches'}")
+    return 1 if found else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
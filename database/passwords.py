@@ -0,0 +1,133 @@
+import base64
+import hashlib
+import hmac
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+# Password hashing for the users table. Hashes are salted scrypt (or PBKDF2
+# where OpenSSL lacks scrypt) and self-describing, with the algorithm and cost
+# stored alongside, so the cost can be raised later and each row is checked
+# with the parameters it was created with:
+#     scrypt$n=16384,r=8,p=1$<salt>$<key>
+#     pbkdf2_sha256$i=600000$<salt>$<key>
+# Rows from before this scheme hold a bare SHA-256 hex digest; they still
+# verify, and needs_rehash() tells the login path to upgrade them.
+# Key derivation runs on a small dedicated thread pool (hashlib releases the GIL
+# while deriving), which caps how many logins burn CPU and memory at once.
+
+SCRYPT = "scrypt"
+PBKDF2 = "pbkdf2_sha256"
+LEGACY_SHA256 = "sha256"
+
+_LEGACY_RE = re.compile(r"^[0-9a-fA-F]{64}$")
+
+
+def _b64(raw: bytes) -> str:
+    return base64.b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _unb64(text: str) -> bytes:
+    return base64.b64decode(text + "=" * (-len(text) % 4))
+
+
+def parse_hash(encoded: str) -> Tuple[str, Dict[str, int], bytes, bytes]:
+    """Split a stored hash into (algorithm, params, salt, key); raises ValueError if malformed."""
+    if _LEGACY_RE.match(encoded or ""):
+        return LEGACY_SHA256, {}, b"", bytes.fromhex(encoded)
+    algorithm, params, salt, key = encoded.split("$")
+    values = {k: int(v) for k, v in (item.split("=") for item in params.split(","))}
+    return algorithm, values, _unb64(salt), _unb64(key)
+
+
+class PasswordHasher:
+    """Salted KDF hashing and constant-time verification on a bounded worker pool."""
+
+    def __init__(self, algorithm: str = SCRYPT, scrypt_n: int = 2 ** 14, scrypt_r: int = 8,
+                 scrypt_p: int = 1, pbkdf2_iterations: int = 600000, workers: int = 2,
+                 salt_bytes: int = 16, key_bytes: int = 32):
+        if algorithm == SCRYPT and not hasattr(hashlib, "scrypt"):
+            print("[Passwords] hashlib.scrypt unavailable (OpenSSL build); using PBKDF2-SHA256.")
+            algorithm = PBKDF2
+        if algorithm not in (SCRYPT, PBKDF2):
+            raise ValueError(f"Unknown password hash algorithm '{algorithm}'.")
+        self.algorithm = algorithm
+        if algorithm == SCRYPT:
+            self.params = {"n": int(scrypt_n), "r": int(scrypt_r), "p": int(scrypt_p)}
+        else:
+            self.params = {"i": int(pbkdf2_iterations)}
+        self.salt_bytes = salt_bytes
+        self.key_bytes = key_bytes
+        self.workers = max(1, int(workers))
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="tattle-kdf")
+        # Hashed in the background now so no login waits for it (see dummy_hash)
+        self._dummy = self._executor.submit(self.hash_now, _b64(os.urandom(16)))
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> "PasswordHasher":
+        config = config or {}
+        return cls(
+            algorithm=config.get("algorithm", SCRYPT),
+            scrypt_n=int(config.get("scrypt_n", 2 ** 14)),
+            scrypt_r=int(config.get("scrypt_r", 8)),
+            scrypt_p=int(config.get("scrypt_p", 1)),
+            pbkdf2_iterations=int(config.get("pbkdf2_iterations", 600000)),
+            workers=int(config.get("workers", 2)),
+        )
+
+    # ---------- Key derivation (calling thread) ----------
+    def _derive(self, password: str, algorithm: str, params: Dict[str, int], salt: bytes, length: int) -> bytes:
+        secret = password.encode("utf-8")
+        if algorithm == SCRYPT:
+            n, r, p = params["n"], params["r"], params["p"]
+            # OpenSSL's default 32 MiB limit is below what n >= 2**15 needs
+            return hashlib.scrypt(secret, salt=salt, n=n, r=r, p=p, dklen=length,
+                                  maxmem=256 * r * (n + p) + 1024 * 1024)
+        if algorithm == PBKDF2:
+            return hashlib.pbkdf2_hmac("sha256", secret, salt, params["i"], dklen=length)
+        if algorithm == LEGACY_SHA256:
+            return hashlib.sha256(secret).digest()
+        raise ValueError(f"Unknown password hash algorithm '{algorithm}'.")
+
+    def hash_now(self, password: str) -> str:
+        salt = os.urandom(self.salt_bytes)
+        key = self._derive(password, self.algorithm, self.params, salt, self.key_bytes)
+        params = ",".join(f"{k}={v}" for k, v in self.params.items())
+        return f"{self.algorithm}${params}${_b64(salt)}${_b64(key)}"
+
+    def verify_now(self, password: str, encoded: str) -> bool:
+        try:
+            algorithm, params, salt, key = parse_hash(encoded)
+            derived = self._derive(password, algorithm, params, salt, len(key))
+        except (ValueError, KeyError, TypeError):
+            return False
+        return hmac.compare_digest(derived, key)
+
+    # ---------- Pooled ----------
+    def hash(self, password: str) -> str:
+        """Hash ``password`` with the current algorithm and cost (on the KDF pool)."""
+        return self._executor.submit(self.hash_now, password).result()
+
+    def verify(self, password: str, encoded: str) -> bool:
+        """Check ``password`` against a stored hash in constant time (on the KDF pool)."""
+        return self._executor.submit(self.verify_now, password, encoded).result()
+
+    def dummy_hash(self) -> str:
+        """A hash made with the current algorithm and cost that no user has.
+
+        Verifying against it when a username does not exist makes that
+        failure take as long as a wrong password for a real user.
+        """
+        return self._dummy.result()
+
+    def needs_rehash(self, encoded: str) -> bool:
+        """True for legacy SHA-256 rows and hashes made with another algorithm or cost."""
+        try:
+            algorithm, params, salt, key = parse_hash(encoded)
+        except (ValueError, TypeError):
+            return True
+        return algorithm != self.algorithm or params != self.params or len(key) != self.key_bytes
+
+    def close(self):
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,209 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional
+
+
+class PoolTimeout(Exception):
+    """Raised when no pooled connection becomes available within the checkout timeout."""
+
+
+class _PooledEntry:
+    """A raw connection plus the bookkeeping the pool needs about it."""
+
+    __slots__ = ("conn", "created_at", "last_used", "last_checked")
+
+    def __init__(self, conn):
+        now = time.monotonic()
+        self.conn = conn
+        self.created_at = now
+        self.last_used = now
+        self.last_checked = now
+
+
+class ConnectionPool:
+    """Thread-safe pool of DB-API connections.
+
+    Connections are created lazily up to ``size``. Borrowing blocks for at most
+    ``timeout`` seconds, idle connections are health-checked before being handed
+    out (at most once per ``health_check_interval`` seconds), and connections idle
+    for longer than ``idle_timeout`` are closed, keeping ``min_size`` warm.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        size: int = 5,
+        min_size: int = 0,
+        timeout: float = 10.0,
+        health_check: Optional[Callable[[Any], bool]] = None,
+        health_check_interval: float = 30.0,
+        idle_timeout: float = 300.0,
+    ):
+        if size < 1:
+            raise ValueError("Pool size must be at least 1.")
+        self._connect = connect
+        self.size = size
+        self.min_size = max(0, min(min_size, size))
+        self.timeout = timeout
+        self._health_check = health_check
+        self.health_check_interval = health_check_interval
+        self.idle_timeout = idle_timeout
+
+        self._cond = threading.Condition()
+        self._idle: List[_PooledEntry] = []
+        self._in_use: Dict[int, _PooledEntry] = {}
+        self._opened = 0
+        self._closed = False
+        self._stats = {"checkouts": 0, "waits": 0, "timeouts": 0, "created": 0,
+                       "evicted_idle": 0, "evicted_unhealthy": 0}
+
+        for _ in range(self.min_size):
+            self._idle.append(self._new_entry())
+
+    # ---------- Internals ----------
+    def _new_entry(self) -> _PooledEntry:
+        conn = self._connect()
+        with self._cond:
+            self._opened += 1
+            self._stats["created"] += 1
+        return _PooledEntry(conn)
+
+    @staticmethod
+    def _close_quietly(conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _is_healthy(self, entry: _PooledEntry, now: float) -> bool:
+        if self._health_check is None or now - entry.last_checked < self.health_check_interval:
+            return True
+        try:
+            ok = bool(self._health_check(entry.conn))
+        except Exception:
+            ok = False
+        entry.last_checked = now
+        return ok
+
+    def _evict_idle_locked(self, now: float) -> List[_PooledEntry]:
+        """Drop connections idle past idle_timeout (caller holds the lock)."""
+        if self.idle_timeout is None or self.idle_timeout <= 0:
+            return []
+        keep, evicted = [], []
+        # Oldest-used first so the warmest connections are the ones kept.
+        for entry in sorted(self._idle, key=lambda e: e.last_used):
+            stale = now - entry.last_used > self.idle_timeout
+            if stale and self._opened - len(evicted) > self.min_size:
+                evicted.append(entry)
+            else:
+                keep.append(entry)
+        self._idle = keep
+        self._opened -= len(evicted)
+        self._stats["evicted_idle"] += len(evicted)
+        return evicted
+
+    # ---------- Public API ----------
+    def acquire(self):
+        """Borrow a connection, waiting up to ``timeout`` seconds for one to free up."""
+        deadline = time.monotonic() + self.timeout
+        while True:
+            create = False
+            entry = None
+            with self._cond:
+                if self._closed:
+                    raise RuntimeError("Connection pool is closed.")
+                now = time.monotonic()
+                evicted = self._evict_idle_locked(now)
+                if self._idle:
+                    entry = self._idle.pop()
+                elif self._opened < self.size:
+                    # Reserve the slot now; the connection is opened outside the lock.
+                    self._opened += 1
+                    create = True
+                else:
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        self._stats["timeouts"] += 1
+                        raise PoolTimeout(f"No database connection available after {self.timeout:.1f}s")
+                    self._stats["waits"] += 1
+                    self._cond.wait(remaining)
+                    continue
+            for old in evicted:
+                self._close_quietly(old.conn)
+
+            if create:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self._cond:
+                        self._opened -= 1
+                        self._cond.notify()
+                    raise
+                entry = _PooledEntry(conn)
+                with self._cond:
+                    self._stats["created"] += 1
+            elif not self._is_healthy(entry, time.monotonic()):
+                self._close_quietly(entry.conn)
+                with self._cond:
+                    self._opened -= 1
+                    self._stats["evicted_unhealthy"] += 1
+                continue
+
+            with self._cond:
+                self._in_use[id(entry.conn)] = entry
+                self._stats["checkouts"] += 1
+            return entry.conn
+
+    def release(self, conn, discard: bool = False):
+        """Return a borrowed connection; ``discard`` closes it instead of reusing it."""
+        with self._cond:
+            entry = self._in_use.pop(id(conn), None)
+            if entry is None:
+                return
+            if discard or self._closed:
+                self._opened -= 1
+            else:
+                entry.last_used = time.monotonic()
+                self._idle.append(entry)
+            self._cond.notify()
+        if discard or self._closed:
+            self._close_quietly(conn)
+
+    @contextmanager
+    def connection(self):
+        """Context manager that borrows a connection and always returns it."""
+        conn = self.acquire()
+        broken = False
+        try:
+            yield conn
+        except BaseException:
+            broken = not self._is_usable(conn)
+            raise
+        finally:
+            self.release(conn, discard=broken)
+
+    def _is_usable(self, conn) -> bool:
+        if self._health_check is None:
+            return True
+        try:
+            return bool(self._health_check(conn))
+        except Exception:
+            return False
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of pool counters (for diagnostics and benchmarks)."""
+        with self._cond:
+            out = dict(self._stats)
+            out.update(size=self.size, open=self._opened, idle=len(self._idle), in_use=len(self._in_use))
+            return out
+
+    def close(self):
+        """Close all idle connections; in-use connections are closed when released."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._opened -= len(idle)
+            self._cond.notify_all()
+        for entry in idle:
+            self._close_quietly(entry.conn)
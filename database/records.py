@@ -0,0 +1,98 @@
+import sys
+from collections.abc import Mapping
+from itertools import starmap
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Sequence
+
+# Compact row type for tips. Database builds TipRecords straight from tuple
+# cursors instead of one dict per row: a record is a slotted object (no per-row
+# key table or __dict__), and the low-cardinality text columns are interned so
+# every "High" or "Pending" in memory is the same string object. Records are
+# read-only mappings, so code written against dict rows (row["id"],
+# row.get("urgency"), dict(row), row.items()) keeps working, and the read cache
+# can share them between callers without copying.
+
+# Column order of the tips table; also the positional order of TipRecord().
+TIP_FIELDS = ("id", "tip_name", "incident_type", "location", "description", "urgency",
+              "created_by", "created_at", "status", "row_version", "updated_at")
+# Columns with a handful of distinct values, interned on construction.
+INTERNED_FIELDS = ("incident_type", "urgency", "status")
+
+_FIELD_SET = frozenset(TIP_FIELDS)
+_intern = sys.intern
+
+
+class TipRecord(Mapping):
+    """One tips row: a read-only, dict-compatible mapping stored in __slots__."""
+
+    __slots__ = TIP_FIELDS
+
+    def __init__(self, id=None, tip_name=None, incident_type=None, location=None, description=None,
+                 urgency=None, created_by=None, created_at=None, status=None, row_version=None,
+                 updated_at=None):
+        self.id = id
+        self.tip_name = tip_name
+        self.incident_type = _intern(incident_type) if incident_type.__class__ is str else incident_type
+        self.location = location
+        self.description = description
+        self.urgency = _intern(urgency) if urgency.__class__ is str else urgency
+        self.created_by = created_by
+        self.created_at = created_at
+        self.status = _intern(status) if status.__class__ is str else status
+        self.row_version = row_version
+        # Never-edited tips have updated_at == created_at: keep one datetime object
+        self.updated_at = created_at if updated_at == created_at else updated_at
+
+    # ---------- Mapping protocol ----------
+    def __getitem__(self, key: str):
+        if key in _FIELD_SET:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def get(self, key: str, default=None):
+        return getattr(self, key) if key in _FIELD_SET else default
+
+    def __contains__(self, key) -> bool:
+        return key in _FIELD_SET
+
+    def __iter__(self):
+        return iter(TIP_FIELDS)
+
+    def __len__(self) -> int:
+        return len(TIP_FIELDS)
+
+    def __repr__(self) -> str:
+        return f"TipRecord({', '.join(f'{k}={getattr(self, k)!r}' for k in TIP_FIELDS)})"
+
+    def __reduce__(self):
+        return TipRecord, tuple(getattr(self, k) for k in TIP_FIELDS)
+
+    # ---------- Helpers ----------
+    def to_dict(self) -> Dict[str, Any]:
+        return {k: getattr(self, k) for k in TIP_FIELDS}
+
+    def replace(self, **changes) -> "TipRecord":
+        """Copy of this record with some columns changed (records are never modified)."""
+        unknown = set(changes) - _FIELD_SET
+        if unknown:
+            raise KeyError(f"Unknown tip column(s): {', '.join(sorted(unknown))}")
+        values = self.to_dict()
+        values.update(changes)
+        return TipRecord(**values)
+
+
+def read_records(description: Sequence[Sequence[Any]], rows: Iterable[Sequence[Any]]) -> List[Mapping]:
+    """TipRecords for tuple ``rows`` fetched by a cursor with this ``description``.
+
+    Columns that are not tip fields (e.g. a computed sort value) are skipped.
+    If the result lacks some tip column the rows come back as dicts of the
+    columns it has.
+    """
+    names = [col[0] for col in description]
+    if tuple(names) == TIP_FIELDS:
+        return list(starmap(TipRecord, rows))
+    positions = {name: i for i, name in enumerate(names) if name in _FIELD_SET}
+    if len(positions) < len(TIP_FIELDS):
+        pairs = list(positions.items())
+        return [{name: row[i] for name, i in pairs} for row in rows]
+    return list(starmap(TipRecord, map(itemgetter(*(positions[name] for name in TIP_FIELDS)), rows)))
@@ -0,0 +1,74 @@
+"""Export tips to CSV, JSONL or the compact columnar format.
+
+Rows are streamed from the database in chunks, so memory use does not grow
+with the table. Filters are exact matches, like Database.read_tips(filters).
+
+    python export_tips.py tips.csv
+    python export_tips.py high.jsonl --filter urgency=High --filter status=Pending
+    python export_tips.py archive.tscol --format columnar
+    python export_tips.py - --format jsonl | gzip > tips.jsonl.gz
+"""
+import argparse
+import os
+import sys
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from config import DB as DB_CONFIG
+from database.db import Database
+from database.export import EXPORT_COLUMNS, EXPORT_FORMATS, export_tips
+
+EXTENSIONS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl", ".tscol": "columnar"}
+
+
+def _parse_filters(items):
+    filters = {}
+    for item in items or []:
+        key, sep, value = item.partition("=")
+        if not sep or not key:
+            raise SystemExit(f"--filter expects column=value, got {item!r}")
+        filters[key.strip()] = value
+    return filters
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", help="output file, or - for stdout")
+    parser.add_argument("--format", choices=sorted(EXPORT_FORMATS), help="default: from the file extension")
+    parser.add_argument("--filter", action="append", metavar="COLUMN=VALUE", help="repeatable exact-match filter")
+    parser.add_argument("--columns", help=f"comma-separated subset of: {','.join(EXPORT_COLUMNS)}")
+    parser.add_argument("--chunk-size", type=int, default=2000, help="rows fetched per round-trip")
+    args = parser.parse_args()
+
+    fmt = args.format or EXTENSIONS.get(os.path.splitext(args.path)[1].lower())
+    if fmt is None:
+        parser.error("cannot tell the format from the file name; pass --format")
+    filters = _parse_filters(args.filter)
+    columns = [c.strip() for c in args.columns.split(",")] if args.columns else None
+    binary = EXPORT_FORMATS[fmt].binary
+
+    def progress(rows, seconds):
+        print(f"\r[Export] {rows} rows ({rows / seconds if seconds else 0:,.0f} rows/s)",
+              end="", file=sys.stderr, flush=True)
+
+    db = Database(DB_CONFIG)
+    try:
+        if args.path == "-":
+            fh = sys.stdout.buffer if binary else sys.stdout
+            stats = export_tips(db, fh, fmt, filters, columns, args.chunk_size, progress)
+            fh.flush()
+        else:
+            with open(args.path, "wb") if binary else open(args.path, "w", newline="", encoding="utf-8") as fh:
+                stats = export_tips(db, fh, fmt, filters, columns, args.chunk_size, progress)
+    finally:
+        db.close()
+
+    print(f"\n[Export] Done: {stats['rows']} rows in {stats['seconds']:.1f}s "
+          f"({stats['rows_per_sec']:,.0f} rows/s) -> {args.path}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""Bulk-import tips from CSV or JSONL files (e.g. partner hotline exports).
+
+The file is streamed: rows are read and inserted in batches through
+Database.create_tips, so memory stays flat for files of any size. Each chunk
+is first checked against the validation rules in the incident_rules table
+(Database.get_incident_rules, skipped with --no-rules). Rows that fail
+validation or are rejected by the database are written, with the reason, to a
+rejects file and do not stop the import.
+
+CSV files need a header row; recognised columns are tip_name, incident_type,
+location, description, urgency, created_by, status and created_at (others are
+ignored, empty cells are treated as missing). JSONL files hold one object per
+line with the same keys.
+
+    python import_tips.py reports.csv
+    python import_tips.py hotline.jsonl --batch-size 2000 --rejects hotline.rejects.jsonl
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from itertools import islice
+from typing import Dict, Iterator
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from config import DB as DB_CONFIG
+from database.db import Database
+
+
+def read_csv(path: str) -> Iterator[Dict[str, str]]:
+    with open(path, newline="", encoding="utf-8-sig") as fh:
+        for row in csv.DictReader(fh):
+            yield {k: v for k, v in row.items() if k and v not in ("", None)}
+
+
+def read_jsonl(path: str) -> Iterator[object]:
+    """Yield one object per non-blank line; undecodable lines yield the error text."""
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as e:
+                # create_tips rejects non-mappings, so the line lands in the rejects file
+                yield f"invalid JSON: {e}"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", help="CSV or JSONL file to import")
+    parser.add_argument("--format", choices=("csv", "jsonl"), help="default: from the file extension")
+    parser.add_argument("--batch-size", type=int, default=1000, help="rows per INSERT batch / commit")
+    parser.add_argument("--rejects", help="where to write rejected rows (default: <path>.rejects.jsonl)")
+    parser.add_argument("--created-by", type=int, help="user id to attribute rows without created_by to")
+    parser.add_argument("--no-rules", action="store_true", help="skip the incident_rules checks")
+    args = parser.parse_args()
+
+    fmt = args.format or ("jsonl" if args.path.lower().endswith((".jsonl", ".ndjson")) else "csv")
+    rows = read_jsonl(args.path) if fmt == "jsonl" else read_csv(args.path)
+    rejects_path = args.rejects or args.path + ".rejects.jsonl"
+
+    db = Database(DB_CONFIG)
+    total = inserted = failed = 0
+    start = time.perf_counter()
+    rejects = None
+    try:
+        # Hand create_tips a bounded chunk at a time so rejected rows can be
+        # written out with their content without keeping the whole file around.
+        while True:
+            chunk = list(islice(rows, args.batch_size * 10))
+            if not chunk:
+                break
+            if args.created_by is not None:
+                for row in chunk:
+                    if isinstance(row, dict):
+                        row.setdefault("created_by", args.created_by)
+            # index in chunk -> reason, for rows failing the rules or the insert
+            reasons: Dict[int, str] = {}
+            valid = range(len(chunk))
+            if not args.no_rules:
+                errors = db.get_incident_rules().validate_batch(chunk)
+                valid = [i for i, e in enumerate(errors) if not e]
+                reasons.update((i, " ".join(e)) for i, e in enumerate(errors) if e)
+            result = db.create_tips([chunk[i] for i in valid], batch_size=args.batch_size, collect_ids=False)
+            reasons.update((valid[f["index"]], f["error"]) for f in result["failed"])
+            inserted += result["inserted"]
+            failed += len(reasons)
+            if reasons:
+                if rejects is None:
+                    rejects = open(rejects_path, "w", encoding="utf-8")
+                for i in sorted(reasons):
+                    row = chunk[i]
+                    # read_jsonl passes undecodable lines through as their error text
+                    error = row if isinstance(row, str) else reasons[i]
+                    rejects.write(json.dumps({"record": total + i + 1, "error": error,
+                                              "row": row if isinstance(row, dict) else None}, default=str) + "\n")
+            total += len(chunk)
+            elapsed = time.perf_counter() - start
+            print(f"[Import] {total} rows read, {inserted} inserted, {failed} rejected "
+                  f"({total / elapsed:,.0f} rows/s)")
+    finally:
+        if rejects is not None:
+            rejects.close()
+        db.close()
+
+    elapsed = time.perf_counter() - start
+    print(f"[Import] Done: {inserted} of {total} rows imported in {elapsed:.1f}s.")
+    if failed:
+        print(f"[Import] {failed} rejected row(s) written to {rejects_path}")
+    return 1 if failed and not inserted else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,7 @@
+import time
+
+BOOT_STARTED = time.perf_counter()
+
 import sys
 import os
 import traceback
@@ -10,24 +14,22 @@ REPO_ROOT = os.path.abspath(os.path.join(BASE_DIR, os.pardir))
 if REPO_ROOT not in sys.path:
     sys.path.insert(0, REPO_ROOT)
 
-from config import DB as DB_CONFIG
-from database.db import Database
-from models.incident_factory import IncidentFactory
-from ui.app import TattleApp
+from startup_report import StartupReport
 
+# Boot order: the window and login screen come first; the database module, its
+# driver and the schema migrations load on a worker thread meanwhile (see
+# open_database and TattleApp.when_db_ready). Admin screens are imported the
+# first time they are shown. Run with --startup-report (or
+# TATTLE_STARTUP_REPORT=1) to print boot milestones and import times.
 
-def main():
-    db = None
 
-    # Initialize database
-    try:
-        db = Database(DB_CONFIG)
-        print("MySQL Database connected successfully.")
-    except Exception as e:
-        print("Database connection failed:", e)
-        traceback.print_exc()
-        print("\nFix DB credentials or start MySQL and try again.")
-        return
+def open_database():
+    """Connect, migrate and optionally seed the admin; runs on a worker thread."""
+    from config import DB as DB_CONFIG
+    from database.db import Database
+
+    db = Database(DB_CONFIG)
+    print(f"Database connected successfully ({db.backend.describe()}).")
 
     # Optional: seed admin from environment variables
     seed_flag = os.getenv("SEED_ADMIN", "").lower()
@@ -44,18 +46,32 @@ def main():
             except Exception as ex:
                 print("Failed to seed admin user:", ex)
                 traceback.print_exc()
+    return db
+
+
+def main():
+    startup = None
+    if "--startup-report" in sys.argv[1:] or os.getenv("TATTLE_STARTUP_REPORT", "").lower() in ("1", "true", "yes"):
+        startup = StartupReport(BOOT_STARTED)
+        startup.install()
+
+    # UI imports come after the import timer is installed
+    from models.incident_factory import IncidentFactory
+    from ui.app import TattleApp
 
-    # Start application
+    app = None
     try:
-        incident_factory = IncidentFactory()
-        app = TattleApp(db=db, incident_factory=incident_factory)
+        app = TattleApp(incident_factory=IncidentFactory(), db_factory=open_database, startup=startup)
         app.mainloop()
+        if startup is not None:
+            app.print_nav_report()
     except KeyboardInterrupt:
         print("\nApplication interrupted by user.")
     except Exception as e:
         print("An unexpected error occurred:", e)
         traceback.print_exc()
     finally:
+        db = getattr(app, "db", None)
         try:
             if db and hasattr(db, "close") and callable(db.close):
                 db.close()
@@ -65,4 +81,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,12 +1,16 @@
 from .abstract_incident import AbstractIncident
+from .dashboard_snapshot import DashboardSnapshot
 from .generic_incident import GenericIncident
 from .incident_factory import IncidentFactory
+from .tip_store import TipStore
 from .user import User, Admin, Reporter, Viewer
 
 __all__ = [
     "AbstractIncident",
+    "DashboardSnapshot",
     "GenericIncident",
     "IncidentFactory",
+    "TipStore",
     "User",
     "Admin",
     "Reporter",
@@ -4,6 +4,8 @@ from abc import ABC, abstractmethod
 class AbstractIncident(ABC):
     """Abstract base class for ANY kind of incident."""
 
+    __slots__ = ("_id", "_tip_name", "_incident_type", "_location", "_description", "_urgency", "_created_by")
+
     def __init__(self, tip_id, tip_name, incident_type, location, description, urgency, created_by=None):
         self._id = tip_id
         self._tip_name = tip_name
@@ -0,0 +1,100 @@
+from typing import Any, Dict, Iterable, List, Optional
+
+from database.db import row_sort_key
+
+URGENCY_ORDER = ["High", "Medium", "Low"]
+
+
+def normalize_urgency(value) -> str:
+    """Canonical bucket name for a stored urgency ("high " -> "High")."""
+    return (value or "").strip().capitalize()
+
+
+class DashboardSnapshot:
+    """One dashboard refresh: per-urgency counts plus the rows shown in each pane.
+
+    Both the urgency boxes and the global list are fed from the same snapshot.
+    ``global_rows`` are the first tips by name (every tip unless limited) and
+    ``total`` counts all tips, so the global list can say how many it leaves out.
+    """
+
+    def __init__(self, counts: Dict[str, int], by_urgency: Dict[str, List[Dict[str, Any]]],
+                 global_rows: List[Dict[str, Any]], total: Optional[int] = None):
+        self.counts = counts
+        self.by_urgency = by_urgency
+        self.global_rows = global_rows
+        self.total = len(global_rows) if total is None else total
+        self.round_trips = 0
+        self.fetch_ms = 0.0
+        # Data version the rows were read at (Database.change_watermark), if known
+        self.watermark: Optional[int] = None
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Dict[str, Any]], per_urgency_limit: Optional[int] = None,
+                  global_rows: Optional[List[Dict[str, Any]]] = None, global_limit: Optional[int] = None):
+        """Build from Database.dashboard_snapshot() rows (with ``urgency_total``)
+        or, as a fallback, from a plain list of every tip.
+
+        dashboard_snapshot() rows are only the newest per urgency, so pass the
+        global list's rows (first tips by name, e.g. from read_tips_page) as
+        ``global_rows``. Without them the list is built from ``rows``, which
+        must then be every tip.
+        """
+        counts = {u: 0 for u in URGENCY_ORDER}
+        by_urgency: Dict[str, List[Dict[str, Any]]] = {u: [] for u in URGENCY_ORDER}
+        partition_totals: Dict[Any, int] = {}
+        fetched = []
+        for row in rows:
+            fetched.append(row)
+            if "urgency_total" in row:
+                # Same total on every row of a partition; the urgency column is case-insensitive,
+                # so "high" and "High" rows share one
+                raw = row.get("urgency")
+                partition_totals[raw.lower() if isinstance(raw, str) else raw] = int(row["urgency_total"])
+            bucket = normalize_urgency(row.get("urgency"))
+            if bucket not in by_urgency:
+                continue
+            by_urgency[bucket].append(row)
+            if "urgency_total" not in row:
+                counts[bucket] += 1
+        for raw, n in partition_totals.items():
+            bucket = normalize_urgency(raw)
+            if bucket in counts:
+                counts[bucket] += n
+        if per_urgency_limit is not None:
+            for bucket in by_urgency:
+                del by_urgency[bucket][per_urgency_limit:]
+        # Partitions of unlisted urgencies (None, typos) count towards the total too
+        total = sum(partition_totals.values()) if partition_totals else len(fetched)
+        if global_rows is None:
+            global_rows = sorted(fetched, key=lambda r: row_sort_key("tip_name", r))
+        global_rows = list(global_rows[:global_limit] if global_limit is not None else global_rows)
+        return cls(counts, by_urgency, global_rows, total)
+
+    @classmethod
+    def from_store(cls, store, per_urgency_limit: Optional[int] = None, global_limit: Optional[int] = None):
+        """Build from a TipStore (models.tip_store) without going through row dicts.
+
+        Counts come from the store's dictionary-encoded urgency column; each
+        bucket lists its newest tips, like Database.dashboard_snapshot(), and
+        the global list the first ``global_limit`` tips by name, like from_rows().
+        """
+        counts = {u: 0 for u in URGENCY_ORDER}
+        for raw, n in store.counts("urgency").items():
+            bucket = normalize_urgency(raw)
+            if bucket in counts:
+                counts[bucket] += n
+        by_urgency: Dict[str, List[Dict[str, Any]]] = {}
+        for bucket in URGENCY_ORDER:
+            mask = store.where(urgency=lambda v, b=bucket: normalize_urgency(v) == b)
+            by_urgency[bucket] = list(store.view(store.order("created_at", True, mask=mask, limit=per_urgency_limit)))
+        global_rows = list(store.view(store.order("tip_name", limit=global_limit)))
+        return cls(counts, by_urgency, global_rows, len(store))
+
+    def hidden_count(self, urgency: str) -> int:
+        """Tips counted for ``urgency`` but not included in the snapshot rows."""
+        return max(0, self.counts.get(urgency, 0) - len(self.by_urgency.get(urgency, [])))
+
+    def hidden_global(self) -> int:
+        """Tips left out of the global list."""
+        return max(0, self.total - len(self.global_rows))
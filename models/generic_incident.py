@@ -1,18 +1,32 @@
+from typing import Tuple, Union
+
+from database.incident_rules import IncidentRules
+
 from .abstract_incident import AbstractIncident
 
 
 class GenericIncident(AbstractIncident):
     """Flexible incident type that adapts based on rules in DB."""
 
-    def validate(self, incident_rules: dict) -> bool:
+    __slots__ = ()
+
+    def validate(self, incident_rules: Union[IncidentRules, dict]) -> bool:
         """
-        incident_rules example:
+        incident_rules: Database.get_incident_rules(), or a plain dict such as
         {
            "min_description_length": 20
         }
         """
+        return not self.validation_errors(incident_rules)
+
+    def validation_errors(self, incident_rules: Union[IncidentRules, dict]) -> Tuple[str, ...]:
+        """Messages for each rule this incident breaks (empty when it is valid)."""
+        if isinstance(incident_rules, IncidentRules):
+            return incident_rules.errors(self.to_dict())
         min_len = incident_rules.get("min_description_length", 10)
-        return len(self._description.strip()) >= min_len
+        if len((self._description or "").strip()) < min_len:
+            return (f"description must be at least {min_len} characters.",)
+        return ()
 
     def display_summary(self) -> str:
         return f"[{self._incident_type.upper()}] {self._tip_name} — {self._location} ({self._urgency})"
\ No newline at end of file
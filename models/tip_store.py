@@ -0,0 +1,389 @@
+import bisect
+from array import array
+from collections import Counter
+from collections.abc import Sequence
+from itertools import compress, islice
+from math import prod
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from database.records import INTERNED_FIELDS, TIP_FIELDS, TipRecord
+
+# Low-cardinality columns, stored dictionary-encoded (one small code per row).
+CATEGORICAL_FIELDS = INTERNED_FIELDS
+# Free-text columns; they sort case-insensitively like the column collations.
+TEXT_FIELDS = ("tip_name", "location", "description")
+# Columns stored in typed arrays rather than lists of objects.
+ARRAY_FIELDS = {"id": "q", "row_version": "q"}
+
+# Fewer changed rows than this are merged into the cached sort orders one by
+# one; more and the orders are rebuilt on next use.
+PATCH_LIMIT = 1000
+# Deleted rows are skipped until they make up this share of the store, then
+# the columns are compacted.
+COMPACT_RATIO = 0.25
+
+
+def _and(a: bytes, b: bytes) -> bytearray:
+    """Element-wise AND of two 0/1 masks."""
+    n = len(a)
+    return bytearray((int.from_bytes(a, "little") & int.from_bytes(b, "little")).to_bytes(n, "little"))
+
+
+def _predicate(condition) -> Callable[[Any], bool]:
+    """where() condition -> predicate. Text compares case-insensitively, like the database."""
+    if callable(condition):
+        return condition
+    wanted = condition if isinstance(condition, (list, tuple, set, frozenset)) else (condition,)
+    folded = {w.lower() if isinstance(w, str) else w for w in wanted}
+    return lambda v: (v.lower() if isinstance(v, str) else v) in folded
+
+
+def _sort_key(column: str, value) -> tuple:
+    """Ascending key of one value, as database.db.row_sort_key orders it."""
+    # Imported here so loading models stays light during startup
+    from database.db import row_sort_key
+    return row_sort_key(column, {column: value})[:2]
+
+
+class _Categorical:
+    """Dictionary-encoded column: the distinct values plus one code per row."""
+
+    __slots__ = ("values", "codes", "_index")
+
+    def __init__(self):
+        self.values: List[Any] = []
+        self._index: Dict[Any, int] = {}
+        # bytearray while there are at most 256 distinct values, so masks and
+        # counts run in C (bytes.translate / bytes.count)
+        self.codes = bytearray()
+
+    def _code(self, value) -> int:
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.values)
+            self.values.append(value)
+            if code == 256 and isinstance(self.codes, bytearray):
+                self.codes = array("H", self.codes)
+        return code
+
+    def extend(self, values: List[Any]):
+        for value in set(values).difference(self._index):
+            self._code(value)
+        self.codes.extend(map(self._index.__getitem__, values))
+
+    def __getitem__(self, i: int):
+        return self.values[self.codes[i]]
+
+    def __setitem__(self, i: int, value):
+        self.codes[i] = self._code(value)
+
+    def column(self) -> List[Any]:
+        return list(map(self.values.__getitem__, self.codes))
+
+    def mask(self, predicate: Callable[[Any], bool]) -> bytearray:
+        return self.code_mask({code for code, value in enumerate(self.values) if predicate(value)})
+
+    def code_mask(self, hits: set) -> bytearray:
+        if isinstance(self.codes, bytearray):
+            return bytearray(self.codes.translate(bytes(c in hits for c in range(256))))
+        return bytearray(c in hits for c in self.codes)
+
+    def counts(self, mask: Optional[bytes] = None) -> Dict[Any, int]:
+        codes = self.codes if mask is None else bytes(compress(self.codes, mask))
+        if isinstance(codes, (bytes, bytearray)):
+            found = {code: codes.count(code) for code in range(len(self.values))}
+        else:
+            found = Counter(codes)
+        return {self.values[code]: n for code, n in found.items() if n}
+
+    def compact(self, live: bytes):
+        if isinstance(self.codes, bytearray):
+            self.codes = bytearray(compress(self.codes, live))
+        else:
+            self.codes = array(self.codes.typecode, compress(self.codes, live))
+
+
+class TipView(Sequence):
+    """Read-only sequence of TipRecords over a TipStore in a given row order.
+
+    Rows are built on access, so a table can page through a million-row order
+    without materialising it.
+    """
+
+    __slots__ = ("store", "order")
+
+    def __init__(self, store: "TipStore", order: Sequence[int]):
+        self.store = store
+        self.order = order
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self.store.record(j) for j in self.order[i]]
+        return self.store.record(self.order[i])
+
+
+class TipStore:
+    """Columnar copy of a set of tips for in-memory sorting, filtering and counting.
+
+    Rows are kept in id order. ``urgency``, ``status`` and ``incident_type``
+    are dictionary-encoded, id and row_version live in typed arrays, and the
+    other columns in plain lists. ``order(column)`` computes the ascending
+    sort permutation of a column once and then serves it (or its reverse)
+    from memory; ``where(...)`` returns a 0/1 byte mask; ``counts(...)``
+    groups. ``apply_changes`` folds a change-feed delta in, patching the
+    cached orders instead of discarding them.
+    """
+
+    def __init__(self, rows: Iterable[Dict[str, Any]] = ()):
+        self._columns: Dict[str, Any] = {}
+        for field in TIP_FIELDS:
+            if field in CATEGORICAL_FIELDS:
+                self._columns[field] = _Categorical()
+            elif field in ARRAY_FIELDS:
+                self._columns[field] = array(ARRAY_FIELDS[field])
+            else:
+                self._columns[field] = []
+        self.ids: array = self._columns["id"]
+        self.live = bytearray()  # 0 for deleted rows until the next compaction
+        self._dead = 0
+        self._orders: Dict[str, array] = {}
+        # Data version the rows are current to (see Database.changes_since)
+        self.watermark: Optional[int] = None
+        self.extend(rows)
+
+    def __len__(self) -> int:
+        return len(self.ids) - self._dead
+
+    # ---------- Loading ----------
+    def extend(self, rows: Iterable[Dict[str, Any]]):
+        """Append rows, e.g. the chunks of Database.read_tips_after (ascending ids)."""
+        rows = list(rows)
+        if not rows:
+            return
+        ids = [row["id"] for row in rows]
+        if ids != sorted(set(ids)) or (self.ids and ids[0] <= self.ids[-1]):
+            self.apply_changes(rows, ())
+            return
+        start = len(self.ids)
+        for field in TIP_FIELDS:
+            self._columns[field].extend(self._values(rows, field))
+        self.live.extend(b"\x01" * len(rows))
+        self._placed(range(start, len(self.ids)))
+
+    @staticmethod
+    def _values(rows: List[Dict[str, Any]], field: str) -> List[Any]:
+        try:
+            return list(map(attrgetter(field), rows))  # TipRecords
+        except AttributeError:
+            return [row.get(field) for row in rows]
+
+    # ---------- Rows ----------
+    def record(self, i: int) -> TipRecord:
+        """The row at storage position ``i``."""
+        return TipRecord(*(self._columns[field][i] for field in TIP_FIELDS))
+
+    def view(self, order: Optional[Sequence[int]] = None) -> TipView:
+        """Rows in ``order`` (default: every live row in id order) as a lazy sequence."""
+        return TipView(self, self.order("id") if order is None else order)
+
+    def column(self, field: str) -> List[Any]:
+        """All values of ``field`` in storage order (deleted rows included)."""
+        col = self._columns[field]
+        return col.column() if isinstance(col, _Categorical) else list(col)
+
+    def position(self, tip_id: int) -> Optional[int]:
+        """Storage position of a live tip, or None."""
+        i = self._find(tip_id)
+        return i if i is not None and self.live[i] else None
+
+    def _find(self, tip_id: int) -> Optional[int]:
+        i = bisect.bisect_left(self.ids, tip_id)
+        return i if i < len(self.ids) and self.ids[i] == tip_id else None
+
+    # ---------- Sorting ----------
+    def order(self, column: str, descending: bool = False, mask: Optional[bytes] = None,
+              limit: Optional[int] = None) -> array:
+        """Positions of the live rows (those set in ``mask``) sorted by ``column``, then id.
+
+        Matches ORDER BY SORT_EXPRESSIONS[column], id in SQL. The first call
+        for a column sorts; later calls, in either direction, reuse it.
+        """
+        perm = self._orders.get(column)
+        if perm is None:
+            perm = self._orders[column] = self._sort(column)
+        if descending:
+            perm = perm[::-1]
+        keep = self.live if mask is None else (_and(mask, self.live) if self._dead else mask)
+        if self._dead or mask is not None:
+            rows = filter(keep.__getitem__, perm)
+            return array("I", islice(rows, limit) if limit is not None else rows)
+        return perm[:limit] if limit is not None else perm[:]
+
+    def _sort(self, column: str) -> array:
+        n = len(self.ids)
+        col = self._columns[column]
+        if column == "id":
+            return array("I", range(n))
+        if isinstance(col, _Categorical):
+            # Counting sort: one pass per distinct sort key; positions within a
+            # pass come out ascending, i.e. in id order.
+            groups: Dict[tuple, List[int]] = {}
+            for code, value in enumerate(col.values):
+                groups.setdefault(_sort_key(column, value), []).append(code)
+            perm = array("I")
+            for key in sorted(groups):
+                perm.extend(compress(range(n), col.code_mask(set(groups[key]))))
+            return perm
+        values = col
+        nulls = [i for i, v in enumerate(values) if v is None] if None in values else []
+        rest = range(n) if not nulls else [i for i, v in enumerate(values) if v is not None]
+        try:
+            keys = values
+            if column in TEXT_FIELDS:
+                keys = [v.lower() if v is not None else "" for v in values] if nulls else list(map(str.lower, values))
+            # sorted() is stable and positions are in id order, so ties stay by id
+            ordered = sorted(rest, key=keys.__getitem__)
+        except TypeError:  # mixed types (e.g. an unparsed timestamp string)
+            ordered = sorted(rest, key=lambda i: (_sort_key(column, values[i]), i))
+        return array("I", nulls + ordered if nulls else ordered)
+
+    def _position_key(self, column: str) -> Callable[[int], tuple]:
+        col = self._columns[column]
+        return lambda i: (_sort_key(column, col[i]), i)
+
+    # ---------- Filtering and grouping ----------
+    def where(self, **conditions) -> bytearray:
+        """0/1 mask of live rows matching every condition.
+
+        A condition is a value (case-insensitive for text, like the database's
+        equality filters), a collection of values, or a predicate.
+        """
+        mask = bytearray(self.live)
+        for field, condition in conditions.items():
+            predicate = _predicate(condition)
+            col = self._columns[field]
+            if isinstance(col, _Categorical):
+                hits = col.mask(predicate)
+            else:
+                hits = bytearray(map(bool, map(predicate, col)))
+            mask = _and(mask, hits)
+        return mask
+
+    def counts(self, by, mask: Optional[bytes] = None) -> Dict[Any, int]:
+        """Live rows (within ``mask``) per value of column ``by``, or per tuple of values."""
+        keep = self.live if mask is None else _and(mask, self.live)
+        if isinstance(by, str):
+            col = self._columns[by]
+            if isinstance(col, _Categorical):
+                return col.counts(None if mask is None and not self._dead else keep)
+            return dict(Counter(compress(col, keep)))
+        columns = [self._columns[field] for field in by]
+        if all(isinstance(c, _Categorical) for c in columns) and prod(len(c.values) for c in columns) <= 64:
+            # Few combinations: narrow the mask one column at a time, in C
+            groups = [((), keep)]
+            for col in columns:
+                groups = [(key + (value,), sub) for key, base in groups
+                          for code, value in enumerate(col.values)
+                          for sub in (_and(base, col.code_mask({code})),) if 1 in sub]
+            return {key: sub.count(1) for key, sub in groups}
+        # Count code tuples, then decode each distinct tuple once
+        raw = Counter(compress(zip(*(c.codes if isinstance(c, _Categorical) else c for c in columns)), keep))
+        decoders = [c.values.__getitem__ if isinstance(c, _Categorical) else None for c in columns]
+        return {tuple(d(v) if d else v for d, v in zip(decoders, key)): n for key, n in raw.items()}
+
+    # ---------- Changes ----------
+    def apply_changes(self, changed: Iterable[Dict[str, Any]], deleted: Iterable[int]):
+        """Fold in rows written and ids deleted since the store was loaded."""
+        changed = list(changed)
+        patch = len(changed) <= PATCH_LIMIT
+        if not patch:
+            self._orders.clear()
+        for tip_id in deleted:
+            i = self.position(tip_id)
+            if i is not None:
+                self.live[i] = 0
+                self._dead += 1
+        appended = []
+        for row in sorted(changed, key=lambda r: r["id"]):
+            i = self._find(row["id"])
+            if i is not None:
+                if not self.live[i]:
+                    self.live[i] = 1
+                    self._dead -= 1
+                self._update(i, row, patch)
+            elif not self.ids or row["id"] > self.ids[-1]:
+                appended.append(row)
+            else:
+                self._insert(row)
+        if appended:
+            start = len(self.ids)
+            for field in TIP_FIELDS:
+                self._columns[field].extend(self._values(appended, field))
+            self.live.extend(b"\x01" * len(appended))
+            self._placed(range(start, len(self.ids)))
+        if self._dead > COMPACT_RATIO * len(self.ids):
+            self._compact()
+
+    def _update(self, i: int, row: Dict[str, Any], patch: bool):
+        for field in TIP_FIELDS:
+            if field not in row or field == "id":
+                continue
+            col = self._columns[field]
+            value = row[field]
+            if col[i] == value:
+                continue
+            perm = self._orders.get(field) if patch else None
+            if perm is not None:
+                # The order is sorted by (key, position): find the row by its old key
+                key = self._position_key(field)
+                del perm[bisect.bisect_left(perm, key(i), key=key)]
+            col[i] = value
+            if perm is not None:
+                bisect.insort(perm, i, key=key)
+
+    def _placed(self, positions: range):
+        """Add freshly appended positions to the cached orders."""
+        if len(positions) > PATCH_LIMIT:
+            self._orders.clear()
+            return
+        for column, perm in self._orders.items():
+            key = self._position_key(column)
+            for i in positions:
+                bisect.insort(perm, i, key=key)
+
+    def _insert(self, row: Dict[str, Any]):
+        # An id below the highest loaded one (not produced by AUTO_INCREMENT):
+        # insert in place; positions shift, so the cached orders are rebuilt.
+        i = bisect.bisect_left(self.ids, row["id"])
+        for field in TIP_FIELDS:
+            col = self._columns[field]
+            if isinstance(col, _Categorical):
+                col.codes.insert(i, col._code(row.get(field)))
+            else:
+                col.insert(i, row.get(field))
+        self.live.insert(i, 1)
+        self._orders.clear()
+
+    def _compact(self):
+        """Drop deleted rows from every column (positions change, so orders are rebuilt)."""
+        live = bytes(self.live)
+        for field in TIP_FIELDS:
+            col = self._columns[field]
+            if isinstance(col, _Categorical):
+                col.compact(live)
+            elif isinstance(col, array):
+                self._columns[field] = array(col.typecode, compress(col, live))
+            else:
+                self._columns[field] = list(compress(col, live))
+        self.ids = self._columns["id"]
+        self.live = bytearray(b"\x01" * len(self.ids))
+        self._dead = 0
+        self._orders.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"rows": len(self), "deleted": self._dead, "orders": sorted(self._orders),
+                "categories": {f: len(self._columns[f].values) for f in CATEGORICAL_FIELDS}}
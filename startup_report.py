@@ -0,0 +1,107 @@
+import builtins
+import sys
+import threading
+import time
+from importlib.util import resolve_name
+from typing import List, Optional, Tuple
+
+# Module: startup_report.py
+# Purpose: Optional boot timing for main.py (--startup-report, or
+# TATTLE_STARTUP_REPORT=1). Milestones (window created, window visible,
+# database ready) are timed from the start of main.py. Every module import is
+# timed in the style of ``python -X importtime`` (self and cumulative ms), per
+# thread, so imports moved off the Tk thread show up as such. Kept to the
+# standard library so it can be installed before anything heavy is imported.
+
+
+class StartupReport:
+    """Collects boot milestones and per-module import times until printed."""
+
+    def __init__(self, t0: Optional[float] = None):
+        self.t0 = time.perf_counter() if t0 is None else t0
+        # (label, seconds since t0, thread name)
+        self.marks: List[Tuple[str, float, str]] = []
+        # (module, self seconds, cumulative seconds, depth, thread name)
+        self.imports: List[Tuple[str, float, float, int, str]] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._original_import = None
+        self._hook = self._import
+        self._active = False
+
+    # ---------- Import timing ----------
+    def install(self):
+        """Start timing imports (wraps builtins.__import__)."""
+        if self._original_import is None:
+            self._original_import = builtins.__import__
+            builtins.__import__ = self._hook
+        self._active = True
+
+    def uninstall(self):
+        """Stop timing; if something wrapped __import__ after us, our hook just passes through."""
+        self._active = False
+        if builtins.__import__ is self._hook:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original = self._original_import
+        if not self._active:
+            return original(name, globals, locals, fromlist, level)
+        full = name
+        if level:
+            try:
+                package = (globals or {}).get("__package__") or (globals or {}).get("__name__")
+                full = resolve_name("." * level + name, package)
+            except (ImportError, ValueError):
+                pass
+        # Fast path for the common case: nothing new will be loaded
+        if full in sys.modules:
+            new = [f"{full}.{f}" for f in fromlist or () if f != "*" and f"{full}.{f}" not in sys.modules
+                   and not hasattr(sys.modules[full], f)]
+            if not new:
+                return original(name, globals, locals, fromlist, level)
+            full = new[0]
+
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        depth = len(stack)
+        stack.append(0.0)  # time spent in nested imports
+        start = time.perf_counter()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            with self._lock:
+                self.imports.append((full, elapsed - children, elapsed, depth, threading.current_thread().name))
+
+    # ---------- Milestones ----------
+    def mark(self, label: str):
+        with self._lock:
+            self.marks.append((label, time.perf_counter() - self.t0, threading.current_thread().name))
+
+    def has_mark(self, label: str) -> bool:
+        with self._lock:
+            return any(m[0] == label for m in self.marks)
+
+    def print_report(self, top: int = 15):
+        """Print milestones, import totals per thread and the slowest imports."""
+        with self._lock:
+            marks, imports = list(self.marks), list(self.imports)
+        print("[Startup] Milestones (since main.py started):")
+        for label, at, thread in marks:
+            print(f"[Startup]   {at * 1000:8.1f} ms  {label}" + ("" if thread == "MainThread" else f"  ({thread})"))
+        totals = {}
+        for _, _, cumulative, depth, thread in imports:
+            if depth == 0:
+                totals[thread] = totals.get(thread, 0.0) + cumulative
+        print("[Startup] Import time by thread: " +
+              ", ".join(f"{thread} {t * 1000:.1f} ms" for thread, t in sorted(totals.items(), key=lambda x: -x[1])))
+        print(f"[Startup] Slowest {top} imports (self ms | cumulative ms | module):")
+        for module, own, cumulative, _, thread in sorted(imports, key=lambda x: -x[1])[:top]:
+            where = "" if thread == "MainThread" else f"  ({thread})"
+            print(f"[Startup]   {own * 1000:8.1f} | {cumulative * 1000:8.1f} | {module}{where}")
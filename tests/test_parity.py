@@ -0,0 +1,32 @@
+"""The backend parity workload (database.parity_check) under pytest.
+
+The SQLite targets always run. The MySQL case needs mysql-connector and a
+server reachable with config.DB's credentials, and is skipped otherwise; it
+uses a scratch database that is dropped afterwards.
+"""
+import pytest
+
+from config import DB as DB_CONFIG
+from database import parity_check
+
+
+@pytest.fixture(scope="module")
+def sqlite_results(tmp_path_factory):
+    tmpdir = str(tmp_path_factory.mktemp("parity"))
+    return {name: parity_check._run_target(cfg) for name, cfg in parity_check.sqlite_targets(tmpdir).items()}
+
+
+def test_sqlite_targets_agree(sqlite_results):
+    assert parity_check.mismatches(sqlite_results) == []
+
+
+def test_mysql_matches_sqlite(sqlite_results):
+    pytest.importorskip("mysql.connector")
+    database = f"{DB_CONFIG.get('database', 'tattlestoolie_db')}_parity"
+    if not parity_check._mysql_scratch(database):
+        pytest.skip("MySQL server not reachable")
+    try:
+        mysql = parity_check._run_target(dict(DB_CONFIG, backend="mysql", database=database))
+    finally:
+        parity_check._mysql_scratch(database, drop=True)
+    assert parity_check.mismatches({"sqlite": sqlite_results["sqlite"], "mysql": mysql}) == []
@@ -1,6 +1,7 @@
 import customtkinter as ctk
 from tkinter import messagebox
-from PIL import Image
+
+from ui.assets import load_image
 
 
 class AdminSubmitTipFrame(ctk.CTkFrame):
@@ -21,7 +22,7 @@ class AdminSubmitTipFrame(ctk.CTkFrame):
 
         # Attempt to load a logo image; if missing, fall back to a text label.
         try:
-            main_logo = ctk.CTkImage(light_image=Image.open("assets/main_logo.png"), size=(60, 60))
+            main_logo = load_image("main_logo.png", (60, 60))
             ctk.CTkLabel(self.sidebar, image=main_logo, text="",
                          width=60, height=60, corner_radius=0, fg_color="#2B2B2B").pack(pady=(25, 10))
         except Exception:
@@ -326,24 +327,18 @@ class AdminSubmitTipFrame(ctk.CTkFrame):
         return True
 
     def _save_tip(self, payload):
-        # Persist payload using the application's DB interface.
-        # The method attempts common DB method names to be tolerant of different DB wrappers.
+        # Persist payload using the application's DB interface. Runs on a worker
+        # thread, so failures are raised (and shown by the caller) rather than
+        # displayed here.
         db = getattr(self.app, "db", None)
         if not db:
-            messagebox.showerror("Error", "Database unavailable.")
-            return False, None
+            raise RuntimeError("Database unavailable.")
+        # Attempt to call the DB.create_tip with a dict; fallback to kwargs if signature differs.
         try:
-            # Attempt to call the DB.create_tip with a dict; fallback to kwargs if signature differs.
-            try:
-                new_id = db.create_tip(payload)  # dict-style
-            except TypeError:
-                # If your DB.create_tip expects keyword args instead, call it with **
-                new_id = db.create_tip(**payload)
-            return True, new_id
-        except Exception as e:
-            # Surface DB errors to the user while keeping the UI responsive.
-            messagebox.showerror("DB Error", f"Failed to save tip:\n{e}")
-            return False, None
+            return db.create_tip(payload)  # dict-style
+        except TypeError:
+            # If your DB.create_tip expects keyword args instead, call it with **
+            return db.create_tip(**payload)
 
     def _clear(self):
         # Reset all form inputs to their default / empty state and restore focus.
@@ -359,13 +354,16 @@ class AdminSubmitTipFrame(ctk.CTkFrame):
 
     # ------------------ ACTIONS ------------------
     def submit_tip(self):
-        # Collect -> validate -> save flow. Displays success or error dialogs accordingly.
+        # Collect -> validate -> save flow. Saving runs in the background and the
+        # success or error dialog is shown once it completes.
         payload = self._collect_payload()
         if not self._validate(payload):
             return
-        ok, tip_id = self._save_tip(payload)
-        if not ok:
-            return  # _save_tip already showed an error message
+        self.app.run_async(self._save_tip, payload, key="admin.submit",
+                           on_success=self._on_submitted,
+                           on_error=lambda e: messagebox.showerror("DB Error", f"Failed to save tip:\n{e}"))
+
+    def _on_submitted(self, tip_id):
         # Success message and clear form
         msg = "Tip submitted successfully."
         messagebox.showinfo("Success", msg)
@@ -385,5 +383,4 @@ class AdminSubmitTipFrame(ctk.CTkFrame):
     # ---------- Logout ----------
     def logout(self):
         # Clear current user and navigate to login frame.
-        self.app.current_user = None
-        self.app.show_frame("LoginFrame")
\ No newline at end of file
+        self.app.logout()
\ No newline at end of file
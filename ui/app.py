@@ -1,15 +1,47 @@
+import traceback
 import customtkinter as ctk
 from tkinter import messagebox
 
+from config import APP as APP_CONFIG
+from ui.assets import UI_ASSETS, get_assets
+from ui.frame_cache import FrameCache, NavTimings
+from ui.tasks import TaskRunner
+
 
 class TattleApp(ctk.CTk):
     """Main application: manages frame navigation, user session, and layout."""
-    
-    def __init__(self, db, incident_factory):
+
+    # Screens a signed-in user is likely to open next, built in idle time after login
+    PREWARM = {
+        "admin": ("ManageTipsFrame", "EditTipFrame", "AdminSubmitTipFrame"),
+        "user": ("ReporterExitFrame",),
+    }
+    # Frames that hold no user data and survive a logout
+    PUBLIC_FRAMES = ("LoginFrame", "RegisterFrame")
+
+    def __init__(self, db=None, incident_factory=None, db_factory=None, startup=None):
+        """Pass an open ``db``, or a ``db_factory`` that opens one on a worker thread.
+
+        With a factory the login screen is shown straight away and DB work asked
+        for before the connection is up waits in when_db_ready(). ``startup`` is
+        an optional startup_report.StartupReport to record boot milestones in.
+        """
         super().__init__()
         self.db = db
+        self.db_error = None
+        self._db_waiters = []
         self.incident_factory = incident_factory
         self.current_user = None
+        self.startup = startup
+
+        # Background executor for DB work; callbacks come back on the Tk thread
+        self.tasks = TaskRunner(self)
+        self.tasks.add_busy_listener(self._on_busy_changed)
+
+        # Connect (and migrate) while the window is being built
+        if db is None and db_factory is not None:
+            self.run_async(db_factory, key="db.connect",
+                           on_success=self._on_db_ready, on_error=self._on_db_failed)
 
         self.title("TattleStoolie")
         self.after(10, lambda: self.state("zoomed"))
@@ -32,12 +64,95 @@ class TattleApp(ctk.CTk):
         }
 
         self.admin_only_frames = {"DashboardFrame", "ManageTipsFrame", "AdminSubmitTipFrame"}
-        self.dynamic_frame = {"EditTipFrame"}
-        self.frame_instances: dict[str, ctk.CTkFrame] = {}
+        # Frames rebuilt on every visit. Frames with accept_kwargs(**kwargs) are
+        # reused and rebound to new arguments instead (EditTipFrame); others
+        # shown with arguments are rebuilt.
+        self.dynamic_frame: set[str] = set()
+        cache_cfg = APP_CONFIG.get("frame_cache") or {}
+        self.frames = FrameCache(max_frames=int(cache_cfg.get("max_frames", 8)),
+                                 max_widgets=int(cache_cfg.get("max_widgets", 6000)))
+        self.prewarm_enabled = bool(cache_cfg.get("prewarm", True))
+        self.nav_timings = NavTimings()
+        self._prewarm_queue: list[str] = []
+        self._prewarm_after_id = None
         self.history: list[str] = []
         self._frame: ctk.CTkFrame | None = None
+        self._frame_key: str | None = None
+
+        # Scale the image assets for this display and load them off the Tk thread;
+        # frames built before this finishes just wait for the image they need
+        assets = get_assets()
+        assets.scaling = ctk.ScalingTracker.get_window_scaling(self)
+        self.run_async(assets.preload, UI_ASSETS, key="assets.preload", quiet=True,
+                       on_error=lambda e: print(f"[Assets] Preload failed: {e}"))
 
         self.show_frame("LoginFrame", push_history=False)
+        if startup is not None:
+            startup.mark("window created")
+            self.bind("<Map>", self._on_first_map, add="+")
+
+    # ---------- Database readiness ----------
+    def when_db_ready(self, callback):
+        """Call ``callback()`` on the Tk thread once the database is connected."""
+        if self.db is not None:
+            callback()
+        elif self.db_error is not None:
+            self._show_db_error()
+        else:
+            self._db_waiters.append(callback)
+
+    def _on_db_ready(self, db):
+        self.db = db
+        self._startup_mark("database ready")
+        waiters, self._db_waiters = self._db_waiters, []
+        for callback in waiters:
+            callback()
+
+    def _on_db_failed(self, e):
+        self.db_error = e
+        self._db_waiters.clear()
+        print("Database connection failed:", e)
+        traceback.print_exception(type(e), e, e.__traceback__)
+        self._startup_mark("database failed")
+        self._show_db_error()
+        self.destroy()
+
+    def _show_db_error(self):
+        messagebox.showerror(
+            "Database",
+            f"Could not connect to the database:\n{self.db_error}\n\n"
+            "Fix DB credentials or start MySQL (or set DB_BACKEND=sqlite) and try again.")
+
+    # ---------- Startup report ----------
+    def _on_first_map(self, event):
+        if event.widget is self and self.startup is not None and not self.startup.has_mark("window visible"):
+            self._startup_mark("window visible")
+
+    def _startup_mark(self, label: str):
+        """Record a boot milestone; print the report once the window is up and the DB settled."""
+        startup = self.startup
+        if startup is None:
+            return
+        startup.mark(label)
+        if startup.has_mark("window visible") and (self.db is not None or self.db_error is not None):
+            self.startup = None
+            startup.uninstall()
+            startup.print_report()
+
+    def run_async(self, fn, *args, **kwargs):
+        """Run a blocking call off the Tk thread (see TaskRunner.submit for callbacks)."""
+        return self.tasks.submit(fn, *args, **kwargs)
+
+    def _on_busy_changed(self, busy: bool):
+        """Show a busy cursor while any background task is in flight."""
+        try:
+            self.configure(cursor="watch" if busy else "")
+        except Exception:
+            pass
+
+    def destroy(self):
+        self.tasks.shutdown()
+        super().destroy()
 
     def _is_admin(self) -> bool:
         """Check if current user has admin privileges."""
@@ -66,9 +181,11 @@ class TattleApp(ctk.CTk):
 
     def show_frame(self, frame_class_or_key, push_history: bool = True, **kwargs):
         """Navigate to a frame by key or class. Manages caching, history, and permissions."""
+        started = self.nav_timings.start()
         if isinstance(frame_class_or_key, str):
-            key = frame_class_or_key
-            frame_class = self._resolve_frame_class(key)
+            key, frame_class = frame_class_or_key, None
+            if key not in self.frame_registry:
+                raise KeyError(f"Frame '{key}' not registered")
         else:
             frame_class = frame_class_or_key
             key = frame_class.__name__
@@ -76,36 +193,40 @@ class TattleApp(ctk.CTk):
         # Enforce admin-only access
         if key in self.admin_only_frames and not self._is_admin():
             messagebox.showerror("Forbidden", "You do not have permission to view that screen.")
-            key = "SubmitTipFrame"
-            frame_class = self._resolve_frame_class(key)
+            key, frame_class = "SubmitTipFrame", None
             push_history = False
 
         if push_history and self._frame:
-            self.history.append(self._frame.__class__.__name__)
+            self.history.append(self._frame_key)
 
-        needs_new_instance = (key in self.dynamic_frame) or (key not in self.frame_instances) or bool(kwargs)
+        frame_instance = self.frames.get(key)
+        if frame_instance is not None and (
+                key in self.dynamic_frame or (kwargs and not hasattr(frame_instance, "accept_kwargs"))):
+            # Can't be rebound to these arguments: build a new one
+            self.frames.pop(key)
+            if frame_instance is self._frame:
+                self._hide_current()  # destroys it, now that it is out of the cache
+            else:
+                frame_instance.destroy()
+            frame_instance = None
 
-        if needs_new_instance:
-            if key in self.dynamic_frame and self._frame and self._frame.__class__.__name__ == key:
-                self._frame.destroy()
-            if key not in self.dynamic_frame and key in self.frame_instances and kwargs:
-                self.frame_instances[key].destroy()
-
-            frame_instance = frame_class(self.container, self, **kwargs)
-            if key not in self.dynamic_frame and not kwargs:
-                self.frame_instances[key] = frame_instance
+        if frame_instance is None:
+            kind = "built"
+            frame_instance = (frame_class or self._resolve_frame_class(key))(self.container, self, **kwargs)
+        elif kwargs:
+            kind = "rebound"
+            try:
+                frame_instance.accept_kwargs(**kwargs)
+            except Exception as e:
+                print(f"[App] accept_kwargs failed for {key}: {e}")
         else:
-            frame_instance = self.frame_instances[key]
-            if kwargs and hasattr(frame_instance, "accept_kwargs"):
-                try:
-                    frame_instance.accept_kwargs(**kwargs)
-                except Exception as e:
-                    print(f"[App] accept_kwargs failed for {key}: {e}")
+            kind = "reused"
 
-        if self._frame and frame_instance is not self._frame:
-            self._frame.pack_forget()
+        previous_key = self._frame_key if frame_instance is not self._frame else None
+        if previous_key is not None:
+            self._hide_current()
 
-        self._frame = frame_instance
+        self._frame, self._frame_key = frame_instance, key
         self._frame.pack(fill="both", expand=True)
 
         if hasattr(frame_instance, "on_show"):
@@ -114,6 +235,87 @@ class TattleApp(ctk.CTk):
             except Exception as e:
                 print(f"[App] on_show failed for {key}: {e}")
 
+        if key not in self.dynamic_frame:
+            evicted = self.frames.put(key, frame_instance)
+            # The frame just hidden may have grown while shown (rows loaded)
+            if previous_key is not None:
+                evicted += self.frames.measure(previous_key, protect=(key,))
+            if evicted:
+                print(f"[Frames] evicted {', '.join(evicted)} ({self.frames.widgets()} widgets cached)")
+
+        samples = self.nav_timings.record(key, kind, started)
+        self.after_idle(lambda: self.nav_timings.finish(samples, started))
+
+    def _hide_current(self):
+        frame, key = self._frame, self._frame_key
+        if frame is None:
+            return
+        if hasattr(frame, "on_hide"):
+            try:
+                frame.on_hide()
+            except Exception as e:
+                print(f"[App] on_hide failed for {key}: {e}")
+        frame.pack_forget()
+        self._frame, self._frame_key = None, None
+        # Frames kept out of the cache (dynamic_frame) are not coming back
+        if key not in self.frames:
+            frame.destroy()
+
+    # ---------- Prewarming ----------
+    def prewarm(self, keys=None):
+        """Build frames the user is likely to open next, one per idle slot.
+
+        Defaults to PREWARM for the current user's role. Frames are built but
+        not shown (no on_show), so opening one later only packs it.
+        """
+        if not self.prewarm_enabled:
+            return
+        if keys is None:
+            keys = self.PREWARM["admin" if self._is_admin() else "user"]
+        self._prewarm_queue = [k for k in keys if k not in self.frames and k != self._frame_key]
+        if self._prewarm_queue and self._prewarm_after_id is None:
+            self._prewarm_after_id = self.after_idle(self._prewarm_next)
+
+    def _prewarm_next(self):
+        self._prewarm_after_id = None
+        while self._prewarm_queue:
+            key = self._prewarm_queue.pop(0)
+            if key in self.frames or key == self._frame_key:
+                continue
+            if key in self.admin_only_frames and not self._is_admin():
+                continue
+            started = self.nav_timings.start()
+            try:
+                frame = self._resolve_frame_class(key)(self.container, self)
+            except Exception as e:
+                print(f"[Frames] prewarm of {key} failed: {e}")
+                continue
+            self.nav_timings.record(key, "prewarm", started)
+            evicted = self.frames.put(key, frame, protect=(self._frame_key,) if self._frame_key else ())
+            if key in evicted:
+                # No room for it within the budget: stop prewarming
+                self._prewarm_queue.clear()
+            break
+        if self._prewarm_queue:
+            # Let pending events (clicks, redraws) in between builds
+            self._prewarm_after_id = self.after(50, self._prewarm_when_idle)
+
+    def _prewarm_when_idle(self):
+        self._prewarm_after_id = self.after_idle(self._prewarm_next)
+
+    def _cancel_prewarm(self):
+        self._prewarm_queue.clear()
+        if self._prewarm_after_id is not None:
+            try:
+                self.after_cancel(self._prewarm_after_id)
+            except Exception:
+                pass
+            self._prewarm_after_id = None
+
+    def print_nav_report(self):
+        """Print navigation latencies per frame (see ui.frame_cache.NavTimings)."""
+        self.nav_timings.print_report(self.frames.stats()["sizes"])
+
     def go_back(self):
         """Navigate to previous frame in history; default to LoginFrame if empty."""
         while self.history:
@@ -124,7 +326,10 @@ class TattleApp(ctk.CTk):
         self.show_frame("LoginFrame", push_history=False)
 
     def logout(self):
-        """Clear session and return to login."""
+        """Clear session and return to login; frames built for the user are dropped."""
+        self._cancel_prewarm()
         self.current_user = None
         self.history.clear()
-        self.show_frame("LoginFrame", push_history=False)
\ No newline at end of file
+        self.show_frame("LoginFrame", push_history=False)
+        # Deferred: the sign-out button's own frame is among those destroyed
+        self.after_idle(lambda: self.frames.clear(keep=self.PUBLIC_FRAMES))
\ No newline at end of file
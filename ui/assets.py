@@ -0,0 +1,174 @@
+import glob
+import os
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+import customtkinter as ctk
+from PIL import Image
+
+from config import APP as APP_CONFIG, BASE_DIR
+
+# Module: assets.py
+# Purpose: Decode each image asset once per process and share it across frames.
+# Frames ask for (name, size) and get a shared CTkImage holding a copy already
+# scaled to that size, so the 500x500 logo is not kept at full resolution by
+# every sidebar. Scaled copies are also written to a disk cache as raw pixels
+# keyed by the source file's mtime and size. On the next start they load with a
+# plain read instead of a PNG decode, and the full-resolution file is only
+# opened when some size is missing.
+
+Size = Tuple[int, int]
+_CACHE_MAGIC = b"TSASSET1"
+_LANCZOS = getattr(Image, "Resampling", Image).LANCZOS
+
+
+class AssetManager:
+    """Process-wide cache of scaled PIL images and the CTkImages wrapping them."""
+
+    def __init__(self, asset_dir: str, cache_dir: Optional[str] = None, scaling: float = 1.0):
+        self.asset_dir = asset_dir
+        self.cache_dir = cache_dir or None
+        # Display scaling: images are pre-scaled to size * scaling so CTkImage
+        # never has to upscale them on HiDPI screens
+        self.scaling = scaling
+        self._lock = threading.Lock()
+        self._sources: Dict[str, Image.Image] = {}
+        self._scaled: Dict[Tuple[str, Size], Image.Image] = {}
+        self._ctk: Dict[Tuple[str, Size], ctk.CTkImage] = {}
+        self._stats = {"decodes": 0, "disk_hits": 0, "disk_writes": 0, "hits": 0}
+
+    def _pixel_size(self, size: Size) -> Size:
+        return (max(1, round(size[0] * self.scaling)), max(1, round(size[1] * self.scaling)))
+
+    # ---------- Disk cache ----------
+    def _cache_path(self, name: str, pixels: Size) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        st = os.stat(os.path.join(self.asset_dir, name))
+        stem = os.path.splitext(name)[0].replace(os.sep, "_")
+        return os.path.join(self.cache_dir, f"{stem}-{pixels[0]}x{pixels[1]}-{st.st_mtime_ns:x}-{st.st_size:x}.raw")
+
+    @staticmethod
+    def _read_cached(path: str) -> Optional[Image.Image]:
+        try:
+            with open(path, "rb") as f:
+                magic, mode, width, height = f.readline().split()
+                if magic != _CACHE_MAGIC:
+                    return None
+                size = (int(width), int(height))
+                return Image.frombytes(mode.decode("ascii"), size, f.read())
+        except (OSError, ValueError):
+            return None
+
+    def _write_cached(self, path: str, img: Image.Image):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Files for an older version of this asset at this size are stale
+            for old in glob.glob(path.rsplit("-", 2)[0] + "-*.raw"):
+                if old != path:
+                    os.remove(old)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(b"%s %s %d %d\n" % (_CACHE_MAGIC, img.mode.encode("ascii"), img.width, img.height))
+                f.write(img.tobytes())
+            os.replace(tmp, path)
+            self._stats["disk_writes"] += 1
+        except OSError as e:
+            print(f"[Assets] Could not write {path}: {e}")
+
+    # ---------- Images ----------
+    def _source(self, name: str) -> Image.Image:
+        img = self._sources.get(name)
+        if img is None:
+            with Image.open(os.path.join(self.asset_dir, name)) as f:
+                mode = "RGBA" if f.mode in ("P", "LA", "RGBA") or "transparency" in f.info else "RGB"
+                img = f.convert(mode) if f.mode != mode else f.copy()
+            self._sources[name] = img
+            self._stats["decodes"] += 1
+        return img
+
+    def pil(self, name: str, size: Size) -> Image.Image:
+        """``name`` (relative to the asset dir) scaled to ``size`` times the display scaling.
+
+        Raises OSError if the asset is missing or unreadable, like Image.open.
+        """
+        pixels = self._pixel_size(size)
+        key = (name, pixels)
+        with self._lock:
+            img = self._scaled.get(key)
+            if img is not None:
+                self._stats["hits"] += 1
+                return img
+            path = self._cache_path(name, pixels)
+            img = self._read_cached(path) if path else None
+            if img is not None:
+                self._stats["disk_hits"] += 1
+            else:
+                img = self._source(name)
+                if img.size != pixels:
+                    # reducing_gap: box-shrink most of the way first, Lanczos only the last step
+                    img = img.resize(pixels, _LANCZOS, reducing_gap=3.0)
+                if path:
+                    self._write_cached(path, img)
+            self._scaled[key] = img
+            return img
+
+    def image(self, name: str, size: Size) -> ctk.CTkImage:
+        """Shared CTkImage of ``name`` displayed at ``size``; call on the Tk thread."""
+        key = (name, tuple(size))
+        img = self._ctk.get(key)
+        if img is None:
+            img = ctk.CTkImage(light_image=self.pil(name, size), size=size)
+            self._ctk[key] = img
+        return img
+
+    def preload(self, specs: Iterable[Tuple[str, Size]]):
+        """Load the scaled images for (name, size) pairs, e.g. on a worker thread.
+
+        Only PIL work happens here; the CTkImage wrappers are made later by
+        image() on the Tk thread. Missing assets are skipped.
+        """
+        for name, size in specs:
+            try:
+                self.pil(name, size)
+            except OSError:
+                pass
+        # Every needed size is scaled now, so the full-resolution copies can go
+        with self._lock:
+            self._sources.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            held = list(self._scaled.values()) + list(self._sources.values())
+            return dict(self._stats, scaled=len(self._scaled), sources=len(self._sources),
+                        bytes=sum(img.width * img.height * len(img.getbands()) for img in {id(i): i for i in held}.values()))
+
+
+# Every (asset, display size) the frames use, for preloading at startup
+UI_ASSETS = (
+    ("bg_login.png", (1920, 1080)),
+    ("main_logo.png", (60, 60)),
+    ("main_logo.png", (35, 35)),
+    ("user_icon.png", (25, 25)),
+    ("user_icon.png", (30, 30)),
+    ("password_icon.png", (25, 25)),
+    ("password_icon.png", (30, 30)),
+    ("email_icon.png", (30, 30)),
+)
+
+_assets: Optional[AssetManager] = None
+_assets_lock = threading.Lock()
+
+
+def get_assets() -> AssetManager:
+    """The process-wide AssetManager (created from config.APP on first use)."""
+    global _assets
+    with _assets_lock:
+        if _assets is None:
+            _assets = AssetManager(os.path.join(BASE_DIR, "assets"), cache_dir=APP_CONFIG.get("asset_cache_dir"))
+        return _assets
+
+
+def load_image(name: str, size: Size) -> ctk.CTkImage:
+    """Shortcut for get_assets().image(name, size)."""
+    return get_assets().image(name, size)
@@ -1,14 +1,20 @@
 import customtkinter as ctk
-from PIL import Image, ImageTk
+from tkinter import messagebox
+from typing import Optional
+
+from models.dashboard_snapshot import DashboardSnapshot, URGENCY_ORDER
+from models.tip_store import TipStore
+from ui.live_refresh import ChangeFeed
+from ui.assets import load_image
 
 # Module: dashboard_frame.py
 # Purpose: Present an overview dashboard for users.
 # This frame shows urgency buckets, a global list of incidents and provides
 # navigation via the left sidebar. It fetches incidents from the app's DB
-# and populates the urgency boxes and a simple global list.
+# once per refresh and populates the urgency boxes and a simple global list
+# from that single snapshot.
 # Comments below explain the role of major methods and areas.
 
-URGENCY_ORDER = ["High", "Medium", "Low"]
 URGENCY_BG = {
     "High": "#1E1E1E",
     "Medium": "#4A4A4A",
@@ -17,11 +23,24 @@ URGENCY_BG = {
 
 
 class DashboardFrame(ctk.CTkFrame):
+    # Newest rows shown per urgency box; the count badge still shows the full total.
+    ROWS_PER_URGENCY = 50
+    # First tips by name shown in the global list; a "... and N more" line follows.
+    GLOBAL_ROWS = 200
+    # How often the shown dashboard polls for tips changed by anyone
+    LIVE_REFRESH_MS = 3000
+
     def __init__(self, parent, app):
         # Standard frame initialization and configuration.
         super().__init__(parent)
         self.app = app
         self.configure(fg_color="#BDBDBD")
+        # Counts and top-N lists can't be patched from a delta, so any change
+        # re-fetches the snapshot; only panes whose shown rows differ are rebuilt.
+        # Idle polls cost a single lookup.
+        self.feed = ChangeFeed(self, app, on_changes=lambda changed, deleted: self._refresh(quiet=True),
+                               on_reset=lambda: self._refresh(quiet=True),
+                               interval_ms=self.LIVE_REFRESH_MS, key="dashboard.feed")
 
         # ------------------ SIDEBAR (left) ------------------
         # Reused sidebar: logo + navigation buttons; consistent across UI pages.
@@ -31,7 +50,7 @@ class DashboardFrame(ctk.CTkFrame):
 
         # Attempt to display a logo image, with fallback to simple text.
         try:
-            main_logo = ctk.CTkImage(light_image=Image.open("assets/main_logo.png"), size=(60, 60))
+            main_logo = load_image("main_logo.png", (60, 60))
             ctk.CTkLabel(self.sidebar, image=main_logo, text="",
                          width=60, height=60, corner_radius=0, fg_color="#2B2B2B").pack(pady=(25, 10))
         except Exception:
@@ -153,13 +172,52 @@ class DashboardFrame(ctk.CTkFrame):
         self.global_rows_container = ctk.CTkFrame(self.global_scroll, fg_color="transparent")
         self.global_rows_container.pack(fill="x")
 
+        # Last snapshot applied; its round_trips/fetch_ms are the cost of the latest refresh
+        self.last_snapshot: Optional[DashboardSnapshot] = None
+        # What each pane currently shows, so quiet refreshes skip unchanged ones
+        self._shown = {}
+
     # ---------- Lifecycle ----------
     def on_show(self):
         # Called by the app when this frame is shown. Refreshes visibility and data.
+        # One background fetch per refresh feeds both panes.
         print("[Dashboard] on_show invoked")
         self._apply_role_visibility()
-        self._load_urgency_boxes()
-        self._load_global_list()
+        self._refresh()
+        self.feed.start()
+
+    def on_hide(self):
+        self.feed.stop()
+
+    def _refresh(self, quiet: bool = False):
+        """Fetch a snapshot in the background; ``quiet`` ones (live refresh) log nothing."""
+        self.app.run_async(self._get_snapshot, key="dashboard.snapshot", quiet=quiet,
+                           on_success=lambda snapshot: self._apply_snapshot(snapshot, quiet),
+                           on_error=self._on_load_error)
+
+    def _apply_snapshot(self, snapshot: DashboardSnapshot, quiet: bool = False):
+        if snapshot.watermark is not None:
+            self.feed.watermark = snapshot.watermark
+        self.last_snapshot = snapshot
+        if not quiet:
+            print(f"[Dashboard] on_show: {snapshot.round_trips} DB round-trip(s), {snapshot.fetch_ms:.1f} ms")
+            cache_stats = getattr(getattr(self.app, "db", None), "cache_stats", None)
+            stats = cache_stats() if cache_stats else None
+            if stats:
+                print(f"[Dashboard] read cache: {stats['hit_rate']:.0%} hits, {stats['entries']} entries, "
+                      f"{stats['bytes'] / 1024:.0f} KiB")
+        self._load_urgency_boxes(snapshot, quiet)
+        self._load_global_list(snapshot, quiet)
+
+    def _unchanged(self, pane: str, shown) -> bool:
+        """True if ``pane`` already shows ``shown``; otherwise remember it as shown."""
+        if self._shown.get(pane) == shown:
+            return True
+        self._shown[pane] = shown
+        return False
+
+    def _on_load_error(self, exc):
+        messagebox.showerror("Error", f"Failed to load incidents: {exc}")
 
     # ---------- Role visibility ----------
     def _apply_role_visibility(self):
@@ -179,8 +237,32 @@ class DashboardFrame(ctk.CTkFrame):
                 manage_btn.pack(pady=10)
 
     # ---------- Data fetch ----------
+    def _get_snapshot(self) -> DashboardSnapshot:
+        # Runs on a worker thread; no widget access here. Counts the statements
+        # issued so before/after round-trips per on_show are visible in the log.
+        db = getattr(self.app, "db", None)
+        stats = getattr(db, "stats", None)
+        if stats is None:
+            return DashboardSnapshot.from_store(TipStore(self._get_incidents()),
+                                                self.ROWS_PER_URGENCY, self.GLOBAL_ROWS)
+        watermark = db.change_watermark() if hasattr(db, "change_watermark") else None
+        with stats.measure() as measured:
+            if hasattr(db, "dashboard_snapshot"):
+                rows = db.dashboard_snapshot(self.ROWS_PER_URGENCY)
+                # The snapshot rows are the newest per urgency; the global list is the first tips by name
+                first = db.read_tips_page(sort="tip_name", descending=False, limit=self.GLOBAL_ROWS)["rows"]
+                snapshot = DashboardSnapshot.from_rows(rows, self.ROWS_PER_URGENCY, global_rows=first)
+            else:
+                snapshot = DashboardSnapshot.from_store(TipStore(self._get_incidents()),
+                                                        self.ROWS_PER_URGENCY, self.GLOBAL_ROWS)
+        snapshot.watermark = watermark
+        snapshot.round_trips = measured["queries"]
+        snapshot.fetch_ms = measured["seconds"] * 1000.0
+        return snapshot
+
     def _get_incidents(self):
-        # Fetch incidents via the DB API. Supports multiple DB method names for compatibility.
+        # Fallback for DB wrappers without dashboard_snapshot: fetch every incident.
+        # Supports multiple DB method names for compatibility.
         db = getattr(self.app, "db", None)
         if not db:
             print("[Dashboard] No DB instance.")
@@ -197,37 +279,41 @@ class DashboardFrame(ctk.CTkFrame):
         return []
 
     # ---------- Urgency box loader ----------
-    def _load_urgency_boxes(self):
-        # Populate each urgency bucket with incidents and update counts.
-        incidents = self._get_incidents()
-        buckets = {u: [] for u in URGENCY_ORDER}
-        for inc in incidents:
-            u = (inc.get("urgency") or "").strip().capitalize()
-            if u in buckets:
-                buckets[u].append(inc)
+    def _load_urgency_boxes(self, snapshot: DashboardSnapshot, quiet: bool = False):
+        # Populate each urgency bucket from the snapshot and update counts.
         for u in URGENCY_ORDER:
             box = self.urgency_boxes[u]
+            box["count"].configure(text=f"({snapshot.counts[u]})")
+            data = snapshot.by_urgency[u]
+            # Live refresh: leave boxes that show the same rows alone
+            shown = ([(inc.get("id"), inc.get("tip_name")) for inc in data], snapshot.hidden_count(u))
+            if self._unchanged(u, shown) and quiet:
+                continue
             scroll = box["scroll"]
             # Some CTkScrollableFrame implementations provide scrollable_frame attr.
             scroll_parent = getattr(scroll, "scrollable_frame", scroll)
             for child in scroll_parent.winfo_children():
                 child.destroy()
-            data = buckets[u]
-            box["count"].configure(text=f"({len(data)})")
-            print(f"[Dashboard] Loading {u}: {len(data)} items")
+            if not quiet:
+                print(f"[Dashboard] Loading {u}: {len(data)} items")
             if not data:
                 # Show placeholder when no incidents present.
                 ctk.CTkLabel(scroll_parent, text="No incidents.",
                              font=("Helvetica", 14), text_color="#E0E0E0").pack(pady=6)
                 continue
             for inc in data:
-                self._create_simple_name_row(scroll_parent, inc)
+                self._create_simple_name_row(scroll_parent, inc, quiet)
+            hidden = snapshot.hidden_count(u)
+            if hidden:
+                ctk.CTkLabel(scroll_parent, text=f"... and {hidden} more",
+                             font=("Helvetica", 13, "italic"), text_color="#E0E0E0").pack(pady=4)
 
-    def _create_simple_name_row(self, parent, inc):
+    def _create_simple_name_row(self, parent, inc, quiet: bool = False):
         # Render a compact row with the incident's tip name.
         try:
             tip_name = inc.get("tip_name", "Unknown")
-            print(f"[Dashboard] Creating row for tip_name='{tip_name}'")
+            if not quiet:
+                print(f"[Dashboard] Creating row for tip_name='{tip_name}'")
             row = ctk.CTkFrame(parent, fg_color="#4F4F4F", corner_radius=4)
             row.pack(fill="x", padx=6, pady=3)
             text_tip = ctk.CTkLabel(
@@ -241,17 +327,21 @@ class DashboardFrame(ctk.CTkFrame):
             print("[Dashboard] Row creation error:", e)
 
     # ---------- Global list ----------
-    def _load_global_list(self):
-        # Populate the right-hand global list with all incidents sorted by name.
+    def _load_global_list(self, snapshot: DashboardSnapshot, quiet: bool = False):
+        # Populate the right-hand global list with the snapshot's first incidents by name.
+        incidents_sorted = snapshot.global_rows
+        hidden = snapshot.hidden_global()
+        shown = ([(inc.get("id"), inc.get("tip_name"), inc.get("incident_type")) for inc in incidents_sorted],
+                 hidden)
+        if self._unchanged("global", shown) and quiet:
+            return
         container = self.global_rows_container
         for child in container.winfo_children():
             child.destroy()
-        incidents = self._get_incidents()
-        if not incidents:
+        if not incidents_sorted:
             ctk.CTkLabel(container, text="No incidents.",
                          font=("Helvetica", 14), text_color="black").pack(pady=6)
             return
-        incidents_sorted = sorted(incidents, key=lambda i: (i.get("tip_name") or "").lower())
         for inc in incidents_sorted:
             tip_name = inc.get("tip_name", "Unknown")
             itype = inc.get("incident_type", "N/A")
@@ -261,9 +351,11 @@ class DashboardFrame(ctk.CTkFrame):
                          text_color="black", anchor="w").pack(side="left", padx=8, pady=4)
             ctk.CTkLabel(row, text=itype, font=("Helvetica", 13),
                          text_color="black", anchor="w").pack(side="right", padx=8, pady=4)
+        if hidden:
+            ctk.CTkLabel(container, text=f"... and {hidden} more",
+                         font=("Helvetica", 13, "italic"), text_color="black").pack(pady=4)
 
     # ---------- Logout ----------
     def logout(self):
         # Clear session and navigate to login.
-        self.app.current_user = None
-        self.app.show_frame("LoginFrame")
\ No newline at end of file
+        self.app.logout()
\ No newline at end of file
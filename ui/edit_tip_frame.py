@@ -1,7 +1,8 @@
 import customtkinter as ctk
 from tkinter import messagebox
 from typing import Optional, Dict, Any
-from PIL import Image
+
+from ui.assets import load_image
 
 # Module: edit_tip_frame.py
 # Purpose: Provide an editable form for an existing tip.
@@ -18,20 +19,12 @@ class EditTipFrame(ctk.CTkFrame):
         super().__init__(parent)
         self.app = app
 
-        # Resolve tip row: prefer tip_id (fresh read), then provided tip_row
-        self.tip_row = {}
+        # Show the provided tip_row immediately; a fresh copy (by tip_id or the
+        # row's id) is read in the background and repopulates the form. Rows
+        # handed over from the list are already in the DB read cache, so this
+        # only reaches the database if the tip changed since it was listed.
+        self.tip_row = tip_row or {}
         rid = tip_id or (tip_row.get("id") if tip_row else None)
-        if rid:
-            try:
-                fresh = self.app.db.read_tip(rid)
-                if fresh:
-                    self.tip_row = fresh
-                else:
-                    self.tip_row = tip_row or {}
-            except Exception:
-                self.tip_row = tip_row or {}
-        else:
-            self.tip_row = tip_row or {}
 
         # ------------------ SIDEBAR ------------------
         # Sidebar navigation consistent with other frames.
@@ -41,7 +34,7 @@ class EditTipFrame(ctk.CTkFrame):
 
         # Logo (image or fallback text)
         try:
-            main_logo = ctk.CTkImage(light_image=Image.open("assets/main_logo.png"), size=(60, 60))
+            main_logo = load_image("main_logo.png", (60, 60))
             ctk.CTkLabel(self.sidebar, image=main_logo, text="",
                          width=60, height=60, corner_radius=0, fg_color="#2B2B2B").pack(pady=(25, 10))
         except Exception:
@@ -109,6 +102,28 @@ class EditTipFrame(ctk.CTkFrame):
 
         # Build the edit form UI
         self._build_form(main)
+        self._load(rid)
+
+    def accept_kwargs(self, tip_row: Optional[Dict[str, Any]] = None, tip_id: Optional[int] = None):
+        """Show another tip in this (cached) frame instead of building a new one."""
+        self.tip_row = tip_row or {}
+        self._clear()
+        self._load(tip_id or self.tip_row.get("id"))
+
+    def _load(self, rid: Optional[int]):
+        # A read still running for the previously shown tip is superseded (same key)
+        if not rid:
+            self.app.tasks.cancel("edit.load")
+            return
+        self.app.run_async(self.app.db.read_tip, rid, key="edit.load",
+                           on_success=self._on_fresh_row,
+                           on_error=lambda e: print("[EditTipFrame] fresh read failed:", e))
+
+    def _on_fresh_row(self, fresh: Optional[Dict[str, Any]]):
+        # Replace the provided row with the DB copy and refresh the inputs.
+        if fresh:
+            self.tip_row = fresh
+            self._clear()
 
     # ------------------ UI BUILDERS ------------------
     def _build_form(self, parent):
@@ -311,25 +326,23 @@ class EditTipFrame(ctk.CTkFrame):
         if not messagebox.askyesno("Confirm", "Resolve this tip and delete it? This cannot be undone."):
             return
 
-        # Try to mark resolved first (non-fatal if it fails)
-        try:
-            self.app.db.update_tip(tip_id, {"status": "Resolved"})
-        except Exception as e:
-            # You can show a warning but still attempt deletion
-            print("[EditTipFrame] resolve update failed:", e)
+        def work():
+            # Runs on a worker thread: mark resolved first (non-fatal if it fails), then delete
+            try:
+                self.app.db.update_tip(tip_id, {"status": "Resolved"})
+            except Exception as e:
+                print("[EditTipFrame] resolve update failed:", e)
+            return self.app.db.delete_tip(tip_id)
 
-        # Then delete
-        try:
-            ok = self.app.db.delete_tip(tip_id)
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to delete tip:\n{e}")
-            return
+        def done(ok):
+            if ok:
+                messagebox.showinfo("Done", "Tip marked as Resolved and deleted.")
+                self._back()
+            else:
+                messagebox.showwarning("Not deleted", "Tip could not be deleted.")
 
-        if ok:
-            messagebox.showinfo("Done", "Tip marked as Resolved and deleted.")
-            self._back()
-        else:
-            messagebox.showwarning("Not deleted", "Tip could not be deleted.")
+        self.app.run_async(work, on_success=done,
+                           on_error=lambda e: messagebox.showerror("Error", f"Failed to delete tip:\n{e}"))
 
     def _back(self):
         # Navigate back using the app's history; fallback to manage list.
@@ -398,12 +411,11 @@ class EditTipFrame(ctk.CTkFrame):
             messagebox.showerror("Error", "Missing required fields: " + ", ".join(missing))
             return
 
-        try:
-            ok = self.app.db.update_tip(tip_id, updates)
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to save changes:\n{e}")
-            return
+        self.app.run_async(self.app.db.update_tip, tip_id, updates,
+                           on_success=self._on_saved,
+                           on_error=lambda e: messagebox.showerror("Error", f"Failed to save changes:\n{e}"))
 
+    def _on_saved(self, ok: bool):
         if ok:
             messagebox.showinfo("Saved", "Changes updated.")
             try:
@@ -421,15 +433,10 @@ class EditTipFrame(ctk.CTkFrame):
             return
         if not messagebox.askyesno("Confirm", "Mark this tip as Resolved?"):
             return
-        try:
-            ok = self.app.db.update_tip(tip_id, {"status": "Resolved"})
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to update status:\n{e}")
-            return
-        if ok:
-            messagebox.showinfo("Status Updated", "Marked as Resolved.")
+        self.app.run_async(self.app.db.update_tip, tip_id, {"status": "Resolved"},
+                           on_success=lambda ok: ok and messagebox.showinfo("Status Updated", "Marked as Resolved."),
+                           on_error=lambda e: messagebox.showerror("Error", f"Failed to update status:\n{e}"))
 
     def logout(self):
         # Clear session and return to login screen
-        self.app.current_user = None
-        self.app.show_frame("LoginFrame")
\ No newline at end of file
+        self.app.logout()
\ No newline at end of file
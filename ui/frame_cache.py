@@ -0,0 +1,146 @@
+import statistics
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Module: frame_cache.py
+# Purpose: Keep built frames around between visits, within a budget.
+# FrameCache is an LRU of frame instances keyed by registry key. It is bounded
+# by a frame count and by the number of Tk widgets the frames hold, which is
+# what their memory mostly consists of. The shown frame is never evicted.
+# NavTimings records how long each navigation took, split by whether the frame
+# was built, rebound to new arguments, or reused as is.
+
+
+def widget_count(widget) -> int:
+    """Number of Tk widgets in ``widget``'s tree, itself included."""
+    count, stack = 0, [widget]
+    while stack:
+        w = stack.pop()
+        count += 1
+        try:
+            stack.extend(w.winfo_children())
+        except Exception:
+            pass
+    return count
+
+
+class FrameCache:
+    """LRU of built frames, bounded by ``max_frames`` and ``max_widgets``."""
+
+    def __init__(self, max_frames: int = 8, max_widgets: int = 6000):
+        self.max_frames = max_frames
+        self.max_widgets = max_widgets
+        # key -> (frame, widget count when last measured); last = most recently used
+        self._frames: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        self.evictions = 0
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._frames
+
+    def keys(self) -> List[str]:
+        return list(self._frames)
+
+    def get(self, key: str):
+        """The cached frame for ``key`` (now most recently used), or None."""
+        entry = self._frames.get(key)
+        if entry is None:
+            return None
+        self._frames.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: str, frame, protect: Iterable[str] = ()) -> List[str]:
+        """Cache ``frame`` under ``key`` and evict down to budget; returns the evicted keys."""
+        self._frames[key] = (frame, widget_count(frame))
+        self._frames.move_to_end(key)
+        return self._evict(set(protect) | {key})
+
+    def measure(self, key: str, protect: Iterable[str] = ()) -> List[str]:
+        """Recount ``key``'s widgets (frames grow as data loads) and evict if over budget."""
+        entry = self._frames.get(key)
+        if entry is None:
+            return []
+        self._frames[key] = (entry[0], widget_count(entry[0]))
+        return self._evict(set(protect))
+
+    def pop(self, key: str):
+        entry = self._frames.pop(key, None)
+        return entry[0] if entry else None
+
+    def clear(self, keep: Iterable[str] = ()) -> List[str]:
+        """Destroy every cached frame except those under ``keep``; returns the dropped keys."""
+        keep = set(keep)
+        dropped = [k for k in self._frames if k not in keep]
+        for key in dropped:
+            self._destroy(self._frames.pop(key)[0])
+        return dropped
+
+    def widgets(self) -> int:
+        return sum(n for _, n in self._frames.values())
+
+    def stats(self) -> Dict[str, Any]:
+        return {"frames": len(self._frames), "widgets": self.widgets(), "evictions": self.evictions,
+                "sizes": {k: n for k, (_, n) in self._frames.items()}}
+
+    def _evict(self, protect: set) -> List[str]:
+        evicted = []
+        while len(self._frames) > self.max_frames or self.widgets() > self.max_widgets:
+            victim = next((k for k in self._frames if k not in protect), None)
+            if victim is None:
+                break
+            self._destroy(self._frames.pop(victim)[0])
+            self.evictions += 1
+            evicted.append(victim)
+        return evicted
+
+    @staticmethod
+    def _destroy(frame):
+        try:
+            frame.destroy()
+        except Exception as e:
+            print(f"[Frames] destroy failed for {frame.__class__.__name__}: {e}")
+
+
+class NavTimings:
+    """Per-frame navigation latencies: ``show`` is show_frame itself, ``idle`` until Tk is idle again."""
+
+    KINDS = ("built", "rebound", "reused", "prewarm")
+
+    def __init__(self):
+        # (key, kind) -> [(show ms, idle ms or None)]
+        self._samples: Dict[Tuple[str, str], List[Tuple[float, Optional[float]]]] = {}
+
+    def start(self) -> float:
+        return time.perf_counter()
+
+    def record(self, key: str, kind: str, started: float) -> List[Tuple[float, Optional[float]]]:
+        """Record the synchronous part; returns the sample list so the idle time can be filled in."""
+        samples = self._samples.setdefault((key, kind), [])
+        samples.append(((time.perf_counter() - started) * 1000, None))
+        return samples
+
+    @staticmethod
+    def finish(samples: List[Tuple[float, Optional[float]]], started: float):
+        """Fill in the idle time of the newest sample (call from after_idle)."""
+        show_ms, _ = samples[-1]
+        samples[-1] = (show_ms, (time.perf_counter() - started) * 1000)
+
+    def summary(self) -> List[Dict[str, Any]]:
+        rows = []
+        for (key, kind), samples in sorted(self._samples.items()):
+            shows = [s for s, _ in samples]
+            idles = [i for _, i in samples if i is not None]
+            rows.append({
+                "frame": key, "kind": kind, "count": len(samples),
+                "show_ms_median": statistics.median(shows), "show_ms_max": max(shows),
+                "idle_ms_median": statistics.median(idles) if idles else None,
+            })
+        return rows
+
+    def print_report(self, sizes: Optional[Dict[str, int]] = None):
+        sizes = sizes or {}
+        print(f"[Frames] {'frame':<22} {'kind':<8} {'n':>4} {'show ms':>9} {'max':>8} {'idle ms':>9} {'widgets':>8}")
+        for row in self.summary():
+            idle = f"{row['idle_ms_median']:.1f}" if row["idle_ms_median"] is not None else "-"
+            print(f"[Frames] {row['frame']:<22} {row['kind']:<8} {row['count']:>4} {row['show_ms_median']:>9.1f} "
+                  f"{row['show_ms_max']:>8.1f} {idle:>9} {sizes.get(row['frame'], '-'):>8}")
@@ -0,0 +1,113 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+# Module: incremental_search.py
+# Purpose: Answer search-as-you-type queries from memory when possible.
+# Complete result lists (every page fetched) are kept per (view, query). A new
+# query is served from the cache when it was seen before, or when it narrows a
+# cached one ("bur" -> "burg", "bur" -> "bur lob"): every row matching the longer
+# query also matched the shorter one, so filtering the cached rows in memory
+# gives the same set the database would return, without a round-trip.
+
+Plan = Tuple[str, Any]
+
+
+def _narrows(old: Plan, new: Plan) -> bool:
+    """True when every row matching ``new`` is guaranteed to match ``old``."""
+    if old[0] != new[0]:
+        return False
+    if old[0] == "like":
+        return old[1].lower() in new[1].lower()
+    old_terms, new_terms = old[1], new[1]
+    if not old_terms or len(new_terms) < len(old_terms):
+        return False
+    # Typing extends the last word or adds words; earlier words stay as they were
+    return (new_terms[:len(old_terms) - 1] == old_terms[:-1]
+            and new_terms[len(old_terms) - 1].startswith(old_terms[-1]))
+
+
+class SearchCache:
+    """Small LRU of complete search results with in-memory refinement.
+
+    ``plan_for(text)`` returns how the database would match the text (see
+    Database.search_plan) and ``matches(plan, row)`` evaluates that plan on a
+    row. Entries expire after ``ttl`` seconds so edits made elsewhere show up.
+    """
+
+    def __init__(
+        self,
+        plan_for: Callable[[str], Plan],
+        matches: Callable[[Plan, Dict[str, Any]], bool],
+        max_entries: int = 16,
+        ttl: float = 60.0,
+    ):
+        self.plan_for = plan_for
+        self.matches = matches
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # (view, text) -> (stored_at, plan, rows)
+        self._entries: "OrderedDict[Tuple[Hashable, str], Tuple[float, Plan, List[Dict[str, Any]]]]" = OrderedDict()
+        self.hits = 0
+        self.refinements = 0
+        self.misses = 0
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        return " ".join(text.lower().split())
+
+    def lookup(self, view: Hashable, text: str) -> Optional[List[Dict[str, Any]]]:
+        """Rows for ``text`` under ``view`` (e.g. the sort order), or None on a miss."""
+        text = self._normalize(text)
+        now = time.monotonic()
+        self._expire(now)
+
+        entry = self._entries.get((view, text))
+        if entry is not None:
+            self._entries.move_to_end((view, text))
+            self.hits += 1
+            return list(entry[2])
+
+        plan = self.plan_for(text)
+        # Refine from the narrowest cached query this one extends
+        best = None
+        for (v, old_text), (stored_at, old_plan, rows) in self._entries.items():
+            if v == view and _narrows(old_plan, plan) and (best is None or len(rows) < len(best)):
+                best = rows
+        if best is None:
+            self.misses += 1
+            return None
+        rows = [row for row in best if self.matches(plan, row)]
+        self.refinements += 1
+        self._put(view, text, plan, rows, now)
+        return list(rows)
+
+    def store(self, view: Hashable, text: str, rows: List[Dict[str, Any]]):
+        """Remember the complete result of ``text``; partial (paged) results must not be stored."""
+        text = self._normalize(text)
+        self._put(view, text, self.plan_for(text), list(rows), time.monotonic())
+
+    def _put(self, view, text, plan, rows, now):
+        self._entries[(view, text)] = (now, plan, rows)
+        self._entries.move_to_end((view, text))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _expire(self, now: float):
+        stale = [key for key, (stored_at, _, _) in self._entries.items() if now - stored_at > self.ttl]
+        for key in stale:
+            del self._entries[key]
+
+    def clear(self):
+        """Drop all entries (after edits, or when the data is reloaded)."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.refinements + self.misses
+        return {
+            "hits": self.hits,
+            "refinements": self.refinements,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.refinements) / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+        }
@@ -0,0 +1,125 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+# Module: live_refresh.py
+# Purpose: Keep admin screens current without reloading them.
+# ChangeFeed polls Database.changes_since() on a worker thread every few seconds
+# and hands the tips written since the last poll (and the ids deleted) to the
+# screen on the Tk thread. When nothing changed a poll is one primary-key lookup,
+# so many admins can leave the screens open. merge_changes() applies such a
+# delta to a sorted list of rows in place of a full reload.
+
+
+def merge_changes(
+    rows: List[Dict[str, Any]],
+    changed: Iterable[Dict[str, Any]],
+    deleted: Iterable[int],
+    keep: Callable[[Dict[str, Any]], bool],
+    sort_key: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    descending: bool = False,
+    bound: Any = None,
+) -> List[Dict[str, Any]]:
+    """Return ``rows`` with a change-feed delta applied.
+
+    Deleted ids and changed rows that no longer satisfy ``keep`` are removed;
+    the other changed rows replace their old version or are inserted. With a
+    ``sort_key`` (ascending key, see database.db.row_sort_key) they go to their
+    sorted position; without one (relevance order) they stay where they were
+    and new rows are appended. ``bound`` is the key of the last row fetched when
+    more pages remain: rows sorting after it are left for the next page, which
+    the keyset cursor will fetch anyway.
+    """
+    changed = [row for row in changed]
+    gone = set(deleted) | {row["id"] for row in changed}
+    incoming = [row for row in changed if keep(row)]
+
+    if sort_key is None:
+        replacements = {row["id"]: row for row in incoming}
+        merged = [replacements.pop(row["id"], row) for row in rows
+                  if row["id"] not in gone or row["id"] in replacements]
+        if bound is None:
+            merged.extend(row for row in incoming if row["id"] in replacements)
+        return merged
+
+    def before(a, b) -> bool:
+        return a > b if descending else a < b
+
+    merged = [row for row in rows if row["id"] not in gone]
+    keys = [sort_key(row) for row in merged]
+    for row in incoming:
+        key = sort_key(row)
+        if bound is not None and before(bound, key):
+            continue
+        pos = next((i for i, k in enumerate(keys) if before(key, k)), len(keys))
+        merged.insert(pos, row)
+        keys.insert(pos, key)
+    return merged
+
+
+class ChangeFeed:
+    """Periodic changes_since() poll bound to a widget's lifetime.
+
+    ``on_changes(changed_rows, deleted_ids)`` runs on the Tk thread when
+    something changed; ``on_reset()`` when the delta is too large (or too old)
+    to apply and the screen should reload instead.
+    """
+
+    def __init__(
+        self,
+        widget,
+        app,
+        on_changes: Callable[[List[Dict[str, Any]], List[int]], None],
+        on_reset: Callable[[], None],
+        interval_ms: int = 3000,
+        key: str = "feed",
+    ):
+        self.widget = widget
+        self.app = app
+        self.on_changes = on_changes
+        self.on_reset = on_reset
+        self.interval_ms = interval_ms
+        self.key = key
+        self.watermark: Optional[int] = None
+        self._after_id = None
+        self._running = False
+
+    def start(self, watermark: Optional[int] = None):
+        """Begin polling; ``watermark`` is the change_watermark() the screen's data was read at."""
+        if watermark is not None:
+            self.watermark = watermark
+        if not self._running:
+            self._running = True
+            self._schedule()
+
+    def stop(self):
+        self._running = False
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+        self.app.tasks.cancel(self.key)
+
+    def _schedule(self):
+        if self._running and self._after_id is None:
+            self._after_id = self.widget.after(self.interval_ms, self._poll)
+
+    def _poll(self):
+        self._after_id = None
+        db = getattr(self.app, "db", None)
+        if not self._running or db is None or self.watermark is None:
+            self._schedule()
+            return
+        self.app.run_async(
+            db.changes_since, self.watermark,
+            key=self.key, quiet=True,
+            on_success=self._on_feed,
+            on_error=lambda e: print(f"[ChangeFeed] poll failed: {e}"),
+            on_done=self._schedule,
+        )
+
+    def _on_feed(self, feed: Dict[str, Any]):
+        if not self._running:
+            return
+        self.watermark = feed["version"]
+        if feed["reset"]:
+            self.on_reset()
+        elif feed["changed"] or feed["deleted"]:
+            self.on_changes(feed["changed"], feed["deleted"])
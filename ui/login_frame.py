@@ -1,8 +1,9 @@
 import customtkinter as ctk
 from tkinter import messagebox
-from PIL import Image, ImageTk
 
+from database.login_guard import LoginThrottled
 from models.user import Admin, Reporter, Viewer
+from ui.assets import load_image
 
 # Module: login_frame.py
 # Purpose: Provide the login screen UI and authentication flow.
@@ -19,10 +20,8 @@ class LoginFrame(ctk.CTkFrame):
         # BACKGROUND IMAGE
         # =========================================================
         # Attempt to load a large background image; if missing, fall back to a plain background color.
-        bg_path = "assets/bg_login.png"   # <-- change this to your file
         try:
-            bg_img = Image.open(bg_path)
-            self.bg = ctk.CTkImage(light_image=bg_img, size=(1920, 1080))
+            self.bg = load_image("bg_login.png", (1920, 1080))
             bg_label = ctk.CTkLabel(self, image=self.bg, text="")
             bg_label.place(relx=0.5, rely=0.5, anchor="center")
         except Exception:
@@ -56,8 +55,8 @@ class LoginFrame(ctk.CTkFrame):
         inputs.pack_propagate(False)
 
         # ICONS for username and password (assets required)
-        user_icon_img = ctk.CTkImage(light_image=Image.open("assets/user_icon.png"), size=(25, 25))
-        password_icon_img = ctk.CTkImage(light_image=Image.open("assets/password_icon.png"), size=(25, 25))
+        user_icon_img = load_image("user_icon.png", (25, 25))
+        password_icon_img = load_image("password_icon.png", (25, 25))
 
         # Username input row with icon
         box_user = ctk.CTkFrame(inputs, fg_color="#565656", corner_radius=1)
@@ -198,7 +197,22 @@ class LoginFrame(ctk.CTkFrame):
             messagebox.showerror("Error", "Enter credentials.")
             return
 
-        row = self.app.db.get_user_by_credentials(u, p)
+        # Credential lookup runs in the background; a repeated click supersedes it.
+        # Right after launch the database may still be connecting: the lookup
+        # then starts as soon as it is ready.
+        self.app.when_db_ready(lambda: self.app.run_async(
+            self.app.db.get_user_by_credentials, u, p, key="login",
+            on_success=self._on_credentials_checked,
+            on_error=self._on_login_error))
+
+    def _on_login_error(self, e):
+        # Throttled logins get their own message (with the wait), not a failure
+        if isinstance(e, LoginThrottled):
+            messagebox.showwarning("Too many attempts", str(e))
+        else:
+            messagebox.showerror("Error", f"Login failed: {e}")
+
+    def _on_credentials_checked(self, row):
         if not row:
             messagebox.showerror("Error", "Invalid username/password.")
             return
@@ -218,4 +232,6 @@ class LoginFrame(ctk.CTkFrame):
         if user.is_admin():
             self.app.show_frame("DashboardFrame")
         else:
-            self.app.show_frame("SubmitTipFrame")
\ No newline at end of file
+            self.app.show_frame("SubmitTipFrame")
+        # Build the screens this user is likely to open next while idle
+        self.app.prewarm()
\ No newline at end of file
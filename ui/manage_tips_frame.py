@@ -1,7 +1,14 @@
 import customtkinter as ctk
 from tkinter import messagebox
-from typing import List, Dict, Any
-from PIL import Image
+from typing import List, Dict, Any, Optional, Sequence
+
+from config import APP as APP_CONFIG
+from database.db import row_matches_search, row_sort_key
+from models.tip_store import TipStore
+from ui.incremental_search import SearchCache
+from ui.live_refresh import ChangeFeed, merge_changes
+from ui.virtual_table import VirtualTable
+from ui.assets import load_image
 
 
 class ManageTipsFrame(ctk.CTkFrame):
@@ -33,6 +40,30 @@ class ManageTipsFrame(ctk.CTkFrame):
     CELL_PADX = (12, 8)
     CELL_PADY = (4, 4)
 
+    # Rows requested per page from Database.read_tips_page
+    PAGE_SIZE = 100
+
+    # Quiet time after the last keystroke before a search runs
+    SEARCH_DEBOUNCE_MS = 250
+    # Complete search results up to this size are kept for in-memory refinement
+    SEARCH_CACHE_MAX_ROWS = 5000
+    # How often the visible list polls for tips changed by anyone
+    LIVE_REFRESH_MS = 3000
+    # Tables up to this size are loaded into a TipStore at the first header sort;
+    # from then on the unsearched list is sorted and refreshed in memory
+    STORE_MAX_ROWS = int(APP_CONFIG.get("tip_store_max_rows", 20000))
+    # Tips per read_tips_after query while loading the store
+    STORE_CHUNK = 5000
+
+    # Data columns rendered by the virtual table (the Edit button column follows)
+    TABLE_COLUMNS = [
+        {"key": "tip_name", "bold": True},
+        {"key": "incident_type"},
+        {"key": "location"},
+        {"key": "urgency"},
+        {"key": "status", "default": "Pending"},
+    ]
+
     def __init__(self, parent, app):
         super().__init__(parent)
         self.app = app
@@ -40,6 +71,8 @@ class ManageTipsFrame(ctk.CTkFrame):
 
         self.sort_key = "tip_name"
         self.sort_ascending = True
+        # Until a header is clicked, searches list the best matches first
+        self._sort_chosen = False
 
         # Header buttons registry for easy label updates
         self._header_buttons: dict[str, tuple[ctk.CTkButton, str]] = {}
@@ -51,7 +84,7 @@ class ManageTipsFrame(ctk.CTkFrame):
         self.sidebar.pack_propagate(False)
 
         try:
-            main_logo = ctk.CTkImage(light_image=Image.open("assets/main_logo.png"), size=(60, 60))
+            main_logo = load_image("main_logo.png", (60, 60))
             ctk.CTkLabel(self.sidebar, image=main_logo, text="",
                          width=60, height=60, corner_radius=0, fg_color="#2B2B2B").pack(pady=(25, 10))
         except Exception:
@@ -182,7 +215,7 @@ class ManageTipsFrame(ctk.CTkFrame):
             placeholder_text=""
         )
         self.search_entry.pack(side="left")
-        self.search_entry.bind("<KeyRelease>", lambda e: self.render_rows())
+        self.search_entry.bind("<KeyRelease>", self._on_search_key)
 
         # Empty spacers to keep grid height/alignment for other columns
         for col in range(1, 6):
@@ -190,16 +223,36 @@ class ManageTipsFrame(ctk.CTkFrame):
                 row=1, column=col, sticky="nsew", padx=self.CELL_PADX, pady=(0, 6)
             )
 
-        # Scrollable body ---------------------------------------------------
-        self.body_scroll = ctk.CTkScrollableFrame(self.table_outer, fg_color="#EDEDED", corner_radius=0)
-        self.body_scroll.pack(fill="both", expand=True)
-
-        for col, weight in enumerate(self.COL_WEIGHTS):
-            if col == 5:
-                self.body_scroll.grid_columnconfigure(col, weight=weight, uniform="cols", minsize=100)
-            else:
-                self.body_scroll.grid_columnconfigure(col, weight=weight, uniform="cols")
-
+        # Virtualized body: a constant set of row widgets rebound on scroll ---
+        self.table = VirtualTable(
+            self.table_outer,
+            columns=self.TABLE_COLUMNS,
+            col_weights=self.COL_WEIGHTS,
+            colors=self.COLORS,
+            cell_padx=self.CELL_PADX,
+            cell_pady=self.CELL_PADY,
+            on_action=self._edit_row,
+            on_need_more=self._load_more,
+        )
+        self.table.pack(fill="both", expand=True)
+
+        self._next_cursor = None
+        # Last row fetched from the database; with more pages pending, changed
+        # rows sorting after it are left for the keyset cursor to fetch
+        self._last_fetched = None
+        # Query behind the rows currently in the table (see _page_query)
+        self._shown_query: Dict[str, Any] = {}
+        self._search_after_id = None
+        self.search_cache = SearchCache(
+            plan_for=lambda text: self.app.db.search_plan(text),
+            matches=row_matches_search,
+        )
+        self.feed = ChangeFeed(self, self.app, on_changes=self._apply_changes, on_reset=self._on_feed_reset,
+                               interval_ms=self.LIVE_REFRESH_MS, key="manage.feed")
+        # Columnar copy of every tip; None until the first header sort loads it
+        self.store: Optional[TipStore] = None
+        # Set when the table was above STORE_MAX_ROWS, so sorts don't count it again
+        self._store_too_big = False
         self.render_rows()
 
     # ---------- Header helpers ----------
@@ -251,6 +304,7 @@ class ManageTipsFrame(ctk.CTkFrame):
         else:
             self.sort_key = key
             self.sort_ascending = True
+        self._sort_chosen = True
         for k, (btn, title) in self._header_buttons.items():
             if k == self.sort_key:
                 arrow = "[▲]" if self.sort_ascending else "[▼]"
@@ -258,108 +312,250 @@ class ManageTipsFrame(ctk.CTkFrame):
             else:
                 btn.configure(text=f"{title} [▼]")
         self.render_rows()
+        self._load_store()
 
     # ---------- Data helpers ----------
-    def _fetch(self) -> List[Dict[str, Any]]:
+    def _page_query(self, cursor=None) -> Dict[str, Any]:
+        """Snapshot the current sort/search as read_tips_page arguments (Tk thread)."""
+        search = self.search_var.get().strip() or None
+        if search and not self._sort_chosen:
+            sort, descending = "relevance", True
+        else:
+            sort, descending = self.sort_key, not self.sort_ascending
+        return {
+            "sort": sort,
+            "descending": descending,
+            "limit": self.PAGE_SIZE,
+            "cursor": cursor,
+            "search": search,
+        }
+
+    def _fetch_page(self, query: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetch one page of tips, sorted and full-text searched server-side (worker thread)."""
         db = getattr(self.app, "db", None)
         if not db:
-            return []
-        try:
-            return db.read_tips()
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load tips: {e}")
-            return []
-
-    def _apply_search(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        q = self.search_var.get().strip().lower()
-        if not q:
-            return rows
-        return [r for r in rows if q in (r.get("tip_name") or "").lower()]
-
-    def _urgency_rank(self, u: str) -> int:
-        order = {"low": 0, "medium": 1, "high": 2}
-        return order.get((u or "").lower(), 99)
-
-    def _status_rank(self, s: str) -> int:
-        order = {"pending": 0, "investigating": 1, "resolved": 2}
-        return order.get((s or "").lower(), 99)
-
-    def _sort(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        key = self.sort_key
-
-        def k(r):
-            if key == "tip_name":
-                return (r.get("tip_name") or "").lower()
-            if key == "incident_type":
-                return (r.get("incident_type") or "").lower()
-            if key == "location":
-                return (r.get("location") or "").lower()
-            if key == "urgency":
-                return self._urgency_rank(r.get("urgency"))
-            if key == "status":
-                return self._status_rank(r.get("status"))
-            return (r.get("tip_name") or "").lower()
-
-        return sorted(rows, key=k, reverse=not self.sort_ascending)
+            return {"rows": [], "next_cursor": None}
+        if query["cursor"] is None:
+            # Taken before the read, so the change feed replays anything newer
+            watermark = db.change_watermark()
+            return dict(db.read_tips_page(**query), watermark=watermark)
+        return db.read_tips_page(**query)
+
+    def _on_load_error(self, exc: BaseException):
+        messagebox.showerror("Error", f"Failed to load tips: {exc}")
+
+    # ---------- In-memory store ----------
+    def _load_store(self):
+        """Load every tip into a TipStore in the background (until then pages come from the DB)."""
+        if (self.store is not None or self._store_too_big or self.STORE_MAX_ROWS <= 0
+                or not getattr(self.app, "db", None) or self.app.tasks.is_running("manage.store")):
+            return
+        # The default sort plus every sortable header
+        columns = list(dict.fromkeys([self.sort_key, *self._header_buttons]))
+        self.app.run_async(
+            self._build_store, columns,
+            key="manage.store", quiet=True,
+            on_success=self._on_store_loaded,
+            on_error=lambda e: print(f"[ManageTips] tip store not loaded: {e}"),
+        )
 
-    # ---------- Rendering ----------
-    def render_rows(self):
-        for child in self.body_scroll.winfo_children():
-            child.destroy()
-
-        rows = self._sort(self._apply_search(self._fetch()))
-        if not rows:
-            ctk.CTkLabel(
-                self.body_scroll,
-                text="No incidents found.",
-                font=("Helvetica", 16, "italic"),
-                text_color=self.COLORS["no_rows_text"],
-                fg_color="transparent"
-            ).grid(row=0, column=0, columnspan=6, padx=20, pady=40, sticky="w")
+    def _build_store(self, columns: Sequence[str]) -> Optional[TipStore]:
+        """Read the table in primary-key chunks and pre-sort ``columns`` (worker thread)."""
+        db = self.app.db
+        total = sum(row["count"] for row in db.count_tips())
+        if total > self.STORE_MAX_ROWS:
+            return None
+        # Taken before the read, so the change feed replays anything newer
+        watermark = db.change_watermark()
+        store = TipStore()
+        after_id = 0
+        while True:
+            # Short range reads: the connection is free for other screens in between
+            rows = db.read_tips_after(after_id, self.STORE_CHUNK)
+            store.extend(rows)
+            if len(rows) < self.STORE_CHUNK:
+                break
+            after_id = rows[-1]["id"]
+        store.watermark = watermark
+        for column in columns:
+            store.order(column)
+        return store
+
+    def _on_store_loaded(self, store: Optional[TipStore]):
+        if store is None:
+            self._store_too_big = True
+            return
+        self.store = store
+        # Replay changes made since the store's snapshot; applying one twice is harmless
+        if self.feed.watermark is None or store.watermark < self.feed.watermark:
+            self.feed.watermark = store.watermark
+        query = self._shown_query
+        if query and not query.get("search") and not self.app.tasks.is_running("manage.page"):
+            self._show_store(query, keep_position=True)
+
+    def _show_store(self, query: Dict[str, Any], keep_position: bool = False):
+        """Bind the table to the store's rows in the query's order (Tk thread)."""
+        self.app.tasks.cancel("manage.page")
+        self._shown_query = query
+        self._next_cursor = None
+        self._last_fetched = None
+        self.table.set_loading(False)
+        order = self.store.order(query["sort"], query["descending"])
+        self.table.set_rows(self.store.view(order), keep_position=keep_position)
+
+    def _refresh_store(self):
+        """Patch the store with the changes since its snapshot, then re-render from it."""
+        self.app.run_async(
+            self.app.db.changes_since, self.store.watermark,
+            key="manage.store", quiet=True,
+            on_success=self._on_store_delta,
+            on_error=self._on_load_error,
+        )
+
+    def _on_store_delta(self, feed: Dict[str, Any]):
+        if self.store is None:
             return
+        if feed["reset"]:
+            self._drop_store()
+        else:
+            self.store.apply_changes(feed["changed"], feed["deleted"])
+            self.store.watermark = feed["version"]
+        self.render_rows()
 
-        for idx, r in enumerate(rows):
-            bg = self.COLORS["row_bg"] if idx % 2 == 0 else self.COLORS["row_alt_bg"]
+    def _drop_store(self):
+        """Forget the store (e.g. too many changes to patch); the next header sort loads it again."""
+        self.app.tasks.cancel("manage.store")
+        self.store = None
+        self._store_too_big = False
+
+    # ---------- Incremental search ----------
+    def _on_search_key(self, event=None):
+        """Debounce typing: drop any queued/in-flight search and wait for a pause."""
+        search = self.search_var.get().strip()
+        if search == (self._shown_query.get("search") or "") and self._search_after_id is None:
+            return  # arrows, shift, etc. don't change the query
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        # Results for the text typed so far are already stale
+        self.app.tasks.cancel("manage.page")
+        self.app.tasks.cancel("manage.more")
+        self._search_after_id = self.after(self.SEARCH_DEBOUNCE_MS, self._run_search)
+
+    def _run_search(self):
+        self._search_after_id = None
+        self.render_rows()
 
-            # Name
-            self._cell(self.body_scroll, idx, 0, r.get("tip_name") or "", bold=True, bg=bg)
+    @staticmethod
+    def _cache_view(query: Dict[str, Any]):
+        return (query["sort"], query["descending"])
 
-            # Incident Type
-            self._cell(self.body_scroll, idx, 1, r.get("incident_type") or "", bg=bg)
+    def search_cache_stats(self) -> Dict[str, Any]:
+        """Hit/refinement/miss counters of the incremental search cache."""
+        return self.search_cache.stats()
 
-            # Location
-            self._cell(self.body_scroll, idx, 2, r.get("location") or "", bg=bg)
+    # ---------- Rendering ----------
+    def render_rows(self, use_cache: bool = True):
+        """Reload the first page for the current sort/search and rebind the table.
 
-            # Urgency
-            self._cell(self.body_scroll, idx, 3, r.get("urgency") or "", bg=bg)
+        Searches that were seen recently, or that narrow a recent complete result,
+        are answered from memory. Otherwise the page is fetched in the background;
+        a newer call (next search, sort click) supersedes an older one still in
+        flight, and pending "load more" requests are dropped.
+        """
+        self.app.tasks.cancel("manage.more")
+        self._next_cursor = None
+        query = self._page_query()
+        search = query["search"]
+        if self.store is not None and not search:
+            self._show_store(query)
+            return
+        if use_cache and search and getattr(self.app, "db", None):
+            rows = self.search_cache.lookup(self._cache_view(query), search)
+            if rows is not None:
+                # Refined rows keep the order of the broader query they came from
+                self.app.tasks.cancel("manage.page")
+                self._shown_query = query
+                self._last_fetched = None
+                self.table.set_loading(False)
+                self.table.set_rows(rows)
+                return
+
+        self.table.set_loading(True)
+        self.app.run_async(
+            self._fetch_page, query,
+            key="manage.page",
+            on_success=lambda page: self._on_first_page(page, query),
+            on_error=self._on_load_error,
+            on_done=lambda: self.table.set_loading(False),
+        )
 
-            # Status
-            self._cell(self.body_scroll, idx, 4, r.get("status") or "Pending", bg=bg)
+    def _on_first_page(self, page: Dict[str, Any], query: Dict[str, Any]):
+        self._shown_query = query
+        self._next_cursor = page["next_cursor"]
+        self._last_fetched = page["rows"][-1] if page["rows"] else None
+        if page.get("watermark") is not None:
+            watermark = page["watermark"]
+            if self.store is not None:
+                # The store may be behind the page; replay from the older of the two
+                watermark = min(watermark, self.store.watermark)
+            self.feed.watermark = watermark
+        self.table.set_rows(page["rows"])
+        self._remember_if_complete()
+
+    def _load_more(self):
+        """Append the next page when the table scrolls near the loaded end."""
+        if not self._next_cursor or self.app.tasks.is_running("manage.page"):
+            return
+        cursor, self._next_cursor = self._next_cursor, None
+        query = dict(self._shown_query, cursor=cursor)
+        self.app.run_async(
+            self._fetch_page, query,
+            key="manage.more",
+            on_success=self._on_next_page,
+            on_error=self._on_load_error,
+        )
 
-            # Edit button (per row, last column)
-            edit_btn = ctk.CTkButton(
-                self.body_scroll,
-                text="Edit",
-                width=80,
-                fg_color="#99D1FF",
-                hover_color="#1296FF",
-                text_color="#000000",
-                corner_radius=4,
-                command=lambda row=r: self._edit_row(row)
-            )
-            edit_btn.grid(row=idx, column=5, sticky="e", padx=self.CELL_PADX, pady=self.CELL_PADY)
-
-    def _cell(self, parent, row, col, text, bold=False, bg=None):
-        font = ("Helvetica", 15, "bold") if bold else ("Helvetica", 15)
-        lbl = ctk.CTkLabel(
-            parent,
-            text=text,
-            font=font,
-            text_color=self.COLORS["row_text"],
-            fg_color=bg,
-            anchor="w"
+    def _on_next_page(self, page: Dict[str, Any]):
+        self._next_cursor = page["next_cursor"]
+        if page["rows"]:
+            self._last_fetched = page["rows"][-1]
+        self.table.append_rows(page["rows"])
+        self._remember_if_complete()
+
+    def _remember_if_complete(self):
+        """Cache the search result once every page of it is loaded."""
+        query = self._shown_query
+        rows = self.table.rows
+        if query.get("search") and self._next_cursor is None and len(rows) <= self.SEARCH_CACHE_MAX_ROWS:
+            self.search_cache.store(self._cache_view(query), query["search"], rows)
+
+    # ---------- Live refresh ----------
+    def _apply_changes(self, changed: List[Dict[str, Any]], deleted: List[int]):
+        """Fold tips written by anyone since the last poll into the loaded rows."""
+        if self.store is not None:
+            self.store.apply_changes(changed, deleted)
+            self.store.watermark = self.feed.watermark
+        query = self._shown_query
+        if not query or self.app.tasks.is_running("manage.page"):
+            return  # the reload in flight replays these from its own watermark
+        if self.store is not None and not query.get("search"):
+            self._show_store(query, keep_position=True)
+            self.search_cache.clear()
+            return
+        plan = self.app.db.search_plan(query["search"]) if query.get("search") else None
+        sort = query["sort"]
+        sort_key = None if sort == "relevance" else (lambda row: row_sort_key(sort, row))
+        bound = None
+        if self._last_fetched is not None and (self._next_cursor or self.app.tasks.is_running("manage.more")):
+            bound = sort_key(self._last_fetched) if sort_key else self._last_fetched["id"]
+        rows = merge_changes(
+            self.table.rows, changed, deleted,
+            keep=lambda row: plan is None or row_matches_search(plan, row),
+            sort_key=sort_key, descending=query["descending"], bound=bound,
         )
-        lbl.grid(row=row, column=col, sticky="nsew", padx=self.CELL_PADX, pady=self.CELL_PADY)
+        self.table.set_rows(rows, keep_position=True)
+        # Cached search results predate this delta
+        self.search_cache.clear()
 
     # ---------- Actions ----------
     def _edit_row(self, row: Dict[str, Any]):
@@ -373,18 +569,37 @@ class ManageTipsFrame(ctk.CTkFrame):
             except Exception:
                 messagebox.showerror("Error", "Edit screen is not available.")
 
+    def on_show(self):
+        # Tips may have been edited elsewhere since the cached searches were run
+        self.search_cache.clear()
+        self.feed.start()
+
+    def on_hide(self):
+        self.feed.stop()
+
     def logout(self):
-        self.app.current_user = None
-        self.app.show_frame("LoginFrame")
+        self.app.logout()
 
     # ---------- Refresh handler ----------
     def _on_refresh_clicked(self):
         """
         Called when user clicks the small refresh control next to STATUS.
-        Refreshes rows from the database and re-renders the table.
+        Refreshes rows from the database and re-renders the table; a loaded
+        tip store is patched with the changes since it was read instead.
         """
         # Optionally disable the button briefly or show a busy cursor if desired.
         try:
+            self.search_cache.clear()
+            if self.store is not None:
+                self._refresh_store()
+                return
+            self._store_too_big = False  # the table may have shrunk; the next sort checks again
             self.render_rows()
         except Exception as ex:
-            messagebox.showerror("Error", f"Failed to refresh incidents: {ex}")
\ No newline at end of file
+            messagebox.showerror("Error", f"Failed to refresh incidents: {ex}")
+
+    def _on_feed_reset(self):
+        """The change feed fell too far behind to patch the rows: reload them from the database."""
+        self._drop_store()
+        self.search_cache.clear()
+        self.render_rows()
@@ -1,6 +1,7 @@
 import customtkinter as ctk
 from tkinter import messagebox
-from PIL import Image, ImageTk
+
+from ui.assets import load_image
 
 # Module: register_frame.py
 # Purpose: Provide a registration UI for new users.
@@ -16,10 +17,8 @@ class RegisterFrame(ctk.CTkFrame):
         # =========================================================
         # BACKGROUND IMAGE
         # =========================================================
-        bg_path = "assets/bg_login.png"   # <-- change this to your file
         try:
-            bg_img = Image.open(bg_path)
-            self.bg = ctk.CTkImage(light_image=bg_img, size=(1920, 1080))
+            self.bg = load_image("bg_login.png", (1920, 1080))
             bg_label = ctk.CTkLabel(self, image=self.bg, text="")
             bg_label.place(relx=0.5, rely=0.5, anchor="center")
         except Exception:
@@ -60,9 +59,9 @@ class RegisterFrame(ctk.CTkFrame):
         inputs_inner.place(relx=0.5, rely=0.5, anchor="center")  # centers the rows block
 
         # ICONS for the input rows
-        user_icon_img = ctk.CTkImage(light_image=Image.open("assets/user_icon.png"), size=(30, 30))
-        email_icon_img = ctk.CTkImage(light_image=Image.open("assets/email_icon.png"), size=(30, 30))
-        password_icon_img = ctk.CTkImage(light_image=Image.open("assets/password_icon.png"), size=(30, 30))
+        user_icon_img = load_image("user_icon.png", (30, 30))
+        email_icon_img = load_image("email_icon.png", (30, 30))
+        password_icon_img = load_image("password_icon.png", (30, 30))
 
         # Username input row
         box_user = ctk.CTkFrame(inputs_inner, fg_color="#565656", corner_radius=1)
@@ -227,7 +226,12 @@ class RegisterFrame(ctk.CTkFrame):
             messagebox.showerror("Error", "Enter a valid email address.")
             return
 
-        ok = self.app.db.create_user(u, e, p)
+        self.app.when_db_ready(lambda: self.app.run_async(
+            self.app.db.create_user, u, e, p, key="register",
+            on_success=self._on_registered,
+            on_error=lambda exc: messagebox.showerror("Error", f"Registration failed: {exc}")))
+
+    def _on_registered(self, ok: bool):
         if not ok:
             messagebox.showerror("Error", "Username already taken.")
             return
@@ -1,6 +1,7 @@
 import customtkinter as ctk
 from tkinter import messagebox
-from PIL import Image, ImageTk
+
+from ui.assets import load_image
 
 # Module: reporter_exit_frame.py
 # Purpose: Show a confirmation / exit screen after submission.
@@ -24,7 +25,7 @@ class ReporterExitFrame(ctk.CTkFrame):
         top_bar.pack_propagate(False)
 
         # Top bar logo image (small) and app title on the right
-        main_logo = ctk.CTkImage(light_image=Image.open("assets/main_logo.png"), size=(35, 35))
+        main_logo = load_image("main_logo.png", (35, 35))
 
         main_logo = ctk.CTkLabel(
             top_bar,
@@ -1,6 +1,7 @@
 import customtkinter as ctk
 from tkinter import messagebox
-from PIL import Image
+
+from ui.assets import load_image
 
 # Module: reporter_submit_tip_frame.py
 # Purpose: Provide the non-admin reporter submission form.
@@ -24,7 +25,7 @@ class SubmitTipFrame(ctk.CTkFrame):
         top_bar.pack(fill="x", side="top")
 
         # Top Bar Logo and Title - small image on right and textual title
-        main_logo = ctk.CTkImage(light_image=Image.open("assets/main_logo.png"), size=(35, 35))
+        main_logo = load_image("main_logo.png", (35, 35))
 
         main_logo = ctk.CTkLabel(
             top_bar,
@@ -307,6 +308,7 @@ class SubmitTipFrame(ctk.CTkFrame):
 
     def _save_tip(self, payload):
         # Attempt multiple common DB method names to save a tip, returning a standardized result.
+        # Called on a worker thread via app.run_async, so it must not touch widgets.
         db = getattr(self.app, "db", None)
         if not db:
             return False, None
@@ -349,11 +351,15 @@ class SubmitTipFrame(ctk.CTkFrame):
         messagebox.showinfo("Info", "You can close the window.")
 
     def submit_tip(self):
-        # High-level submit workflow: collect -> validate -> save -> notify user
+        # High-level submit workflow: collect -> validate -> save (background) -> notify user
         payload = self._collect_payload()
         if not self._validate(payload):
             return
-        ok, tip_id = self._save_tip(payload)
+        self.app.run_async(self._save_tip, payload, key="reporter.submit",
+                           on_success=self._on_submitted)
+
+    def _on_submitted(self, result):
+        ok, tip_id = result
         if not ok:
             messagebox.showerror("Error", "There was a problem submitting your tip.")
             return
@@ -0,0 +1,196 @@
+import queue
+import threading
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
+from tkinter import messagebox
+from typing import Any, Callable, Dict, List, Optional
+
+# Module: tasks.py
+# Purpose: Run blocking work (DB calls) off the Tk main loop.
+# Worker threads never touch widgets: they push finished results onto a queue
+# that the Tk thread drains with after(), so every callback runs on the UI
+# thread. Tasks submitted under the same key supersede older ones, whose
+# results are dropped.
+
+
+class Task:
+    """Handle for a submitted background call."""
+
+    __slots__ = ("key", "generation", "future", "cancelled", "on_success", "on_error", "on_done", "quiet")
+
+    def __init__(self, key, generation, on_success, on_error, on_done, quiet=False):
+        self.key = key
+        self.quiet = quiet
+        self.generation = generation
+        self.future: Optional[Future] = None
+        self.cancelled = False
+        self.on_success = on_success
+        self.on_error = on_error
+        self.on_done = on_done
+
+    def cancel(self):
+        """Drop this task's result; also skips the call if it has not started yet."""
+        self.cancelled = True
+        if self.future is not None:
+            self.future.cancel()
+
+
+class TaskRunner:
+    """Thread pool whose results are marshalled back to the Tk thread via after()."""
+
+    def __init__(self, root, max_workers: int = 4, poll_ms: int = 15):
+        self.root = root
+        self.poll_ms = poll_ms
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tattle-task")
+        self._results: "queue.SimpleQueue[tuple]" = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._latest: Dict[str, Task] = {}
+        self._pending = 0
+        # Pending tasks that count as "busy" (everything except quiet ones)
+        self._busy = 0
+        self._poll_id = None
+        self._busy_listeners: List[Callable[[bool], None]] = []
+        self._closed = False
+
+    # ---------- Submission ----------
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        *args,
+        key: Optional[str] = None,
+        on_success: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[BaseException], None]] = None,
+        on_done: Optional[Callable[[], None]] = None,
+        quiet: bool = False,
+        **kwargs,
+    ) -> Task:
+        """Run ``fn(*args, **kwargs)`` on a worker thread.
+
+        on_success(result) / on_error(exc) / on_done() are called on the Tk thread.
+        Without on_error the exception is shown in a messagebox. Submitting with a
+        ``key`` cancels the previous task under that key (e.g. an older search).
+        ``quiet`` tasks (periodic polls) don't switch on the busy cursor.
+        """
+        if self._closed:
+            raise RuntimeError("TaskRunner is shut down.")
+        with self._lock:
+            previous = self._latest.get(key) if key else None
+            generation = previous.generation + 1 if previous else 0
+            task = Task(key, generation, on_success, on_error, on_done, quiet)
+            if key:
+                self._latest[key] = task
+        if previous is not None:
+            previous.cancel()
+
+        def run():
+            if task.cancelled:
+                self._results.put((task, None, None))
+                return
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                self._results.put((task, False, e))
+            else:
+                self._results.put((task, True, result))
+
+        self._set_pending(+1, quiet)
+        task.future = self._executor.submit(run)
+        # A cancelled-before-start future never runs `run`; account for it here.
+        task.future.add_done_callback(lambda f: f.cancelled() and self._results.put((task, None, None)))
+        self._schedule_poll()
+        return task
+
+    def cancel(self, key: str):
+        """Cancel the latest task submitted under ``key``, if any."""
+        with self._lock:
+            task = self._latest.pop(key, None)
+        if task is not None:
+            task.cancel()
+
+    def is_running(self, key: str) -> bool:
+        with self._lock:
+            task = self._latest.get(key)
+        return bool(task and not task.cancelled and task.future and not task.future.done())
+
+    # ---------- Loading state ----------
+    @property
+    def busy(self) -> bool:
+        return self._busy > 0
+
+    def add_busy_listener(self, callback: Callable[[bool], None]):
+        """callback(True) when the first task starts, callback(False) when all have finished."""
+        self._busy_listeners.append(callback)
+
+    def _set_pending(self, delta: int, quiet: bool = False):
+        self._pending += delta
+        if quiet:
+            return
+        was_busy = self._busy > 0
+        self._busy += delta
+        if was_busy != (self._busy > 0):
+            for cb in self._busy_listeners:
+                try:
+                    cb(self._busy > 0)
+                except Exception as e:
+                    print("[Tasks] busy listener failed:", e)
+
+    # ---------- Delivery on the Tk thread ----------
+    def _schedule_poll(self):
+        if self._poll_id is None and not self._closed:
+            self._poll_id = self.root.after(self.poll_ms, self._drain)
+
+    def _drain(self):
+        self._poll_id = None
+        while True:
+            try:
+                task, ok, value = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._set_pending(-1, task.quiet)
+            self._deliver(task, ok, value)
+        if self._pending > 0:
+            self._schedule_poll()
+
+    def _deliver(self, task: Task, ok, value):
+        superseded = task.cancelled
+        if task.key:
+            with self._lock:
+                latest = self._latest.get(task.key)
+                superseded = superseded or latest is not task
+                if latest is task:
+                    del self._latest[task.key]
+        if superseded or ok is None:
+            return
+        try:
+            if ok:
+                if task.on_success:
+                    task.on_success(value)
+            elif task.on_error:
+                task.on_error(value)
+            else:
+                self._report_error(value)
+        except Exception as e:
+            print("[Tasks] callback failed:", e)
+            traceback.print_exc()
+        finally:
+            if task.on_done:
+                try:
+                    task.on_done()
+                except Exception as e:
+                    print("[Tasks] on_done failed:", e)
+
+    @staticmethod
+    def _report_error(exc: BaseException, title: str = "Error"):
+        messagebox.showerror(title, str(exc) or exc.__class__.__name__)
+
+    # ---------- Shutdown ----------
+    def shutdown(self):
+        """Stop accepting work; queued calls are dropped, running ones finish in the background."""
+        self._closed = True
+        if self._poll_id is not None:
+            try:
+                self.root.after_cancel(self._poll_id)
+            except Exception:
+                pass
+            self._poll_id = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
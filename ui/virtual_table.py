@@ -0,0 +1,268 @@
+import time
+import customtkinter as ctk
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+# Module: virtual_table.py
+# Purpose: A table that only builds enough row widgets to fill its viewport.
+# Scrolling moves a window over the data and rebinds the existing labels with
+# the rows that come into view, so the widget count stays constant whether the
+# model holds 100 or 100,000 tips.
+
+
+class VirtualTable(ctk.CTkFrame):
+    """Fixed pool of row widgets over an arbitrarily long list of row dicts."""
+
+    def __init__(
+        self,
+        parent,
+        columns: Sequence[Dict[str, Any]],
+        col_weights: Sequence[int],
+        colors: Dict[str, str],
+        row_height: int = 36,
+        cell_padx=(12, 8),
+        cell_pady=(4, 4),
+        action_text: str = "Edit",
+        on_action: Optional[Callable[[Dict[str, Any]], None]] = None,
+        on_need_more: Optional[Callable[[], None]] = None,
+        empty_text: str = "No incidents found.",
+        **kwargs,
+    ):
+        """
+        columns: one dict per data column with "key", optional "default" and "bold".
+        col_weights: grid weights for the data columns plus the trailing action column.
+        on_need_more: called when the viewport nears the end of the loaded rows.
+        """
+        super().__init__(parent, corner_radius=0, fg_color=colors["row_alt_bg"], **kwargs)
+        self.columns = list(columns)
+        self.col_weights = list(col_weights)
+        self.colors = colors
+        self.row_height = row_height
+        self.cell_padx = cell_padx
+        self.cell_pady = cell_pady
+        self.action_text = action_text
+        self.on_action = on_action
+        self.on_need_more = on_need_more
+
+        self._rows: Sequence[Dict[str, Any]] = []
+        self._offset = 0
+        # Each slot is a dict of its widgets plus the values currently bound to them.
+        self._slots: List[Dict[str, Any]] = []
+        self._loading = False
+        self.empty_text = empty_text
+        self.last_redraw_ms = 0.0
+
+        # Body (row slots) on the left, scrollbar on the right
+        self.body = ctk.CTkFrame(self, fg_color=colors["row_alt_bg"], corner_radius=0)
+        self.body.pack(side="left", fill="both", expand=True)
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+
+        action_col = len(self.columns)
+        for col, weight in enumerate(self.col_weights):
+            if col == action_col:
+                self.body.grid_columnconfigure(col, weight=weight, uniform="cols", minsize=100)
+            else:
+                self.body.grid_columnconfigure(col, weight=weight, uniform="cols")
+
+        self._empty_lbl = ctk.CTkLabel(
+            self.body,
+            text=empty_text,
+            font=("Helvetica", 16, "italic"),
+            text_color=colors["no_rows_text"],
+            fg_color="transparent"
+        )
+
+        self.body.bind("<Configure>", self._on_resize)
+        self._bind_wheel(self.body)
+
+    # ---------- Data ----------
+    def set_rows(self, rows: Sequence[Dict[str, Any]], keep_position: bool = False):
+        """Replace the model. Existing row widgets are rebound, never recreated.
+
+        Lists are copied; other sequences (e.g. a lazy TipStore view) are kept
+        as they are, so only the rows scrolled into view are ever built.
+        """
+        self._rows = list(rows) if isinstance(rows, list) or not isinstance(rows, Sequence) else rows
+        if not keep_position:
+            self._offset = 0
+        self._clamp_offset()
+        self._redraw()
+
+    def append_rows(self, rows: Sequence[Dict[str, Any]]):
+        """Extend the model (e.g. with the next fetched page) and refresh in place."""
+        if not isinstance(self._rows, list):
+            self._rows = list(self._rows)
+        self._rows.extend(rows)
+        self._redraw()
+
+    def set_loading(self, loading: bool):
+        """Show a loading placeholder while the model is empty and a fetch is in flight."""
+        if loading != self._loading:
+            self._loading = loading
+            if not self._rows:
+                self._redraw()
+
+    @property
+    def rows(self) -> Sequence[Dict[str, Any]]:
+        return self._rows
+
+    @property
+    def widget_count(self) -> int:
+        """Number of row widgets currently alive (constant w.r.t. model size)."""
+        return len(self._slots) * (len(self.columns) + 1)
+
+    # ---------- Slot management ----------
+    def _visible_capacity(self) -> int:
+        height = max(self.body.winfo_height(), self.row_height)
+        return height // self.row_height + 1
+
+    def _ensure_slots(self, count: int):
+        """Grow the slot pool to ``count`` rows; never shrinks (hidden slots are reused)."""
+        while len(self._slots) < count:
+            slot_index = len(self._slots)
+            cells = []
+            for col, spec in enumerate(self.columns):
+                font = ("Helvetica", 15, "bold") if spec.get("bold") else ("Helvetica", 15)
+                lbl = ctk.CTkLabel(
+                    self.body,
+                    text="",
+                    font=font,
+                    text_color=self.colors["row_text"],
+                    anchor="w"
+                )
+                self._bind_wheel(lbl)
+                cells.append(lbl)
+            btn = ctk.CTkButton(
+                self.body,
+                text=self.action_text,
+                width=80,
+                fg_color="#99D1FF",
+                hover_color="#1296FF",
+                text_color="#000000",
+                corner_radius=4,
+                command=lambda i=slot_index: self._on_action_clicked(i)
+            )
+            self._bind_wheel(btn)
+            self._slots.append({"cells": cells, "button": btn, "values": None, "bg": None, "shown": False})
+
+    def _show_slot(self, slot_index: int, slot: Dict[str, Any]):
+        if slot["shown"]:
+            return
+        for col, lbl in enumerate(slot["cells"]):
+            lbl.grid(row=slot_index, column=col, sticky="nsew", padx=self.cell_padx, pady=self.cell_pady)
+        slot["button"].grid(row=slot_index, column=len(self.columns), sticky="e",
+                            padx=self.cell_padx, pady=self.cell_pady)
+        slot["shown"] = True
+
+    def _hide_slot(self, slot: Dict[str, Any]):
+        if not slot["shown"]:
+            return
+        for lbl in slot["cells"]:
+            lbl.grid_remove()
+        slot["button"].grid_remove()
+        slot["shown"] = False
+        slot["values"] = None
+
+    # ---------- Rendering ----------
+    def _redraw(self):
+        start = time.perf_counter()
+        capacity = self._visible_capacity()
+        self._ensure_slots(capacity)
+
+        if not self._rows:
+            for slot in self._slots:
+                self._hide_slot(slot)
+            self._empty_lbl.configure(text="Loading..." if self._loading else self.empty_text)
+            self._empty_lbl.grid(row=0, column=0, columnspan=len(self.columns) + 1, padx=20, pady=40, sticky="w")
+        else:
+            self._empty_lbl.grid_remove()
+
+        for i, slot in enumerate(self._slots):
+            idx = self._offset + i
+            if i >= capacity or idx >= len(self._rows):
+                self._hide_slot(slot)
+                continue
+            row = self._rows[idx]
+            values = tuple(row.get(spec["key"]) or spec.get("default", "") for spec in self.columns)
+            bg = self.colors["row_bg"] if idx % 2 == 0 else self.colors["row_alt_bg"]
+            # Only touch widgets whose text or stripe colour actually changed
+            old_values = slot["values"] or (None,) * len(values)
+            for lbl, new, old in zip(slot["cells"], values, old_values):
+                if new != old:
+                    lbl.configure(text=str(new))
+            if bg != slot["bg"]:
+                for lbl in slot["cells"]:
+                    lbl.configure(fg_color=bg)
+                slot["bg"] = bg
+            slot["values"] = values
+            self._show_slot(i, slot)
+
+        self._update_scrollbar(capacity)
+        self.last_redraw_ms = (time.perf_counter() - start) * 1000.0
+
+        # Ask for the next page once the viewport gets close to the loaded end
+        if self.on_need_more and self._rows and self._offset + 2 * capacity >= len(self._rows):
+            self.on_need_more()
+
+    def _update_scrollbar(self, capacity: int):
+        total = len(self._rows)
+        if total <= 0:
+            self.scrollbar.set(0.0, 1.0)
+            return
+        first = self._offset / total
+        last = min(1.0, (self._offset + capacity) / total)
+        self.scrollbar.set(first, last)
+
+    # ---------- Scrolling ----------
+    def _max_offset(self) -> int:
+        return max(0, len(self._rows) - self._visible_capacity() + 1)
+
+    def _clamp_offset(self):
+        self._offset = max(0, min(self._offset, self._max_offset()))
+
+    def scroll_to(self, offset: int):
+        new = max(0, min(int(offset), self._max_offset()))
+        if new != self._offset:
+            self._offset = new
+            self._redraw()
+
+    def scroll_by(self, rows: int):
+        self.scroll_to(self._offset + rows)
+
+    def _on_scrollbar(self, *args):
+        # Tk scrollbar protocol: ("moveto", fraction) or ("scroll", n, "units"|"pages")
+        if not args:
+            return
+        if args[0] == "moveto":
+            self.scroll_to(float(args[1]) * len(self._rows))
+        elif args[0] == "scroll":
+            step = int(args[1])
+            if len(args) > 2 and args[2] == "pages":
+                step *= max(1, self._visible_capacity() - 1)
+            self.scroll_by(step)
+
+    def _on_wheel(self, event):
+        if getattr(event, "num", None) == 4:
+            self.scroll_by(-3)
+        elif getattr(event, "num", None) == 5:
+            self.scroll_by(3)
+        elif event.delta:
+            # Windows reports multiples of 120, macOS small deltas
+            step = -event.delta // 120 if abs(event.delta) >= 120 else -event.delta
+            self.scroll_by(step * 3)
+        return "break"
+
+    def _bind_wheel(self, widget):
+        widget.bind("<MouseWheel>", self._on_wheel)
+        widget.bind("<Button-4>", self._on_wheel)
+        widget.bind("<Button-5>", self._on_wheel)
+
+    def _on_resize(self, event=None):
+        self._clamp_offset()
+        self._redraw()
+
+    # ---------- Actions ----------
+    def _on_action_clicked(self, slot_index: int):
+        idx = self._offset + slot_index
+        if self.on_action and 0 <= idx < len(self._rows):
+            self.on_action(self._rows[idx])